@@ -27,11 +27,10 @@ import logging
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Final
 
-import lib_log_rich.runtime
 from lib_cli_exit_tools import cli_session
 
 from . import __init__conf__, cli
-from .logging_setup import init_logging
+from .logging_setup import shutdown_logging
 
 if TYPE_CHECKING:
     from contextlib import AbstractContextManager
@@ -110,10 +109,10 @@ def _module_main() -> int:
         int: Exit code reported by the CLI run.
 
     Side Effects
-        Initializes and shuts down the lib_log_rich runtime.
+        Shuts down the lib_log_rich runtime; the root command initializes it
+        only when a subcommand actually runs.
     """
 
-    init_logging()
     try:
         with _open_cli_session() as run:
             return run(
@@ -121,7 +120,7 @@ def _module_main() -> int:
                 prog_name=_command_name(),
             )
     finally:
-        lib_log_rich.runtime.shutdown()
+        shutdown_logging()
 
 
 if __name__ == "__main__":
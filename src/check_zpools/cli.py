@@ -18,7 +18,8 @@ targets register the console script defined in :mod:`check_zpools.__init__conf__
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Final, cast
 
 import lib_cli_exit_tools
 import lib_log_rich.runtime
@@ -27,19 +28,7 @@ from click.core import ParameterSource
 
 from . import __init__conf__
 from .behaviors import emit_greeting, noop_main, raise_intentional_failure
-from .cli_commands.commands import (
-    alias_create_command,
-    alias_delete_command,
-    check_command,
-    config_deploy_command,
-    config_show_command,
-    daemon_command,
-    send_email_command,
-    send_notification_command,
-    service_install_command,
-    service_status_command,
-    service_uninstall_command,
-)
+from .cli_commands import commands
 from .cli_traceback import (
     TRACEBACK_SUMMARY_LIMIT,
     TRACEBACK_VERBOSE_LIMIT,
@@ -47,15 +36,19 @@ from .cli_traceback import (
     restore_traceback_state,
     snapshot_traceback_state,
 )
-from .logging_setup import init_logging
+from .config_show import CONFIG_OUTPUT_FORMATS, FORMAT_HUMAN
+from .logging_setup import init_logging, shutdown_logging
 from .typed_click import option, version_option
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Mapping, Sequence
 
 #: Shared Click context flags so help output stays consistent across commands.
 CLICK_CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"]}
 
+#: Console script name announced in help, version, and error output.
+_PROG_NAME: Final[str] = __init__conf__.shell_command
+
 logger = logging.getLogger(__name__)
 
 
@@ -66,8 +59,8 @@ logger = logging.getLogger(__name__)
 )
 @version_option(
     version=__init__conf__.version,
-    prog_name=__init__conf__.shell_command,
-    message=f"{__init__conf__.shell_command} version {__init__conf__.version}",
+    prog_name=_PROG_NAME,
+    message=f"{_PROG_NAME} version {__init__conf__.version}",
 )
 @option(
     "--traceback/--no-traceback",
@@ -78,15 +71,21 @@ logger = logging.getLogger(__name__)
 @click.pass_context
 def cli(ctx: click.Context, *, traceback: bool) -> None:
     """Root command storing global flags and syncing shared traceback state."""
-    init_logging()
-
-    ctx.ensure_object(dict)
-    ctx.obj["traceback"] = traceback
+    # The root group owns ctx.obj; build it in one go instead of ensure_object().
+    # The parameter source is resolved once here; subcommands read the cached flag.
+    ctx.obj = {
+        "traceback": traceback,
+        "traceback_explicit": ctx.get_parameter_source("traceback") not in (ParameterSource.DEFAULT, None),
+    }
     apply_traceback_preferences(enabled=traceback)
 
+    # Bare invocations only print help, so logging is set up only when real work follows.
+    # --help/--version are eager options and exit before this callback runs at all.
+    if ctx.invoked_subcommand is not None or ctx.obj["traceback_explicit"]:
+        init_logging()
+
     if ctx.invoked_subcommand is None:
-        source = ctx.get_parameter_source("traceback")
-        if source not in (ParameterSource.DEFAULT, None):
+        if ctx.obj["traceback_explicit"]:
             noop_main()
         else:
             click.echo(ctx.get_help())
@@ -120,8 +119,8 @@ def cli_fail() -> None:
 @option(
     "--format",
     "output_format",
-    type=click.Choice(["human", "json"], case_sensitive=False),
-    default="human",
+    type=click.Choice(CONFIG_OUTPUT_FORMATS, case_sensitive=False),
+    default=FORMAT_HUMAN,
     help="Output format (human-readable or JSON)",
 )
 @option(
@@ -132,7 +131,7 @@ def cli_fail() -> None:
 )
 def cli_config(*, output_format: str, section: str | None) -> None:
     """Display the current merged configuration from all sources."""
-    config_show_command(output_format=output_format, section=section)
+    commands.config_show_command(output_format=output_format, section=section)
 
 
 @cli.command("config-deploy", context_settings=CLICK_CONTEXT_SETTINGS)
@@ -152,7 +151,7 @@ def cli_config(*, output_format: str, section: str | None) -> None:
 )
 def cli_config_deploy(*, targets: tuple[str, ...], force: bool) -> None:
     """Deploy default configuration to system or user directories."""
-    config_deploy_command(targets=targets, force=force)
+    commands.config_deploy_command(targets=targets, force=force)
 
 
 @cli.command("send-email", context_settings=CLICK_CONTEXT_SETTINGS)
@@ -201,7 +200,7 @@ def cli_send_email(
     attachments: tuple[str, ...],
 ) -> None:
     """Send an email using configured SMTP settings."""
-    send_email_command(
+    commands.send_email_command(
         recipients,
         subject=subject,
         body=body,
@@ -235,7 +234,7 @@ def cli_send_notification(
     message: str,
 ) -> None:
     """Send a simple plain-text notification email."""
-    send_notification_command(recipients, subject, message)
+    commands.send_notification_command(recipients, subject, message)
 
 
 @cli.command("service-install", context_settings=CLICK_CONTEXT_SETTINGS)
@@ -259,7 +258,7 @@ def cli_send_notification(
 )
 def cli_install_service(*, no_enable: bool, no_start: bool, uvx_version: str | None) -> None:
     """Install check_zpools as a systemd service (requires root)."""
-    service_install_command(no_enable=no_enable, no_start=no_start, uvx_version=uvx_version)
+    commands.service_install_command(no_enable=no_enable, no_start=no_start, uvx_version=uvx_version)
 
 
 @cli.command("service-uninstall", context_settings=CLICK_CONTEXT_SETTINGS)
@@ -277,13 +276,13 @@ def cli_install_service(*, no_enable: bool, no_start: bool, uvx_version: str | N
 )
 def cli_uninstall_service(*, no_stop: bool, no_disable: bool) -> None:
     """Uninstall check_zpools systemd service (requires root)."""
-    service_uninstall_command(no_stop=no_stop, no_disable=no_disable)
+    commands.service_uninstall_command(no_stop=no_stop, no_disable=no_disable)
 
 
 @cli.command("service-status", context_settings=CLICK_CONTEXT_SETTINGS)
 def cli_service_status() -> None:
     """Show status of check_zpools systemd service."""
-    service_status_command()
+    commands.service_status_command()
 
 
 @cli.command("alias-create", context_settings=CLICK_CONTEXT_SETTINGS)
@@ -301,7 +300,7 @@ def cli_service_status() -> None:
 )
 def cli_alias_create(*, user: str | None, all_users: bool) -> None:
     """Create bash alias for check_zpools CLI (requires root)."""
-    alias_create_command(user=user, all_users=all_users)
+    commands.alias_create_command(user=user, all_users=all_users)
 
 
 @cli.command("alias-delete", context_settings=CLICK_CONTEXT_SETTINGS)
@@ -319,7 +318,7 @@ def cli_alias_create(*, user: str | None, all_users: bool) -> None:
 )
 def cli_alias_delete(*, user: str | None, all_users: bool) -> None:
     """Remove bash alias for check_zpools CLI (requires root)."""
-    alias_delete_command(user=user, all_users=all_users)
+    commands.alias_delete_command(user=user, all_users=all_users)
 
 
 @cli.command("check", context_settings=CLICK_CONTEXT_SETTINGS)
@@ -330,9 +329,15 @@ def cli_alias_delete(*, user: str | None, all_users: bool) -> None:
     default="text",
     help="Output format for results",
 )
-def cli_check(*, output_format: str) -> None:
+@option(
+    "--pretty",
+    is_flag=True,
+    default=False,
+    help="Indent JSON output for human readers (default: compact)",
+)
+def cli_check(*, output_format: str, pretty: bool) -> None:
     """Perform one-shot check of all ZFS pools."""
-    check_command(output_format=output_format)
+    commands.check_command(output_format=output_format, pretty=pretty)
 
 
 @cli.command("daemon", context_settings=CLICK_CONTEXT_SETTINGS)
@@ -344,7 +349,54 @@ def cli_check(*, output_format: str) -> None:
 )
 def cli_daemon(*, foreground: bool) -> None:
     """Start daemon mode for continuous ZFS pool monitoring."""
-    daemon_command(foreground=foreground)
+    commands.daemon_command(foreground=foreground)
+
+
+#: Argument-less commands that :func:`dispatch_internal` runs without Click parsing.
+_DIRECT_HANDLERS: Final[Mapping[str, Callable[[], None]]] = MappingProxyType(
+    {
+        "info": cast("Callable[[], None]", cli_info.callback),
+        "hello": cast("Callable[[], None]", cli_hello.callback),
+        "fail": cast("Callable[[], None]", cli_fail.callback),
+    }
+)
+
+
+def dispatch_internal(name: str) -> int:
+    """Run an argument-less command in-process, bypassing argv parsing.
+
+    Why
+        In-process callers that already know which command they want (test
+        harnesses, embedding code) do not need Click to rebuild a context and
+        walk the group registry on every call.
+
+    Parameters
+    ----------
+    name:
+        Command name: ``"info"``, ``"hello"``, or ``"fail"``.
+
+    Returns
+    -------
+    int
+        ``0`` on success, or the exit code carried by a ``SystemExit``.
+
+    Raises
+    ------
+    KeyError:
+        If ``name`` is not a directly dispatchable command.
+
+    Notes
+    -----
+    Unlike :func:`main`, other exceptions propagate unchanged and traceback
+    preferences are left untouched.
+    """
+    handler = _DIRECT_HANDLERS[name]
+    init_logging()
+    try:
+        handler()
+    except SystemExit as exc:
+        return lib_cli_exit_tools.get_system_exit_code(exc)
+    return 0
 
 
 def main(
@@ -355,14 +407,13 @@ def main(
     verbose_limit: int = TRACEBACK_VERBOSE_LIMIT,
 ) -> int:
     """Execute the CLI with deliberate error handling and return the exit code."""
-    init_logging()
     previous_state = snapshot_traceback_state()
     try:
         return _run_cli_via_exit_tools(argv, summary_limit=summary_limit, verbose_limit=verbose_limit)
     finally:
         if restore_traceback:
             restore_traceback_state(previous_state)
-        lib_log_rich.runtime.shutdown()
+        shutdown_logging()
 
 
 def _run_cli_via_exit_tools(
@@ -375,12 +426,13 @@ def _run_cli_via_exit_tools(
     try:
         return lib_cli_exit_tools.run_cli(
             cli,
-            argv=list(argv) if argv is not None else None,
-            prog_name=__init__conf__.shell_command,
+            # Neither Click nor lib_cli_exit_tools mutates argv; only copy non-lists.
+            argv=argv if argv is None or isinstance(argv, list) else list(argv),
+            prog_name=_PROG_NAME,
         )
     except BaseException as exc:
-        tracebacks_enabled = bool(getattr(lib_cli_exit_tools.config, "traceback", False))
-        apply_traceback_preferences(enabled=tracebacks_enabled)
+        # The flags were synchronised by the root command; only read them here.
+        tracebacks_enabled = bool(lib_cli_exit_tools.config.traceback)
         length_limit = verbose_limit if tracebacks_enabled else summary_limit
         lib_cli_exit_tools.print_exception_message(
             trace_back=tracebacks_enabled,
@@ -2,21 +2,65 @@
 
 Each command module contains the full implementation logic,
 leaving cli.py as a thin orchestration layer.
+
+Command functions are resolved lazily (PEP 562): a command module and its
+dependencies are imported the first time its function is looked up, so a
+CLI invocation only pays for the command it runs.
 """
 
 from __future__ import annotations
 
-from .alias_create import alias_create_command
-from .alias_delete import alias_delete_command
-from .check import check_command
-from .config_deploy import config_deploy_command
-from .config_show import config_show_command
-from .daemon import daemon_command
-from .send_email import send_email_command
-from .send_notification import send_notification_command
-from .service_install import service_install_command
-from .service_status import service_status_command
-from .service_uninstall import service_uninstall_command
+from importlib import import_module
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from .alias_create import alias_create_command
+    from .alias_delete import alias_delete_command
+    from .check import check_command
+    from .config_deploy import config_deploy_command
+    from .config_show import config_show_command
+    from .daemon import daemon_command
+    from .send_email import send_email_command
+    from .send_notification import send_notification_command
+    from .service_install import service_install_command
+    from .service_status import service_status_command
+    from .service_uninstall import service_uninstall_command
+
+#: Command function name -> submodule that defines it.
+_COMMAND_MODULES: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "alias_create_command": ".alias_create",
+        "alias_delete_command": ".alias_delete",
+        "check_command": ".check",
+        "config_deploy_command": ".config_deploy",
+        "config_show_command": ".config_show",
+        "daemon_command": ".daemon",
+        "send_email_command": ".send_email",
+        "send_notification_command": ".send_notification",
+        "service_install_command": ".service_install",
+        "service_status_command": ".service_status",
+        "service_uninstall_command": ".service_uninstall",
+    }
+)
+
+
+def __getattr__(name: str) -> object:
+    """Import the submodule defining command ``name`` on first access."""
+    module_name = _COMMAND_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    command = getattr(import_module(module_name, __name__), name)
+    globals()[name] = command
+    return command
+
+
+def __dir__() -> list[str]:
+    """List the lazily provided command functions alongside module globals."""
+    return sorted({*globals(), *__all__})
+
 
 __all__ = [
     "alias_create_command",
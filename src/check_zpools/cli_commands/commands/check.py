@@ -3,19 +3,19 @@
 from __future__ import annotations
 
 import logging
+import sys
 
 import lib_log_rich.runtime
-import rich_click as click
 
 from ...behaviors import check_pools_once
 from ...cli_errors import handle_generic_error, handle_zfs_not_available
-from ...formatters import display_check_result_text, format_check_result_json, get_exit_code_for_severity
+from ...formatters import display_check_result_text, dump_check_result_json, get_exit_code_for_severity
 from ...zfs_client import ZFSNotAvailableError
 
 logger = logging.getLogger(__name__)
 
 
-def check_command(*, output_format: str) -> None:
+def check_command(*, output_format: str, pretty: bool = False) -> None:
     """Execute check command logic."""
     with lib_log_rich.runtime.bind(job_id="cli-check", extra={"command": "check", "format": output_format}):
         try:
@@ -23,9 +23,8 @@ def check_command(*, output_format: str) -> None:
 
             # Format and display output
             if output_format == "json":
-                # JSON output - use click.echo for plain text
-                output = format_check_result_json(result)
-                click.echo(output)
+                # JSON output - written straight to stdout, no click.echo concatenation
+                dump_check_result_json(result, sys.stdout, pretty=pretty)
             else:
                 # Text output with Rich - print directly to avoid ANSI code issues
                 display_check_result_text(result)
@@ -3,14 +3,26 @@
 from __future__ import annotations
 
 import logging
+from typing import Final
 
 import lib_log_rich.runtime
 import rich_click as click
 
+from ...cli_errors import ErrorRule, handle_command_error
 from ...config_deploy import deploy_configuration
 
 logger = logging.getLogger(__name__)
 
+_DEPLOY_ERROR_RULES: Final[tuple[ErrorRule, ...]] = (
+    ErrorRule(
+        PermissionError,
+        "Permission denied when deploying configuration",
+        "\nError: Permission denied. {exc}",
+        hint="Hint: System-wide deployment (--target app/host) may require sudo.",
+    ),
+    ErrorRule(Exception, "Failed to deploy configuration", "\nError: Failed to deploy configuration: {exc}"),
+)
+
 
 def config_deploy_command(*, targets: tuple[str, ...], force: bool) -> None:
     """Execute config-deploy command logic."""
@@ -31,15 +43,5 @@ def config_deploy_command(*, targets: tuple[str, ...], force: bool) -> None:
                 click.echo("\nNo files were created (all target files already exist).")
                 click.echo("Use --force to overwrite existing configuration files.")
 
-        except PermissionError as exc:
-            logger.error("Permission denied when deploying configuration", extra={"error": str(exc)})
-            click.echo(f"\nError: Permission denied. {exc}", err=True)
-            click.echo("Hint: System-wide deployment (--target app/host) may require sudo.", err=True)
-            raise SystemExit(1) from exc
         except Exception as exc:
-            logger.error(
-                "Failed to deploy configuration",
-                extra={"error": str(exc), "error_type": type(exc).__name__},
-            )
-            click.echo(f"\nError: Failed to deploy configuration: {exc}", err=True)
-            raise SystemExit(1) from exc
+            handle_command_error(exc, _DEPLOY_ERROR_RULES)
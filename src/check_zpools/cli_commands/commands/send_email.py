@@ -3,35 +3,18 @@
 from __future__ import annotations
 
 import logging
-from pathlib import Path
 
 import lib_log_rich.runtime
 import rich_click as click
 
-from ...cli_email_handlers import handle_send_email_error, validate_smtp_configuration
+from ...cli_email_handlers import echo_error, handle_send_email_error, load_and_validate_email_config
 from ...config import get_config
-from ...mail import load_email_config_from_dict, send_email
+from ...mail import send_email
 
 logger = logging.getLogger(__name__)
 
 
-def _prepare_attachments(attachments: tuple[str, ...]) -> list[Path] | None:
-    """Convert attachment strings to Path objects.
-
-    Parameters
-    ----------
-    attachments:
-        Tuple of attachment file paths.
-
-    Returns
-    -------
-    list[Path] | None:
-        List of Path objects, or None if no attachments.
-    """
-    return [Path(p) for p in attachments] if attachments else None
-
-
-def _log_send_email_request(recipients: tuple[str, ...], subject: str, body_html: str, attachments: tuple[str, ...]) -> None:
+def _log_send_email_request(recipients: list[str], subject: str, body_html: str, attachments: tuple[str, ...]) -> None:
     """Log email send request details.
 
     Parameters
@@ -48,7 +31,7 @@ def _log_send_email_request(recipients: tuple[str, ...], subject: str, body_html
     logger.info(
         "Sending email",
         extra={
-            "recipients": list(recipients),
+            "recipients": recipients,
             "subject": subject,
             "has_html": bool(body_html),
             "attachment_count": len(attachments) if attachments else 0,
@@ -56,7 +39,7 @@ def _log_send_email_request(recipients: tuple[str, ...], subject: str, body_html
     )
 
 
-def _handle_send_result(*, result: bool, recipients: tuple[str, ...]) -> None:
+def _handle_send_result(*, result: bool, recipients: list[str]) -> None:
     """Handle email send result.
 
     Parameters
@@ -72,10 +55,10 @@ def _handle_send_result(*, result: bool, recipients: tuple[str, ...]) -> None:
     """
     if result:
         click.echo("\nEmail sent successfully!")
-        logger.info("Email sent via CLI", extra={"recipients": list(recipients)})
+        logger.info("Email sent via CLI", extra={"recipients": recipients})
     else:
-        logger.error("Email sending failed via CLI", extra={"recipients": list(recipients)})
-        click.echo("\nEmail sending failed.", err=True)
+        logger.error("Email sending failed via CLI", extra={"recipients": recipients})
+        echo_error("\nEmail sending failed.")
         raise SystemExit(1)
 
 
@@ -89,33 +72,30 @@ def send_email_command(
     attachments: tuple[str, ...],
 ) -> None:
     """Execute send-email command logic."""
+    recipient_list = list(recipients)
     with lib_log_rich.runtime.bind(
         job_id="cli-send-email",
-        extra={"command": "send-email", "recipients": list(recipients), "subject": subject},
+        extra={"command": "send-email", "recipients": recipient_list, "subject": subject},
     ):
         try:
             # Load and validate email configuration
-            config = get_config()
-            email_config = load_email_config_from_dict(config.as_dict())
-            validate_smtp_configuration(email_config)
+            email_config = load_and_validate_email_config(get_config())
 
-            # Prepare and send email
-            attachment_paths = _prepare_attachments(attachments)
-            _log_send_email_request(recipients, subject, body_html, attachments)
+            # Send email; the mail layer accepts the attachment strings as-is
+            _log_send_email_request(recipient_list, subject, body_html, attachments)
 
             result = send_email(
                 config=email_config,
-                recipients=list(recipients),
+                recipients=recipient_list,
                 subject=subject,
                 body=body,
                 body_html=body_html,
                 from_address=from_address,
-                attachments=attachment_paths,
+                attachments=attachments or None,
             )
 
-            _handle_send_result(result=result, recipients=recipients)
+            _handle_send_result(result=result, recipients=recipient_list)
 
-        except (ValueError, FileNotFoundError, RuntimeError) as exc:
-            handle_send_email_error(exc, type(exc).__name__)
         except Exception as exc:
-            handle_send_email_error(exc, "Exception")
+            # Unlisted type names fall through to the "unexpected error" message
+            handle_send_email_error(exc, type(exc).__name__)
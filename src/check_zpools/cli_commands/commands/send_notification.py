@@ -3,18 +3,26 @@
 from __future__ import annotations
 
 import logging
+from typing import Final
 
 import lib_log_rich.runtime
 import rich_click as click
 
-from ...cli_email_handlers import validate_smtp_configuration
+from ...cli_email_handlers import echo_error, load_and_validate_email_config
+from ...cli_errors import ErrorRule, handle_command_error
 from ...config import get_config
-from ...mail import load_email_config_from_dict, send_notification
+from ...mail import send_notification
 
 logger = logging.getLogger(__name__)
 
+_NOTIFICATION_ERROR_RULES: Final[tuple[ErrorRule, ...]] = (
+    ErrorRule(ValueError, "Invalid notification parameters", "\nError: Invalid notification parameters - {exc}"),
+    ErrorRule(RuntimeError, "SMTP delivery failed", "\nError: Failed to send notification - {exc}"),
+    ErrorRule(Exception, "Unexpected error sending notification", "\nError: Unexpected error - {exc}", with_traceback=True),
+)
 
-def _handle_notification_result(*, result: bool, recipients: tuple[str, ...]) -> None:
+
+def _handle_notification_result(*, result: bool, recipients: list[str]) -> None:
     """Handle notification send result.
 
     Parameters
@@ -30,71 +38,42 @@ def _handle_notification_result(*, result: bool, recipients: tuple[str, ...]) ->
     """
     if result:
         click.echo("\nNotification sent successfully!")
-        logger.info("Notification sent via CLI", extra={"recipients": list(recipients)})
+        logger.info("Notification sent via CLI", extra={"recipients": recipients})
     else:
-        logger.error("Notification sending failed via CLI", extra={"recipients": list(recipients)})
-        click.echo("\nNotification sending failed.", err=True)
+        logger.error("Notification sending failed via CLI", extra={"recipients": recipients})
+        echo_error("\nNotification sending failed.")
         raise SystemExit(1)
 
 
-def _handle_notification_error(exc: Exception) -> None:
-    """Handle notification errors.
-
-    Parameters
-    ----------
-    exc:
-        Exception that occurred.
-
-    Raises
-    ------
-    SystemExit: Always exits with code 1.
-    """
-    if isinstance(exc, ValueError):
-        logger.error("Invalid notification parameters", extra={"error": str(exc)})
-        click.echo(f"\nError: Invalid notification parameters - {exc}", err=True)
-    elif isinstance(exc, RuntimeError):
-        logger.error("SMTP delivery failed", extra={"error": str(exc)})
-        click.echo(f"\nError: Failed to send notification - {exc}", err=True)
-    else:
-        logger.error(
-            "Unexpected error sending notification",
-            extra={"error": str(exc), "error_type": type(exc).__name__},
-            exc_info=True,
-        )
-        click.echo(f"\nError: Unexpected error - {exc}", err=True)
-    raise SystemExit(1)
-
-
 def send_notification_command(
     recipients: tuple[str, ...],
     subject: str,
     message: str,
 ) -> None:
     """Execute send-notification command logic."""
+    recipient_list = list(recipients)
     with lib_log_rich.runtime.bind(
         job_id="cli-send-notification",
-        extra={"command": "send-notification", "recipients": list(recipients), "subject": subject},
+        extra={"command": "send-notification", "recipients": recipient_list, "subject": subject},
     ):
         try:
             # Load and validate email configuration
-            config = get_config()
-            email_config = load_email_config_from_dict(config.as_dict())
-            validate_smtp_configuration(email_config)
+            email_config = load_and_validate_email_config(get_config())
 
             logger.info(
                 "Sending notification",
-                extra={"recipients": list(recipients), "subject": subject},
+                extra={"recipients": recipient_list, "subject": subject},
             )
 
             # Send notification
             result = send_notification(
                 config=email_config,
-                recipients=list(recipients),
+                recipients=recipient_list,
                 subject=subject,
                 message=message,
             )
 
-            _handle_notification_result(result=result, recipients=recipients)
+            _handle_notification_result(result=result, recipients=recipient_list)
 
         except Exception as exc:
-            _handle_notification_error(exc)
+            handle_command_error(exc, _NOTIFICATION_ERROR_RULES)
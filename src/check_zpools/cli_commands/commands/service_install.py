@@ -3,14 +3,21 @@
 from __future__ import annotations
 
 import logging
+from typing import Final
 
 import lib_log_rich.runtime
-import rich_click as click
 
+from ...cli_errors import ErrorRule, handle_command_error
 from ...service_install import install_service
 
 logger = logging.getLogger(__name__)
 
+_INSTALL_ERROR_RULES: Final[tuple[ErrorRule, ...]] = (
+    ErrorRule(PermissionError, "Permission denied during service installation", "\n{exc}"),
+    ErrorRule(FileNotFoundError, "Required file not found", "\n{exc}"),
+    ErrorRule(Exception, "Service installation failed", "\nError: Service installation failed - {exc}", with_traceback=True),
+)
+
 
 def service_install_command(*, no_enable: bool, no_start: bool, uvx_version: str | None) -> None:
     """Execute service-install command logic."""
@@ -24,18 +31,5 @@ def service_install_command(*, no_enable: bool, no_start: bool, uvx_version: str
                 extra={"enable": not no_enable, "start": not no_start, "uvx_version": uvx_version},
             )
             install_service(enable=not no_enable, start=not no_start, uvx_version=uvx_version)
-        except PermissionError as exc:
-            logger.error("Permission denied during service installation", extra={"error": str(exc)})
-            click.echo(f"\n{exc}", err=True)
-            raise SystemExit(1) from exc
-        except FileNotFoundError as exc:
-            logger.error("Required file not found", extra={"error": str(exc)})
-            click.echo(f"\n{exc}", err=True)
-            raise SystemExit(1) from exc
         except Exception as exc:
-            logger.exception(
-                "Service installation failed",
-                extra={"error": str(exc), "error_type": type(exc).__name__},
-            )
-            click.echo(f"\nError: Service installation failed - {exc}", err=True)
-            raise SystemExit(1) from exc
+            handle_command_error(exc, _INSTALL_ERROR_RULES)
@@ -13,6 +13,8 @@ Why
 
 Contents
 --------
+* :func:`load_and_validate_email_config` - parse and validate email settings once per config
+* :func:`echo_error` - write a plain error line to stderr
 * :func:`validate_smtp_configuration` - validate SMTP hosts are configured
 * :func:`handle_send_email_error` - handle errors during email sending operations
 """
@@ -20,15 +22,96 @@ Contents
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+import sys
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Final
 
-import rich_click as click
+from .mail import load_email_config_from_dict
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from lib_layered_config import Config
+
     from .mail import EmailConfig
 
 logger = logging.getLogger(__name__)
 
+# (log message, stderr template) per exception type name; unknown types are
+# logged with their traceback.
+_SEND_EMAIL_ERROR_MESSAGES: Final[Mapping[str, tuple[str, str]]] = MappingProxyType(
+    {
+        "ValueError": ("Invalid email parameters", "\nError: Invalid email parameters - {}"),
+        "FileNotFoundError": ("Attachment file not found", "\nError: Attachment file not found - {}"),
+        "RuntimeError": ("SMTP delivery failed", "\nError: Failed to send email - {}"),
+    }
+)
+_UNEXPECTED_SEND_EMAIL_ERROR: Final = ("Unexpected error sending email", "\nError: Unexpected error - {}")
+
+_MISSING_SMTP_HOSTS_MESSAGE: Final = (
+    "\nError: No SMTP hosts configured. Please configure email.smtp_hosts in your config file.\nSee: check_zpools config-deploy --target user"
+)
+
+# Last (config, parsed email settings) pair; ``get_config`` is cached, so the
+# same Config instance comes back until the cache is cleared.
+_email_config_cache: tuple[Config, EmailConfig] | None = None
+
+
+def echo_error(message: str) -> None:
+    """Write a plain error line to stderr.
+
+    Why
+        Email error output is unstyled text, so the stream lookup, encoding
+        probing and ANSI handling of ``click.echo`` buy nothing here.
+        ``sys.stderr`` is resolved per call so Click's test runner and
+        pytest's capture still see the output.
+
+    Parameters
+    ----------
+    message:
+        Text to write; a trailing newline is appended.
+    """
+    stream = sys.stderr
+    stream.write(message + "\n")
+    stream.flush()
+
+
+def load_and_validate_email_config(config: Config) -> EmailConfig:
+    """Return validated email settings for ``config``, parsing them only once.
+
+    Why
+        send-email and send-notification both turned the layered config into
+        an :class:`EmailConfig` and checked its SMTP hosts on every call.
+        The parsed result is remembered for the Config instance it came from,
+        so repeated sends against the same configuration skip the conversion.
+
+    Parameters
+    ----------
+    config:
+        Layered configuration, typically from :func:`check_zpools.config.get_config`.
+
+    Returns
+    -------
+    EmailConfig:
+        Email settings with at least one SMTP host configured.
+
+    Raises
+    ------
+    SystemExit:
+        If SMTP hosts not configured (exits with code 1).
+    ValueError:
+        If the email section holds invalid values.
+    """
+    global _email_config_cache  # noqa: PLW0603
+    cached = _email_config_cache
+    if cached is not None and cached[0] is config:
+        email_config = cached[1]
+    else:
+        email_config = load_email_config_from_dict(config.as_dict())
+        _email_config_cache = (config, email_config)
+    validate_smtp_configuration(email_config)
+    return email_config
+
 
 def validate_smtp_configuration(email_config: EmailConfig) -> None:
     """Validate SMTP configuration is present.
@@ -59,14 +142,7 @@ def validate_smtp_configuration(email_config: EmailConfig) -> None:
     """
     if not email_config.smtp_hosts:
         logger.error("No SMTP hosts configured")
-        click.echo(
-            "\nError: No SMTP hosts configured. Please configure email.smtp_hosts in your config file.",
-            err=True,
-        )
-        click.echo(
-            "See: check_zpools config-deploy --target user",
-            err=True,
-        )
+        echo_error(_MISSING_SMTP_HOSTS_MESSAGE)
         raise SystemExit(1)
 
 
@@ -75,8 +151,7 @@ def handle_send_email_error(exc: Exception, error_type: str) -> None:
 
     Why
         Eliminates duplicated error handling across CLI email commands.
-        Maintains compatibility with existing CLI tests by using click.echo
-        for error output.
+        Error text is plain, so it is written with :func:`echo_error`.
 
     Parameters
     ----------
@@ -95,23 +170,18 @@ def handle_send_email_error(exc: Exception, error_type: str) -> None:
     >>> handle_send_email_error(exc, "ValueError")  # doctest: +SKIP
     # Logs error and exits with code 1
     """
-    error_messages = {
-        "ValueError": ("Invalid email parameters", f"Invalid email parameters - {exc}"),
-        "FileNotFoundError": ("Attachment file not found", f"Attachment file not found - {exc}"),
-        "RuntimeError": ("SMTP delivery failed", f"Failed to send email - {exc}"),
-    }
-
-    log_msg, cli_msg = error_messages.get(
-        error_type,
-        ("Unexpected error sending email", f"Unexpected error - {exc}"),
-    )
+    known = _SEND_EMAIL_ERROR_MESSAGES.get(error_type)
+    log_msg, cli_template = known if known is not None else _UNEXPECTED_SEND_EMAIL_ERROR
+    error = str(exc)
 
-    logger.error(log_msg, extra={"error": str(exc)}, exc_info=(error_type not in error_messages))
-    click.echo(f"\nError: {cli_msg}", err=True)
+    logger.error(log_msg, extra={"error": error}, exc_info=known is None)
+    echo_error(cli_template.format(error))
     raise SystemExit(1)
 
 
 __all__ = [
+    "echo_error",
     "handle_send_email_error",
+    "load_and_validate_email_config",
     "validate_smtp_configuration",
 ]
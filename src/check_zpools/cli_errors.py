@@ -10,21 +10,55 @@ Contents
 --------
 * :func:`handle_zfs_not_available` - Handle ZFSNotAvailableError exceptions
 * :func:`handle_generic_error` - Handle unexpected exceptions with logging
+* :class:`ErrorRule` - Declarative exception-to-message mapping for one command
+* :func:`handle_command_error` - Report an exception using a command's rule table
 """
 
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, NoReturn
 
 import rich_click as click
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from .zfs_client import ZFSNotAvailableError
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class ErrorRule:
+    """How one exception type is logged and reported by a CLI command.
+
+    Attributes
+    ----------
+    exc_type:
+        Exception class handled by this rule (matched with ``isinstance``).
+    log_message:
+        Message logged at ERROR level.
+    user_message:
+        ``str.format`` template echoed to stderr; ``{exc}`` is the exception.
+    hint:
+        Optional follow-up line echoed to stderr after the message.
+    with_traceback:
+        Attach the active traceback to the log record.
+    """
+
+    exc_type: type[Exception]
+    log_message: str
+    user_message: str
+    hint: str | None = None
+    with_traceback: bool = False
+
+
+#: Rule applied when none of a command's rules match the exception.
+_UNEXPECTED_ERROR_RULE = ErrorRule(Exception, "Unexpected error", "\nError: Unexpected error - {exc}", with_traceback=True)
+
+
 def handle_zfs_not_available(exc: ZFSNotAvailableError, *, operation: str = "Operation") -> NoReturn:
     """Handle ZFS not available errors with consistent logging and messaging.
 
@@ -49,8 +83,9 @@ def handle_zfs_not_available(exc: ZFSNotAvailableError, *, operation: str = "Ope
     ------------
     Logs error message and displays user-friendly message to stderr.
     """
-    logger.error("ZFS not available", extra={"error": str(exc), "operation": operation})
-    click.echo(f"\nError: {exc}", err=True)
+    error = str(exc)
+    logger.error("ZFS not available", extra={"error": error, "operation": operation})
+    click.echo(f"\nError: {error}", err=True)
     raise SystemExit(1)
 
 
@@ -78,17 +113,65 @@ def handle_generic_error(exc: Exception, *, operation: str = "Operation") -> NoR
     ------------
     Logs error with full traceback and displays user-friendly message to stderr.
     """
+    error = str(exc)
     logger.error(
         "%s failed",
         operation,
-        extra={"error": str(exc), "error_type": type(exc).__name__},
+        extra={"error": error, "error_type": type(exc).__name__},
         exc_info=True,
     )
-    click.echo(f"\nError: {exc}", err=True)
+    click.echo(f"\nError: {error}", err=True)
     raise SystemExit(1)
 
 
+def handle_command_error(exc: Exception, rules: Sequence[ErrorRule]) -> NoReturn:
+    """Log and report ``exc`` using the first matching rule, then exit.
+
+    Why
+    ---
+    Commands previously spelled out the same log/echo/exit ladder in every
+    ``except`` block. A per-command tuple of :class:`ErrorRule` entries keeps
+    the messages declarative while the reporting logic lives here once.
+
+    Parameters
+    ----------
+    exc:
+        The exception that was raised. Must be called from its ``except`` block
+        so ``with_traceback`` rules can attach the active traceback.
+    rules:
+        Rules checked in order; the first whose ``exc_type`` matches wins.
+        Unmatched exceptions are reported as unexpected errors.
+
+    Raises
+    ------
+    SystemExit:
+        Always exits with code 1 after logging and displaying the error.
+
+    Examples
+    --------
+    >>> rules = (ErrorRule(ValueError, "Bad input", "Error: {exc}"),)
+    >>> handle_command_error(ValueError("boom"), rules)  # doctest: +SKIP
+    Traceback (most recent call last):
+    ...
+    SystemExit: 1
+    """
+    rule = next((rule for rule in rules if isinstance(exc, rule.exc_type)), _UNEXPECTED_ERROR_RULE)
+    # Stringify once; the log record and the stderr message share the text.
+    error = str(exc)
+    logger.error(
+        rule.log_message,
+        extra={"error": error, "error_type": type(exc).__name__},
+        exc_info=rule.with_traceback,
+    )
+    click.echo(rule.user_message.format_map({"exc": error}), err=True)
+    if rule.hint:
+        click.echo(rule.hint, err=True)
+    raise SystemExit(1) from exc
+
+
 __all__ = [
+    "ErrorRule",
+    "handle_command_error",
     "handle_generic_error",
     "handle_zfs_not_available",
 ]
@@ -16,17 +16,33 @@ Contents
 * :func:`apply_traceback_preferences` - synchronize shared traceback flags
 * :func:`snapshot_traceback_state` - capture current traceback settings
 * :func:`restore_traceback_state` - restore previous traceback settings
-* :const:`TracebackState` - type alias for traceback state tuple
+* :class:`TracebackState` - named tuple holding the traceback state
 """
 
 from __future__ import annotations
 
-from typing import Final
+from typing import Final, NamedTuple
 
 import lib_cli_exit_tools
 
-#: Type alias for traceback state (traceback_enabled, force_color_enabled)
-TracebackState = tuple[bool, bool]
+#: The shared exit-tools settings object. ``reset_config()`` resets it in place,
+#: so binding it once skips the module attribute lookup on every call.
+_CLI_CONFIG: Final = lib_cli_exit_tools.config
+
+
+class TracebackState(NamedTuple):
+    """Snapshot of the shared ``lib_cli_exit_tools`` traceback flags."""
+
+    traceback: bool
+    force_color: bool
+
+
+#: Every possible snapshot, preallocated and indexed as ``[traceback][force_color]``
+#: so capturing state on each ``main()`` call never allocates a new tuple.
+_TRACEBACK_STATES: Final[tuple[tuple[TracebackState, TracebackState], ...]] = tuple(
+    (TracebackState(traceback=traceback, force_color=False), TracebackState(traceback=traceback, force_color=True)) for traceback in (False, True)
+)
+
 
 #: Character budget used when printing truncated tracebacks.
 TRACEBACK_SUMMARY_LIMIT: Final[int] = 500
@@ -42,7 +58,8 @@ def apply_traceback_preferences(*, enabled: bool) -> None:
         ``lib_cli_exit_tools`` inspects global flags to decide whether tracebacks
         should be truncated and whether colour should be forced. Updating both
         attributes together ensures the ``--traceback`` flag behaves the same for
-        console scripts and ``python -m`` execution.
+        console scripts and ``python -m`` execution. When both flags already
+        hold the requested value the writes are skipped.
 
     Parameters
     ----------
@@ -61,8 +78,11 @@ def apply_traceback_preferences(*, enabled: bool) -> None:
     >>> bool(lib_cli_exit_tools.config.traceback)
     False
     """
-    lib_cli_exit_tools.config.traceback = enabled
-    lib_cli_exit_tools.config.traceback_force_color = enabled
+    # Common case: the default ``--no-traceback`` matches the current state.
+    if _CLI_CONFIG.traceback is enabled and _CLI_CONFIG.traceback_force_color is enabled:
+        return
+    _CLI_CONFIG.traceback = enabled
+    _CLI_CONFIG.traceback_force_color = enabled
 
 
 def snapshot_traceback_state() -> TracebackState:
@@ -71,13 +91,13 @@ def snapshot_traceback_state() -> TracebackState:
     Why
         Because ``lib_cli_exit_tools`` manages global traceback flags, helpers
         that modify these settings must capture the original state before making
-        changes. Returning a tuple simplifies passing the state along to
-        restoration helpers without requiring complex data structures.
+        changes. The snapshot is one of four preallocated immutable named
+        tuples, so it is safe to share and costs no allocation.
 
     Returns
     -------
     TracebackState
-        A 2-tuple ``(traceback, traceback_force_color)`` reflecting the current
+        A 2-tuple ``(traceback, force_color)`` reflecting the current
         lib_cli_exit_tools configuration.
 
     Examples
@@ -88,10 +108,7 @@ def snapshot_traceback_state() -> TracebackState:
     >>> len(state)
     2
     """
-    return (
-        bool(lib_cli_exit_tools.config.traceback),
-        bool(lib_cli_exit_tools.config.traceback_force_color),
-    )
+    return _TRACEBACK_STATES[bool(_CLI_CONFIG.traceback)][bool(_CLI_CONFIG.traceback_force_color)]
 
 
 def restore_traceback_state(state: TracebackState) -> None:
@@ -113,11 +130,11 @@ def restore_traceback_state(state: TracebackState) -> None:
     >>> original = snapshot_traceback_state()
     >>> apply_traceback_preferences(enabled=True)
     >>> restore_traceback_state(original)
-    >>> bool(lib_cli_exit_tools.config.traceback) == original[0]
+    >>> bool(lib_cli_exit_tools.config.traceback) == original.traceback
     True
     """
-    lib_cli_exit_tools.config.traceback = state[0]
-    lib_cli_exit_tools.config.traceback_force_color = state[1]
+    _CLI_CONFIG.traceback = state.traceback
+    _CLI_CONFIG.traceback_force_color = state.force_color
 
 
 def get_traceback_limit(*, tracebacks_enabled: bool) -> int:
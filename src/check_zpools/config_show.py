@@ -9,6 +9,7 @@ all formatting and display logic here.
 Contents
 --------
 * :func:`display_config` - displays configuration in requested format
+* :data:`CONFIG_OUTPUT_FORMATS` - format names accepted by :func:`display_config`
 
 System Role
 -----------
@@ -20,12 +21,21 @@ command-line argument parsing.
 from __future__ import annotations
 
 import json
-from typing import Any, cast
+from typing import Any, Final, cast
 
 import click
 
 from .config import get_config
 
+#: Human-readable, TOML-like output format name.
+FORMAT_HUMAN: Final[str] = "human"
+
+#: Machine-readable JSON output format name.
+FORMAT_JSON: Final[str] = "json"
+
+#: Format names accepted by :func:`display_config`, shared with the CLI choice list.
+CONFIG_OUTPUT_FORMATS: Final[tuple[str, ...]] = (FORMAT_HUMAN, FORMAT_JSON)
+
 
 def _collect_dotted_keys(data: dict[str, Any], prefix: str = "") -> list[str]:
     """Recursively collect all dotted keys from a nested dictionary.
@@ -214,7 +224,7 @@ def _display_human_section(config: Any, section: str | None) -> None:
             _display_human_section_data(section_name, section_data, config)
 
 
-def display_config(*, output_format: str = "human", section: str | None = None) -> None:
+def display_config(*, output_format: str = FORMAT_HUMAN, section: str | None = None) -> None:
     """Display the current merged configuration from all sources.
 
     Why
@@ -266,12 +276,15 @@ def display_config(*, output_format: str = "human", section: str | None = None)
     """
     config = get_config()
 
-    if output_format.lower() == "json":
+    if output_format.lower() == FORMAT_JSON:
         _display_json_section(config, section)
     else:
         _display_human_section(config, section)
 
 
 __all__ = [
+    "CONFIG_OUTPUT_FORMATS",
+    "FORMAT_HUMAN",
+    "FORMAT_JSON",
     "display_config",
 ]
@@ -26,8 +26,10 @@ from __future__ import annotations
 import logging
 import signal
 import threading
+import time
+from collections import defaultdict
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Final
 
 from . import __init__conf__
 from .formatters import format_bytes_human
@@ -36,12 +38,17 @@ from .zfs_client import ZFSClient, ZFSCommandError, ZFSNotAvailableError
 from .zfs_parser import ZFSParseError, ZFSParser
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from .alert_state import AlertStateManager
     from .alerting import EmailAlerter
     from .monitor import PoolMonitor
 
 logger = logging.getLogger(__name__)
 
+# Shared empty category set for pools with no current issues
+_NO_CATEGORIES: Final[frozenset[str]] = frozenset()
+
 
 class ZPoolDaemon:
     """Continuous ZFS pool monitoring daemon with periodic checks.
@@ -71,6 +78,24 @@ class ZPoolDaemon:
         Daemon configuration (interval, pools to monitor, etc).
     """
 
+    __slots__ = (
+        "_pools_to_monitor_display",
+        "alerter",
+        "check_count",
+        "check_interval",
+        "monitor",
+        "parser",
+        "pools_to_monitor",
+        "previous_issues",
+        "running",
+        "send_ok_emails",
+        "send_recovery_emails",
+        "shutdown_event",
+        "start_time",
+        "state_manager",
+        "zfs_client",
+    )
+
     def __init__(
         self,
         zfs_client: ZFSClient,
@@ -87,7 +112,8 @@ class ZPoolDaemon:
 
         # Configuration - access typed fields directly
         self.check_interval = config.check_interval_seconds
-        self.pools_to_monitor = config.pools_to_monitor
+        self.pools_to_monitor = frozenset(config.pools_to_monitor)
+        self._pools_to_monitor_display = config.pools_to_monitor
         self.send_ok_emails = config.send_ok_emails
         self.send_recovery_emails = config.send_recovery_emails
 
@@ -124,7 +150,7 @@ class ZPoolDaemon:
             extra={
                 "version": __init__conf__.version,
                 "interval_seconds": self.check_interval,
-                "pools": self.pools_to_monitor or "all",
+                "pools": self._pools_to_monitor_display or "all",
                 "smtp_servers": smtp_hosts,
                 "alert_recipients": alert_recipients,
                 "send_recovery_emails": self.send_recovery_emails,
@@ -236,8 +262,15 @@ class ZPoolDaemon:
         ---
         Executes check cycles at configured intervals until shutdown is
         requested. Handles errors gracefully to prevent daemon crashes.
+        Cycles start on a fixed monotonic schedule, so the time a cycle takes
+        does not push every later cycle back. A cycle that overruns its slot
+        waits for the next future slot of the same schedule, so a slow or
+        hung ``zpool`` is never polled back-to-back and no catch-up cycles
+        run.
         """
+        next_deadline = time.monotonic()
         while not self.shutdown_event.is_set():
+            next_deadline += self.check_interval
             try:
                 self._run_check_cycle()
             except Exception as exc:  # Intentional broad catch: daemon must survive any single-cycle failure
@@ -247,7 +280,11 @@ class ZPoolDaemon:
                 )
 
             # Sleep with interruptible wait so shutdown is responsive
-            self.shutdown_event.wait(timeout=self.check_interval)
+            now = time.monotonic()
+            if next_deadline <= now:
+                # Skip the missed slots rather than starting the next cycle at once
+                next_deadline += ((now - next_deadline) // self.check_interval + 1) * self.check_interval
+            self.shutdown_event.wait(timeout=next_deadline - now)
 
     def _fetch_and_parse_pools(self) -> dict[str, PoolStatus] | None:
         """Fetch and parse ZFS pool data.
@@ -361,54 +398,83 @@ class ZPoolDaemon:
         self._log_pool_details(pools)
 
         # Handle recoveries and alerts
-        self._detect_recoveries(result)
-        current_issues = self._handle_check_result(result, pools)
+        current_issues, alert_candidates = self._classify_issues(result)
+        self._detect_recoveries(result, current_issues)
+        self._handle_check_result(alert_candidates, pools)
         self.previous_issues = current_issues
 
-    def _handle_check_result(self, result: CheckResult, pools: dict[str, Any]) -> dict[str, set[str]]:
-        """Process check result by sending alerts for actionable issues.
+    def _classify_issues(self, result: CheckResult) -> tuple[defaultdict[str, set[str]], list[PoolIssue]]:
+        """Sort this cycle's issues for recovery tracking and alerting in one pass.
 
         Why
         ---
-        Not all issues warrant alerts (e.g., duplicates within resend interval).
-        This method applies alert policy and sends emails for actionable issues.
-
-        What
-        ---
-        1. Filter issues by severity (skip OK if configured)
-        2. Check alert state to determine if alert should send
-        3. Send alert emails
-        4. Record alert state
-        5. Return current issues for tracking
+        Recovery detection needs every issue category per pool, while alerting
+        only needs issues that pass the severity policy. Both come from the
+        same walk over ``result.issues``.
 
         Parameters
         ----------
         result:
             Check result containing issues.
-        pools:
-            Pool status dict for issue context.
 
         Returns
         -------
-        dict[str, set[str]]:
-            Dictionary mapping pool names to sets of issue categories.
+        tuple[defaultdict[str, set[str]], list[PoolIssue]]:
+            Issue categories keyed by pool name, and the issues eligible for
+            an alert (OK severity dropped unless ``send_ok_emails`` is set).
         """
-        # Track current issues for recovery detection
-        current_issues: dict[str, set[str]] = {}
+        current_issues: defaultdict[str, set[str]] = defaultdict(set)
+        alert_candidates: list[PoolIssue] = []
+        send_ok_emails = self.send_ok_emails
 
         for issue in result.issues:
-            # Track this issue
-            if issue.pool_name not in current_issues:
-                current_issues[issue.pool_name] = set()
             current_issues[issue.pool_name].add(issue.category)
 
+            # Skip OK severity unless configured to send
+            if issue.severity is Severity.OK and not send_ok_emails:
+                logger.debug(
+                    "Skipping OK issue (send_ok_emails disabled)",
+                    extra={"pool": issue.pool_name, "category": issue.category},
+                )
+                continue
+            alert_candidates.append(issue)
+
+        return current_issues, alert_candidates
+
+    def _handle_check_result(self, issues: list[PoolIssue], pools: dict[str, Any]) -> None:
+        """Process check result by sending alerts for actionable issues.
+
+        Why
+        ---
+        Not all issues warrant alerts (e.g., duplicates within resend interval).
+        This method applies alert policy and sends emails for actionable issues.
+
+        What
+        ---
+        1. Check alert state to determine if alert should send
+        2. Send alert emails
+        3. Record alert state
+
+        The state check runs here rather than in :meth:`_classify_issues` so
+        that an alert recorded earlier in the loop suppresses a duplicate
+        later in the same cycle.
+
+        Parameters
+        ----------
+        issues:
+            Issues that passed the severity policy.
+        pools:
+            Pool status dict for issue context.
+        """
+        for issue in issues:
             # Check if alert should be sent
             if not self._should_send_alert(issue):
                 continue
 
             # Get pool status
-            pool = pools.get(issue.pool_name)
-            if not pool:
+            try:
+                pool = pools[issue.pool_name]
+            except KeyError:
                 logger.warning(
                     "Cannot send alert - pool status not found",
                     extra={"pool": issue.pool_name},
@@ -418,16 +484,14 @@ class ZPoolDaemon:
             # Send alert and record state
             self._send_alert_for_issue(issue, pool)
 
-        # Return current issues for tracking
-        return current_issues
-
     def _should_send_alert(self, issue: PoolIssue) -> bool:
         """Determine if an alert should be sent for an issue.
 
         Why
         ---
-        Filters out OK-severity issues (if configured) and duplicate alerts
-        within the resend interval to reduce alert fatigue.
+        Filters out duplicate alerts within the resend interval to reduce
+        alert fatigue. OK-severity issues are already dropped by
+        :meth:`_classify_issues`.
 
         Parameters
         ----------
@@ -439,14 +503,6 @@ class ZPoolDaemon:
         bool:
             True if alert should be sent, False otherwise.
         """
-        # Skip OK severity unless configured to send
-        if issue.severity == Severity.OK and not self.send_ok_emails:
-            logger.debug(
-                "Skipping OK issue (send_ok_emails disabled)",
-                extra={"pool": issue.pool_name, "category": issue.category},
-            )
-            return False
-
         # Check if we should send alert based on state
         if not self.state_manager.should_alert(issue):
             logger.debug(
@@ -543,7 +599,7 @@ class ZPoolDaemon:
                 },
             )
 
-    def _detect_recoveries(self, result: CheckResult) -> None:
+    def _detect_recoveries(self, result: CheckResult, current_issues: Mapping[str, set[str]]) -> None:
         """Detect and notify when previously alerted issues are resolved.
 
         Why
@@ -560,38 +616,38 @@ class ZPoolDaemon:
         ----------
         result:
             Current check result.
+        current_issues:
+            Issue categories found this cycle, keyed by pool name.
         """
-        if not self.send_recovery_emails:
+        # Nothing was open last cycle, so nothing can have recovered
+        if not self.send_recovery_emails or not self.previous_issues:
             return
 
-        # Build current issues map
-        current_issues: dict[str, set[str]] = {}
-        for issue in result.issues:
-            if issue.pool_name not in current_issues:
-                current_issues[issue.pool_name] = set()
-            current_issues[issue.pool_name].add(issue.category)
+        # Find resolved issues via set difference against this cycle's issues
+        recoveries = [
+            (pool_name, category)
+            for pool_name, prev_categories in self.previous_issues.items()
+            for category in prev_categories - (current_issues.get(pool_name) or _NO_CATEGORIES)
+        ]
+        if not recoveries:
+            return
 
         # Build pool dict for lookups
         pools_dict = {pool.name: pool for pool in result.pools}
 
-        # Find resolved issues
-        for pool_name, prev_categories in self.previous_issues.items():
-            current_categories = current_issues.get(pool_name, set())
-            resolved = prev_categories - current_categories
+        for pool_name, category in recoveries:
+            logger.info(
+                "Detected issue recovery",
+                extra={"pool": pool_name, "category": category},
+            )
 
-            for category in resolved:
+            # Send recovery email with current pool status
+            pool_status = pools_dict.get(pool_name)
+            success = self.alerter.send_recovery(pool_name, category, pool_status)
+            if success:
+                # Clear alert state so future issues alert immediately
+                self.state_manager.clear_issue(pool_name, category)
                 logger.info(
-                    "Detected issue recovery",
+                    "Recovery notification sent",
                     extra={"pool": pool_name, "category": category},
                 )
-
-                # Send recovery email with current pool status
-                pool_status = pools_dict.get(pool_name)
-                success = self.alerter.send_recovery(pool_name, category, pool_status)
-                if success:
-                    # Clear alert state so future issues alert immediately
-                    self.state_manager.clear_issue(pool_name, category)
-                    logger.info(
-                        "Recovery notification sent",
-                        extra={"pool": pool_name, "category": category},
-                    )
@@ -9,21 +9,36 @@ here following the Single Responsibility Principle.
 Contents
 --------
 * :func:`format_check_result_json` - Format check results as JSON
+* :func:`dump_check_result_json` - Write check result JSON straight to a stream
 * :func:`format_check_result_text` - Format check results as human-readable text
 """
 
 from __future__ import annotations
 
-import json
 import sys
+from bisect import bisect_right
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final, TextIO
 
-from rich.console import Console
-from rich.table import Table
+import orjson
+from rich.console import Console, Group
+from rich.table import Column, Table
+from rich.text import Text
+
+from .models import PoolIssue, PoolStatus, Severity
 
 if TYPE_CHECKING:
-    from .models import CheckResult, PoolIssue, PoolStatus, Severity
+    from collections.abc import Callable, Mapping
+
+    from rich.console import RenderableType
+
+    from .models import CheckResult
+
+# Dataclasses are passed through so PoolStatus/PoolIssue reach _json_default
+_ORJSON_OPTIONS_COMPACT: Final[int] = orjson.OPT_PASSTHROUGH_DATACLASS
+_ORJSON_OPTIONS_PRETTY: Final[int] = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_INDENT_2
+
 
 #: Capacity display thresholds (mirrors MonitorConfig defaults for the color heuristic).
 CAPACITY_COLOR_WARNING_THRESHOLD = 80
@@ -32,48 +47,211 @@ CAPACITY_COLOR_CRITICAL_THRESHOLD = 90
 #: Byte-unit conversion base (1 KB = 1024 B).
 BYTES_PER_UNIT = 1024.0
 
+#: Size units and their precomputed divisors (1024**index) for format_bytes_human.
+_BYTE_UNITS: Final[tuple[str, ...]] = ("B", "KB", "MB", "GB", "TB", "PB")
+_BYTE_UNIT_DIVISORS: Final[tuple[float, ...]] = tuple(BYTES_PER_UNIT**index for index in range(len(_BYTE_UNITS)))
+
 #: Day thresholds for human-readable "time ago" formatting.
 DAYS_PER_WEEK = 7
 DAYS_PER_MONTH = 30
 DAYS_STALE_WARNING = 60
 
+#: Scrub age buckets for _format_scrub_age: bisect_right over the thresholds
+#: selects the formatter; index 0 catches negative ages from clock skew.
+_SCRUB_AGE_THRESHOLDS: Final[tuple[int, ...]] = (0, 1, 2, DAYS_PER_WEEK, DAYS_PER_MONTH, DAYS_STALE_WARNING)
+_SCRUB_AGE_FORMATTERS: Final[tuple[Callable[[int], tuple[str, str]], ...]] = (
+    lambda days: (f"{days}d ago", "green"),
+    lambda _days: ("Today", "green"),
+    lambda _days: ("Yesterday", "green"),
+    lambda days: (f"{days}d ago", "green"),
+    lambda days: (f"{days // DAYS_PER_WEEK}w ago", "green"),
+    lambda days: (f"{days}d ago", "yellow"),  # Warning: approaching 2 months
+    lambda days: (f"{days // DAYS_PER_MONTH}mo ago", "red"),  # Critical: very old scrub
+)
+
+#: Rich color and process exit code per severity (0=OK, 1=WARNING, 2=CRITICAL),
+#: derived once from the Severity predicates so every member is covered.
+_SEVERITY_COLORS: Final[Mapping[Severity, str]] = MappingProxyType(
+    {severity: "red" if severity.is_critical() else "yellow" if severity.is_warning() else "green" for severity in Severity}
+)
+_SEVERITY_EXIT_CODES: Final[Mapping[Severity, int]] = MappingProxyType(
+    {severity: 2 if severity.is_critical() else 1 if severity.is_warning() else 0 for severity in Severity}
+)
+#: Indented, colored severity label that starts each issue line.
+_ISSUE_LINE_PREFIXES: Final[Mapping[Severity, str]] = MappingProxyType(
+    {severity: f"  [{color}]{severity.value}[/{color}] " for severity, color in _SEVERITY_COLORS.items()}
+)
+
+#: Cell text and Rich style, as produced by ``_format_pool_row``.
+_Cell = tuple[str, str]
+
+#: Pool table columns, defined once; each table renders copies of them.
+_POOL_TABLE_COLUMNS: Final[tuple[Column, ...]] = (
+    Column("Pool", style="bold", no_wrap=True),
+    Column("Health", justify="center"),
+    Column("Devices", justify="center"),
+    Column("Capacity", justify="right"),
+    Column("Size", justify="right"),
+    Column("Errors (R/W/C)", justify="right"),
+    Column("Last Scrub", justify="right"),
+)
+#: Column headers shared by the Rich table and the plain-text table.
+_POOL_TABLE_HEADERS: Final[tuple[str, ...]] = tuple(str(column.header) for column in _POOL_TABLE_COLUMNS)
+
+# Default stdout console and the stream it was built for; Console probes the
+# terminal once at construction, so it is rebuilt whenever sys.stdout changes.
+_stdout_console: tuple[object, Console] | None = None
+
+
+def _get_stdout_console() -> Console:
+    """Return a Console for the current ``sys.stdout``, reusing the last one.
+
+    Returns
+    -------
+    Console
+        Console writing to ``sys.stdout``, created on first use per stream.
+    """
+    global _stdout_console  # noqa: PLW0603
+    stream = sys.stdout
+    cached = _stdout_console
+    if cached is not None and cached[0] is stream:
+        return cached[1]
+    console = Console(file=stream, legacy_windows=False)
+    _stdout_console = (stream, console)
+    return console
+
 
-def format_check_result_json(result: CheckResult) -> str:
+def format_check_result_json(result: CheckResult, *, pretty: bool = False) -> str:
     """Format check result as JSON.
 
     Parameters
     ----------
     result:
         Check result to format.
+    pretty:
+        Indent with two spaces for human readers. Defaults to compact output
+        without whitespace, which is what monitoring agents consume.
 
     Returns
     -------
     str
-        JSON-formatted string with indentation.
+        JSON-formatted string, serialized by orjson.
     """
-    data = {
-        "timestamp": result.timestamp.isoformat(),
-        "pools": [
-            {
-                "name": pool.name,
-                "health": pool.health.value,
-                "capacity_percent": pool.capacity_percent,
-            }
-            for pool in result.pools
-        ],
-        "issues": [
-            {
-                "pool_name": issue.pool_name,
-                "severity": issue.severity.value,
-                "category": issue.category.value,
-                "message": issue.message,
-                "details": issue.details.model_dump(exclude_none=True),
-            }
-            for issue in result.issues
-        ],
+    return _dumps(_check_result_to_dict(result), pretty=pretty)
+
+
+def dump_check_result_json(result: CheckResult, fp: TextIO, *, pretty: bool = False) -> None:
+    """Write check result JSON, followed by a newline, to a text stream.
+
+    Why
+        The CLI previously handed the JSON string to ``click.echo``, which
+        concatenated it with the trailing newline into a second string;
+        writing the document and the newline separately skips that copy.
+
+    Parameters
+    ----------
+    result:
+        Check result to serialize.
+    fp:
+        Text stream to write to, typically ``sys.stdout``.
+    pretty:
+        Indent with two spaces, as in :func:`format_check_result_json`.
+    """
+    fp.write(_dumps(_check_result_to_dict(result), pretty=pretty))
+    fp.write("\n")
+
+
+def _check_result_to_dict(result: CheckResult) -> dict[str, object]:
+    """Build the top-level JSON mapping for a check result.
+
+    Why
+        Pools and issues are handed to the encoder as-is; ``_json_default``
+        converts each one while it is written, so no intermediate lists of
+        dicts are materialized.
+
+    Parameters
+    ----------
+    result:
+        Check result to convert.
+
+    Returns
+    -------
+    dict[str, object]
+        Timestamp, pools, issues and overall severity.
+    """
+    return {
+        "timestamp": result.iso_timestamp,
+        "pools": result.pools,
+        "issues": result.issues,
         "overall_severity": result.overall_severity.value,
     }
-    return json.dumps(data, indent=2)
+
+
+def _pool_to_json(pool: PoolStatus) -> dict[str, object]:
+    """Return the JSON summary of one pool (name, health, capacity)."""
+    return {
+        "name": pool.name,
+        "health": pool.health.value,
+        "capacity_percent": pool.capacity_percent,
+    }
+
+
+def _issue_to_json(issue: PoolIssue) -> dict[str, object]:
+    """Return the JSON form of one issue, omitting unset detail fields."""
+    return {
+        "pool_name": issue.pool_name,
+        "severity": issue.severity.value,
+        "category": issue.category.value,
+        "message": issue.message,
+        "details": issue.details.model_dump(exclude_none=True),
+    }
+
+
+#: Per-type converters used by the JSON encoder's ``default`` hook.
+_JSON_CONVERTERS: Final[Mapping[type, Callable[[Any], dict[str, object]]]] = MappingProxyType(
+    {
+        PoolStatus: _pool_to_json,
+        PoolIssue: _issue_to_json,
+    }
+)
+
+
+def _json_default(obj: object) -> dict[str, object]:
+    """Convert pools and issues while the encoder walks the payload.
+
+    Raises
+    ------
+    TypeError
+        For any other type, as the JSON encoders expect.
+    """
+    converter = _JSON_CONVERTERS.get(type(obj))
+    if converter is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return converter(obj)
+
+
+def _dumps(data: object, *, pretty: bool) -> str:
+    """Serialize a JSON payload with orjson.
+
+    Why
+        One place picks the orjson options and wires in ``_json_default``, so
+        the string and stream variants produce identical documents.
+
+    Parameters
+    ----------
+    data:
+        Payload to serialize; pools and issues are converted by ``_json_default``.
+    pretty:
+        Indent with two spaces instead of emitting compact output.
+
+    Returns
+    -------
+    str
+        The JSON document. Non-ASCII characters are written as UTF-8, not as
+        ``\\uXXXX`` escapes.
+    """
+    options = _ORJSON_OPTIONS_PRETTY if pretty else _ORJSON_OPTIONS_COMPACT
+    return orjson.dumps(data, default=_json_default, option=options).decode()
 
 
 def format_check_result_text(result: CheckResult) -> str:
@@ -94,30 +272,61 @@ def format_check_result_text(result: CheckResult) -> str:
     This function returns a string with Rich markup tags like [green]text[/green].
     The caller should use Rich Console.print() to render it, NOT click.echo().
     """
-    lines: list[str] = []
+    if not result.pools and not result.issues:
+        return _format_empty_check(result)
+
+    # The pool status table is rendered separately in display_check_result_text(),
+    # so it is represented here by a placeholder marker.
+    header, issues_block, summary = _format_check_sections(result)
+    return f"{header}\n__TABLE_PLACEHOLDER__\n{issues_block}\n{summary}"
 
-    # Header
-    timestamp_str = result.timestamp.strftime("%Y-%m-%d %H:%M:%S")
-    lines.append(f"\nZFS Pool Check - {timestamp_str}")
-    lines.append(f"Overall Status: {result.overall_severity.value.upper()}\n")
 
-    # Pool Status Summary - we'll add this as a special marker
-    # The table will be rendered separately in display_check_result_text()
-    lines.append("__TABLE_PLACEHOLDER__")
+def _format_check_sections(result: CheckResult) -> tuple[str, str, str]:
+    """Format the markup sections surrounding the pool table.
 
-    # Issues
+    Why
+        ``format_check_result_text`` and ``display_check_result_text`` emit
+        the same header, issues and summary; building them in one place keeps
+        the two outputs from drifting apart.
+
+    Parameters
+    ----------
+    result:
+        Check result to format.
+
+    Returns
+    -------
+    tuple[str, str, str]
+        Header (timestamp and overall status), issues block and pool count
+        summary, each with Rich markup and a leading newline.
+    """
+    header = f"\nZFS Pool Check - {result.display_timestamp}\nOverall Status: {result.overall_severity.value.upper()}\n"
     if result.issues:
-        lines.append("\nIssues Found:")
-        for issue in result.issues:
-            severity_color = _get_severity_color(issue.severity)
-            lines.append(f"  [{severity_color}]{issue.severity.value}[/{severity_color}] {issue.pool_name}: {issue.message}")
+        issue_lines = "\n".join(_format_issue_line(issue) for issue in result.issues)
+        issues_block = f"\nIssues Found:\n{issue_lines}"
     else:
-        lines.append("\n[green]No issues detected[/green]")
+        issues_block = "\n[green]No issues detected[/green]"
+    return header, issues_block, f"\nPools Checked: {len(result.pools)}"
+
 
-    # Summary
-    lines.append(f"\nPools Checked: {len(result.pools)}")
+def _format_empty_check(result: CheckResult) -> str:
+    """Format a check that found no pools and no issues.
 
-    return "\n".join(lines)
+    Why
+        Hosts without ZFS pools are probed as often as any other; their
+        report needs no table, so no Rich objects are built for it.
+
+    Parameters
+    ----------
+    result:
+        Check result with empty ``pools`` and ``issues``.
+
+    Returns
+    -------
+    str
+        Header, overall status and a zero pool count, without markup.
+    """
+    return f"\nZFS Pool Check - {result.display_timestamp}\nOverall Status: {result.overall_severity.value.upper()}\n\nNo pools found\n\nPools Checked: 0"
 
 
 def _build_pool_status_table() -> Table:
@@ -128,15 +337,9 @@ def _build_pool_status_table() -> Table:
     Table:
         Configured table with columns for pool status information.
     """
-    table = Table(title="Pool Status", show_header=True, header_style="bold cyan")
-    table.add_column("Pool", style="bold", no_wrap=True)
-    table.add_column("Health", justify="center")
-    table.add_column("Devices", justify="center")
-    table.add_column("Capacity", justify="right")
-    table.add_column("Size", justify="right")
-    table.add_column("Errors (R/W/C)", justify="right")
-    table.add_column("Last Scrub", justify="right")
-    return table
+    # Columns collect their cells, so every table gets fresh copies
+    columns = (column.copy() for column in _POOL_TABLE_COLUMNS)
+    return Table(*columns, title="Pool Status", show_header=True, header_style="bold cyan")
 
 
 def _get_capacity_color(capacity_percent: float) -> str:
@@ -185,16 +388,16 @@ def format_bytes_human(size_bytes: int) -> str:
     '500.00 GB'
     >>> format_bytes_human(42)
     '42 B'
+    >>> format_bytes_human(1023)
+    '1023 B'
+    >>> format_bytes_human(3 * 1024**6)
+    '3072.00 PB'
     """
-    units = ["B", "KB", "MB", "GB", "TB", "PB"]
-    size = float(size_bytes)
-    unit_index = 0
-
-    while size >= BYTES_PER_UNIT and unit_index < len(units) - 1:
-        size /= BYTES_PER_UNIT
-        unit_index += 1
-
-    return f"{size:.2f} {units[unit_index]}" if unit_index > 0 else f"{size_bytes} B"
+    if size_bytes < BYTES_PER_UNIT:
+        return f"{size_bytes} B"
+    # Each unit step is 2**10, so the bit length picks the unit without a loop
+    unit_index = min((size_bytes.bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{size_bytes / _BYTE_UNIT_DIVISORS[unit_index]:.2f} {_BYTE_UNITS[unit_index]}"
 
 
 def _format_pool_errors(read: int, write: int, checksum: int) -> str:
@@ -236,18 +439,25 @@ def _format_faulted_devices(pool: PoolStatus) -> tuple[str, str]:
     return (f"{faulted_count} FAULTED", "red")
 
 
-def _format_pool_row(pool: PoolStatus) -> tuple[str, str, str, str, str, str, str]:
-    """Format a pool status into table row data with Rich markup.
+def _format_pool_row(pool: PoolStatus, now: datetime) -> tuple[_Cell, _Cell, _Cell, _Cell, _Cell, _Cell, _Cell]:
+    """Format a pool status into table cells paired with their colors.
+
+    Why
+        Keeping text and style apart lets the Rich table build ``Text`` cells
+        without a markup parse, and lets the plain table use the text alone.
 
     Parameters
     ----------
     pool:
         Pool status to format.
+    now:
+        Reference time for the last-scrub age.
 
     Returns
     -------
-    tuple[str, str, str, str, str, str, str]:
-        Formatted values for: name, health, devices, capacity, size, errors, scrub
+    tuple[_Cell, ...]:
+        ``(text, style)`` for: name, health, devices, capacity, size, errors,
+        scrub. Uncolored cells carry an empty style.
     """
     # Determine colors
     health_color = "green" if pool.health.is_healthy() else "red"
@@ -257,37 +467,61 @@ def _format_pool_row(pool: PoolStatus) -> tuple[str, str, str, str, str, str, st
     # Format components
     size_str = format_bytes_human(pool.size_bytes)
     errors_str = _format_pool_errors(pool.read_errors, pool.write_errors, pool.checksum_errors)
-    scrub_text, scrub_color = _format_last_scrub(pool.last_scrub)
+    scrub_text, scrub_color = _format_last_scrub(pool.last_scrub, now)
     devices_text, devices_color = _format_faulted_devices(pool)
 
     return (
-        pool.name,
-        f"[{health_color}]{pool.health.value}[/{health_color}]",
-        f"[{devices_color}]{devices_text}[/{devices_color}]",
-        f"[{capacity_color}]{pool.capacity_percent:.1f}%[/{capacity_color}]",
-        size_str,
-        f"[{error_color}]{errors_str}[/{error_color}]",
-        f"[{scrub_color}]{scrub_text}[/{scrub_color}]",
+        (pool.name, ""),
+        (pool.health.value, health_color),
+        (devices_text, devices_color),
+        (f"{pool.capacity_percent:.1f}%", capacity_color),
+        (size_str, ""),
+        (errors_str, error_color),
+        (scrub_text, scrub_color),
     )
 
 
-def _display_issues(issues: list[PoolIssue], console: Console) -> None:
-    """Display issues list to console.
+def _render_plain_pool_table(pools: list[PoolStatus], now: datetime) -> str:
+    """Render the pool status table as fixed-width plain text.
+
+    Why
+        When output is not a terminal (piped into a monitoring agent or a
+        log), box drawing and color are discarded anyway; padding the cells
+        directly skips Rich's measurement and segment rendering.
 
     Parameters
     ----------
-    issues:
-        List of pool issues to display.
-    console:
-        Rich Console instance for output.
+    pools:
+        Pool statuses to render, one row each.
+    now:
+        Reference time for the last-scrub ages.
+
+    Returns
+    -------
+    str:
+        Title line, header line and one line per pool, columns separated by
+        two spaces.
     """
-    if issues:
-        console.print("\nIssues Found:")
-        for issue in issues:
-            severity_color = _get_severity_color(issue.severity)
-            console.print(f"  [{severity_color}]{issue.severity.value}[/{severity_color}] {issue.pool_name}: {issue.message}")
-    else:
-        console.print("\n[green]No issues detected[/green]")
+    rows = [_POOL_TABLE_HEADERS, *(tuple(text for text, _style in _format_pool_row(pool, now)) for pool in pools)]
+    widths = [max(map(len, column)) for column in zip(*rows, strict=True)]
+    lines = ("  ".join(cell.ljust(width) for cell, width in zip(row, widths, strict=True)).rstrip() for row in rows)
+    return "Pool Status\n" + "\n".join(lines)
+
+
+def _format_issue_line(issue: PoolIssue) -> str:
+    """Format one issue as an indented, severity-colored markup line.
+
+    Parameters
+    ----------
+    issue:
+        Pool issue to format.
+
+    Returns
+    -------
+    str:
+        Line such as ``"  [red]CRITICAL[/red] rpool: Pool is FAULTED"``.
+    """
+    return _ISSUE_LINE_PREFIXES[issue.severity] + issue.pool_name + ": " + issue.message
 
 
 def display_check_result_text(result: CheckResult, console: Console | None = None) -> None:
@@ -298,33 +532,39 @@ def display_check_result_text(result: CheckResult, console: Console | None = Non
     result:
         Check result to display.
     console:
-        Rich Console instance to use for output. If None, creates a new one
-        writing to stdout.
+        Rich Console instance to use for output. If None, a console writing
+        to stdout is used; it is built once per stdout stream and reused.
 
     Notes
     -----
     This function directly prints to the console rather than returning a string.
-    This avoids issues with mixed ANSI codes and Rich markup.
+    This avoids issues with mixed ANSI codes and Rich markup. When the console
+    is not a terminal, the pool table is written as plain fixed-width text
+    instead of a Rich table.
     """
     if console is None:
-        console = Console(file=sys.stdout, legacy_windows=False)
+        console = _get_stdout_console()
 
-    # Header
-    timestamp_str = result.timestamp.strftime("%Y-%m-%d %H:%M:%S")
-    console.print(f"\nZFS Pool Check - {timestamp_str}")
-    console.print(f"Overall Status: {result.overall_severity.value.upper()}\n")
+    if not result.pools and not result.issues:
+        console.out(_format_empty_check(result), highlight=False)
+        return
 
-    # Build and populate pool status table
-    table = _build_pool_status_table()
-    for pool in result.pools:
-        table.add_row(*_format_pool_row(pool))
-    console.print(table)
+    header, issues_block, summary = _format_check_sections(result)
 
-    # Display issues
-    _display_issues(result.issues, console)
+    # Pool status table; non-terminal output gets a plain fixed-width table
+    now = datetime.now(timezone.utc)
+    table: RenderableType
+    if console.is_terminal:
+        table = _build_pool_status_table()
+        for pool in result.pools:
+            table.add_row(*(Text(text, style=style) for text, style in _format_pool_row(pool, now)))
+    else:
+        table = Text(_render_plain_pool_table(result.pools, now), no_wrap=True, overflow="ignore")
 
-    # Summary
-    console.print(f"\nPools Checked: {len(result.pools)}")
+    # One print renders the whole report in a single pass and write; crop=False
+    # keeps plain table lines wider than the console intact
+    sections = Group(console.render_str(header), table, console.render_str(issues_block), console.render_str(summary))
+    console.print(sections, crop=False)
 
 
 def _make_timezone_aware(dt: datetime) -> datetime:
@@ -345,20 +585,21 @@ def _make_timezone_aware(dt: datetime) -> datetime:
     return dt
 
 
-def _calculate_scrub_age_days(last_scrub: datetime) -> int:
+def _calculate_scrub_age_days(last_scrub: datetime, now: datetime) -> int:
     """Calculate age of last scrub in days.
 
     Parameters
     ----------
     last_scrub:
         Timestamp of last scrub.
+    now:
+        Timezone-aware reference time.
 
     Returns
     -------
     int
         Number of days since last scrub.
     """
-    now = datetime.now(timezone.utc)
     last_scrub_aware = _make_timezone_aware(last_scrub)
     delta = now - last_scrub_aware
     return delta.days
@@ -377,29 +618,19 @@ def _format_scrub_age(days: int) -> tuple[str, str]:
     tuple[str, str]
         Tuple of (formatted_text, color_name).
     """
-    if days == 0:
-        return ("Today", "green")
-    if days == 1:
-        return ("Yesterday", "green")
-    if days < DAYS_PER_WEEK:
-        return (f"{days}d ago", "green")
-    if days < DAYS_PER_MONTH:
-        weeks = days // DAYS_PER_WEEK
-        return (f"{weeks}w ago", "green")
-    if days < DAYS_STALE_WARNING:
-        return (f"{days}d ago", "yellow")  # Warning: approaching 2 months
-
-    months = days // DAYS_PER_MONTH
-    return (f"{months}mo ago", "red")  # Critical: very old scrub
-
-
-def _format_last_scrub(last_scrub: datetime | None) -> tuple[str, str]:
+    return _SCRUB_AGE_FORMATTERS[bisect_right(_SCRUB_AGE_THRESHOLDS, days)](days)
+
+
+def _format_last_scrub(last_scrub: datetime | None, now: datetime | None = None) -> tuple[str, str]:
     """Format last scrub timestamp as relative time with color coding.
 
     Parameters
     ----------
     last_scrub:
         Timestamp of last scrub, or None if never scrubbed.
+    now:
+        Timezone-aware reference time, shared across a table so the clock is
+        read once per display. Defaults to the current UTC time.
 
     Returns
     -------
@@ -411,31 +642,10 @@ def _format_last_scrub(last_scrub: datetime | None) -> tuple[str, str]:
     if last_scrub is None:
         return ("Never", "yellow")
 
-    days = _calculate_scrub_age_days(last_scrub)
+    days = _calculate_scrub_age_days(last_scrub, now or datetime.now(timezone.utc))
     return _format_scrub_age(days)
 
 
-def _get_severity_color(severity: Severity) -> str:
-    """Map severity to color name for rich markup.
-
-    Parameters
-    ----------
-    severity:
-        Severity level.
-
-    Returns
-    -------
-    str
-        Color name for rich console markup.
-    """
-    if severity.is_critical():
-        return "red"
-    elif severity.is_warning():
-        return "yellow"
-    else:
-        return "green"
-
-
 def get_exit_code_for_severity(severity: Severity) -> int:
     """Map severity to exit code.
 
@@ -449,16 +659,12 @@ def get_exit_code_for_severity(severity: Severity) -> int:
     int
         Exit code: 0=OK, 1=WARNING, 2=CRITICAL.
     """
-    if severity.is_critical():
-        return 2
-    elif severity.is_warning():
-        return 1
-    else:
-        return 0
+    return _SEVERITY_EXIT_CODES[severity]
 
 
 __all__ = [
     "display_check_result_text",
+    "dump_check_result_json",
     "format_bytes_human",
     "format_check_result_json",
     "format_check_result_text",
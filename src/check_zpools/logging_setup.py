@@ -9,6 +9,7 @@ eliminating duplication between module entry (__main__.py) and console script
 Contents
 --------
 * :func:`init_logging` - idempotent logging initialization with layered config.
+* :func:`shutdown_logging` - stop the runtime started here and re-arm :func:`init_logging`.
 * :func:`_build_runtime_config` - constructs RuntimeConfig from layered sources.
 
 System Role
@@ -26,8 +27,8 @@ import lib_log_rich.runtime
 from . import __init__conf__
 from .config import get_config
 
-# Module-level storage for the runtime configuration
-# Set during init_logging() for potential future use
+# Module-level storage for the runtime configuration. Set by init_logging() and
+# cleared by shutdown_logging(); it marks the runtime as ours to shut down.
 _runtime_config: lib_log_rich.runtime.RuntimeConfig | None = None
 
 
@@ -93,8 +94,9 @@ def init_logging() -> None:
     Notes
     -----
     This function is safe to call multiple times. The first call loads .env
-    and initializes the runtime; subsequent calls check the initialization
-    state and return immediately if already initialized.
+    and initializes the runtime; subsequent calls return as long as
+    lib_log_rich reports the runtime as initialised. If the runtime was shut
+    down elsewhere, the next call initializes it again.
 
     The .env loading enables lib_log_rich to read LOG_* environment variables
     from .env files in the current directory or parent directories. This
@@ -104,20 +106,49 @@ def init_logging() -> None:
     lib_log_rich handlers, where each handler applies its own level filtering.
     """
 
-    if not lib_log_rich.runtime.is_initialised():
-        # Intentional module-level singleton cache, guarded by is_initialised() above
-        # so it is written exactly once per process (mirrors get_config's lru_cache).
-        global _runtime_config  # noqa: PLW0603
+    # Intentional module-level singleton cache, written once per init/shutdown
+    # cycle (mirrors get_config's lru_cache).
+    global _runtime_config  # noqa: PLW0603
 
-        # Enable .env file discovery and loading before runtime initialization
-        # This allows LOG_* variables from .env files to override configuration
-        lib_log_rich.config.enable_dotenv()
+    if lib_log_rich.runtime.is_initialised():
+        return
+    # The runtime is down, so any stored config is stale (e.g. someone called
+    # lib_log_rich.runtime.shutdown() directly); drop our claim before re-init.
+    _runtime_config = None
 
-        _runtime_config = _build_runtime_config()
-        lib_log_rich.runtime.init(_runtime_config)
-        lib_log_rich.runtime.attach_std_logging()
+    # Enable .env file discovery and loading before runtime initialization
+    # This allows LOG_* variables from .env files to override configuration
+    lib_log_rich.config.enable_dotenv()
+
+    _runtime_config = _build_runtime_config()
+    lib_log_rich.runtime.init(_runtime_config)
+    lib_log_rich.runtime.attach_std_logging()
+
+
+def shutdown_logging() -> None:
+    """Flush and shut down the lib_log_rich runtime if this module started it.
+
+    Why
+        Entry points tear the runtime down when the CLI exits, but paths such
+        as ``--help`` or argument errors never initialize it, and a runtime set
+        up by an embedding caller is not ours to stop. Clearing the sentinel
+        keeps :func:`init_logging` honest when the CLI is invoked again in the
+        same process (tests, embedding callers).
+
+    Side Effects
+        Resets the module sentinel and shuts down the global runtime when
+        :func:`init_logging` initialized it; otherwise does nothing.
+    """
+
+    global _runtime_config  # noqa: PLW0603
+    if _runtime_config is None:
+        return
+    _runtime_config = None
+    if lib_log_rich.runtime.is_initialised():
+        lib_log_rich.runtime.shutdown()
 
 
 __all__ = [
     "init_logging",
+    "shutdown_logging",
 ]
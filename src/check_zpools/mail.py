@@ -256,7 +256,7 @@ def _normalize_recipients(recipients: str | Sequence[str]) -> str | list[str]:
     return recipients if isinstance(recipients, str) else list(recipients)
 
 
-def _log_email_send_attempt(sender: str, recipients: str | Sequence[str], subject: str, body_html: str, attachments: Sequence[Path] | None) -> None:
+def _log_email_send_attempt(sender: str, recipients: str | Sequence[str], subject: str, body_html: str, attachments: Sequence[Path | str] | None) -> None:
     """Log email send attempt.
 
     Parameters
@@ -334,7 +334,7 @@ def send_email(
     body: str = "",
     body_html: str = "",
     from_address: str | None = None,
-    attachments: Sequence[Path] | None = None,
+    attachments: Sequence[Path | str] | None = None,
 ) -> bool:
     """Send an email using configured SMTP settings.
 
@@ -357,7 +357,7 @@ def send_email(
     from_address:
         Override sender address. Uses config.from_address when None.
     attachments:
-        Optional sequence of file paths to attach.
+        Optional sequence of file paths to attach, as ``Path`` or ``str``.
 
     Returns
     -------
@@ -35,9 +35,9 @@ import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone  # noqa: F401 - timezone used in doctests  # pyright: ignore[reportUnusedImport]
 from enum import Enum
-from functools import lru_cache
+from functools import cached_property, lru_cache
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 logger = logging.getLogger(__name__)
 
@@ -57,7 +57,8 @@ class DaemonConfig(BaseModel):
     Attributes
     ----------
     check_interval_seconds:
-        How often to check pools (default: 300 seconds = 5 minutes).
+        How often to check pools (default: 300 seconds = 5 minutes). Must be
+        at least 1; the daemon schedules cycles in whole intervals.
     pools_to_monitor:
         List of pool names to monitor. Empty means all pools.
     send_ok_emails:
@@ -66,7 +67,7 @@ class DaemonConfig(BaseModel):
         Whether to send emails when issues are resolved (default: True).
     """
 
-    check_interval_seconds: int = 300
+    check_interval_seconds: int = Field(default=300, ge=1)
     pools_to_monitor: list[str] = []
     send_ok_emails: bool = False
     send_recovery_emails: bool = True
@@ -242,23 +243,9 @@ class Severity(str, Enum):
     WARNING = "WARNING"
     CRITICAL = "CRITICAL"
 
-    @lru_cache(maxsize=4)
-    def _order_value(self) -> int:
-        """Return numeric value for ordering comparisons.
-
-        Why Cached
-        ----------
-        Called frequently during severity comparisons (e.g., max() to find highest severity).
-        Only 4 possible enum values, perfect for caching with maxsize=4.
-        Eliminates repeated dict construction and lookup.
-        """
-        order = {
-            Severity.OK: 0,
-            Severity.INFO: 1,
-            Severity.WARNING: 2,
-            Severity.CRITICAL: 3,
-        }
-        return order[self]
+    #: Position in the ordering OK < INFO < WARNING < CRITICAL, assigned to
+    #: each member right after the class is created.
+    _rank: int
 
     def __lt__(self, other: object) -> bool:
         """Compare severity levels for ordering.
@@ -266,6 +253,11 @@ class Severity(str, Enum):
         Why
             Enables finding the highest severity in a collection.
 
+        Why a Stored Rank
+            Ordering stays on the member values' declaration order while
+            ``value`` keeps its string label; every comparison is one
+            attribute read per side instead of a cached method call.
+
         Examples
         --------
         >>> Severity.WARNING < Severity.CRITICAL
@@ -275,25 +267,25 @@ class Severity(str, Enum):
         """
         if not isinstance(other, Severity):
             return NotImplemented
-        return self._order_value() < other._order_value()
+        return self._rank < other._rank
 
     def __le__(self, other: object) -> bool:
         """Less than or equal comparison."""
         if not isinstance(other, Severity):
             return NotImplemented
-        return self._order_value() <= other._order_value()
+        return self._rank <= other._rank
 
     def __gt__(self, other: object) -> bool:
         """Greater than comparison."""
         if not isinstance(other, Severity):
             return NotImplemented
-        return self._order_value() > other._order_value()
+        return self._rank > other._rank
 
     def __ge__(self, other: object) -> bool:
         """Greater than or equal comparison."""
         if not isinstance(other, Severity):
             return NotImplemented
-        return self._order_value() >= other._order_value()
+        return self._rank >= other._rank
 
     @lru_cache(maxsize=4)
     def is_critical(self) -> bool:
@@ -340,6 +332,15 @@ class Severity(str, Enum):
         return self == Severity.WARNING
 
 
+def _assign_severity_ranks() -> None:
+    """Store each Severity member's declaration position as its rank."""
+    for rank, severity in enumerate(Severity):
+        severity._rank = rank
+
+
+_assign_severity_ranks()
+
+
 class DeviceState(str, Enum):
     """ZFS device (vdev) states as reported by zpool status.
 
@@ -573,7 +574,7 @@ class IssueDetails(BaseModel):
     model_config = ConfigDict(extra="allow")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeviceStatus:
     """Status of a single device (vdev) within a ZFS pool.
 
@@ -643,7 +644,7 @@ class DeviceStatus:
         return self.state.is_problematic()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PoolStatus:
     """Complete status snapshot of a single ZFS pool.
 
@@ -740,7 +741,7 @@ class PoolStatus:
         return self.read_errors > 0 or self.write_errors > 0 or self.checksum_errors > 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PoolIssue:
     """Detected issue with a ZFS pool.
 
@@ -841,6 +842,50 @@ class CheckResult:
     issues: list[PoolIssue]
     overall_severity: Severity
 
+    @cached_property
+    def iso_timestamp(self) -> str:
+        """Return the check timestamp in ISO 8601 format.
+
+        Why Cached
+            JSON output and alerts may format the same result more than once;
+            the conversion runs once per result.
+
+        Examples
+        --------
+        >>> result = CheckResult(
+        ...     timestamp=datetime(2025, 1, 15, 10, 30, tzinfo=timezone.utc),
+        ...     pools=[],
+        ...     issues=[],
+        ...     overall_severity=Severity.OK
+        ... )
+        >>> result.iso_timestamp
+        '2025-01-15T10:30:00+00:00'
+        """
+        return self.timestamp.isoformat()
+
+    @cached_property
+    def display_timestamp(self) -> str:
+        """Return the check timestamp as ``YYYY-MM-DD HH:MM:SS`` for text output.
+
+        Why Cached
+            Text and console output both print this header; it is formatted
+            once per result, from the date fields rather than the
+            locale-aware ``strftime``.
+
+        Examples
+        --------
+        >>> result = CheckResult(
+        ...     timestamp=datetime(2025, 1, 15, 10, 30, tzinfo=timezone.utc),
+        ...     pools=[],
+        ...     issues=[],
+        ...     overall_severity=Severity.OK
+        ... )
+        >>> result.display_timestamp
+        '2025-01-15 10:30:00'
+        """
+        ts = self.timestamp
+        return f"{ts.year:04d}-{ts.month:02d}-{ts.day:02d} {ts.hour:02d}:{ts.minute:02d}:{ts.second:02d}"
+
     def has_issues(self) -> bool:
         """Return True if any issues were detected.
 
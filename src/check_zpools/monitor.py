@@ -27,8 +27,10 @@ Architecture Notes
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Final
 
 from .models import (
     CheckResult,
@@ -36,19 +38,44 @@ from .models import (
     DeviceStatus,
     IssueCategory,
     IssueDetails,
-    PoolHealth,  # noqa: F401 - used in doctests  # pyright: ignore[reportUnusedImport]
+    PoolHealth,
     PoolIssue,
     PoolStatus,
     Severity,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
 logger = logging.getLogger(__name__)
 
 #: Upper bound for capacity threshold percentages (0-100 inclusive).
 CAPACITY_PERCENT_MAX = 100
 
+#: Capacity issue messages, filled with (capacity_percent, threshold).
+_CAPACITY_CRITICAL_MESSAGE: Final = "Pool at {:.1f}% capacity (critical threshold: {}%)".format
+_CAPACITY_WARNING_MESSAGE: Final = "Pool at {:.1f}% capacity (warning threshold: {}%)".format
+
+#: Health states sorted once from the PoolHealth predicates, so the per-pool
+#: checks are plain set lookups.
+_HEALTHY_STATES: Final[frozenset[PoolHealth]] = frozenset(health for health in PoolHealth if health.is_healthy())
+_CRITICAL_STATES: Final[frozenset[PoolHealth]] = frozenset(health for health in PoolHealth if health.is_critical())
+
+
+def _log_pool_checked(pool: PoolStatus, issues_found: int) -> None:
+    """Log the per-pool completion record at debug level.
+
+    The extra dict is only worth building when debug records are kept.
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Pool check complete: %s",
+            pool.name,
+            extra={"pool_name": pool.name, "issues_found": issues_found},
+        )
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MonitorConfig:
     """Configuration for pool monitoring thresholds.
 
@@ -137,7 +164,7 @@ class PoolMonitor:
             },
         )
 
-    def check_pool(self, pool: PoolStatus) -> list[PoolIssue]:
+    def check_pool(self, pool: PoolStatus, now: datetime | None = None) -> list[PoolIssue]:
         """Check single pool and return list of detected issues.
 
         Why
@@ -148,6 +175,10 @@ class PoolMonitor:
         ----------
         pool:
             Pool status to check
+        now:
+            Reference time for the scrub age; ``check_all_pools`` passes its
+            timestamp so the clock is read once per pass. Defaults to the
+            current UTC time.
 
         Returns
         -------
@@ -168,42 +199,94 @@ class PoolMonitor:
         >>> len(issues) > 0  # Should have capacity warning
         True
         """
-        issues: list[PoolIssue] = []
-
         logger.debug("Checking pool: %s", pool.name)
+        if now is None:
+            now = datetime.now(timezone.utc)
+
+        issues = list(self._iter_pool_issues(pool, now, self._scrub_cutoff(now)))
+        _log_pool_checked(pool, len(issues))
+        return issues
+
+    def _scrub_cutoff(self, now: datetime) -> datetime | None:
+        """Return the last scrub time that is already too old, or None.
+
+        Why
+            A scrub is stale when its whole-day age exceeds
+            ``scrub_max_age_days``, which holds exactly when it happened at or
+            before ``now - (scrub_max_age_days + 1) days``. Computing that
+            cutoff once per pass turns each pool's age check into one
+            datetime comparison.
+
+        Parameters
+        ----------
+        now:
+            Reference time for the scrub age
+
+        Returns
+        -------
+        datetime | None:
+            The cutoff, or None when scrub age checking is disabled.
+
+        Examples
+        --------
+        >>> monitor = PoolMonitor(MonitorConfig(scrub_max_age_days=30))
+        >>> monitor._scrub_cutoff(datetime(2025, 3, 2, tzinfo=timezone.utc))
+        datetime.datetime(2025, 1, 30, 0, 0, tzinfo=datetime.timezone.utc)
+        >>> PoolMonitor(MonitorConfig(scrub_max_age_days=0))._scrub_cutoff(datetime.now(timezone.utc)) is None
+        True
+        """
+        max_age_days = self.config.scrub_max_age_days
+        if max_age_days <= 0:
+            return None
+        return now - timedelta(days=max_age_days + 1)
+
+    def _iter_pool_issues(self, pool: PoolStatus, now: datetime, scrub_cutoff: datetime | None) -> Iterator[PoolIssue]:
+        """Yield the issues detected for one pool, in check order.
+
+        Why
+            ``check_all_pools`` appends issues straight into its result list,
+            so no per-pool list is built for the many pools without issues.
+
+        Parameters
+        ----------
+        pool:
+            Pool status to check
+        now:
+            Reference time for the scrub age
+        scrub_cutoff:
+            Result of :meth:`_scrub_cutoff` for ``now``
+
+        Yields
+        ------
+        PoolIssue:
+            Health, device, capacity, error and scrub issues.
+        """
+        # Most pools are clean; the individual checks only run for the rest
+        if self._is_clean(pool, scrub_cutoff):
+            return
 
         # Check health state
         health_issue = self._check_health(pool)
         if health_issue:
-            issues.append(health_issue)
+            yield health_issue
 
         # Check for faulted/degraded devices (even if pool is ONLINE)
-        device_issues = self._check_faulted_devices(pool)
-        issues.extend(device_issues)
+        yield from self._check_faulted_devices(pool)
 
         # Check capacity
         capacity_issue = self._check_capacity(pool)
         if capacity_issue:
-            issues.append(capacity_issue)
+            yield capacity_issue
 
         # Check for errors
-        error_issues = self._check_errors(pool)
-        issues.extend(error_issues)
+        yield from self._check_errors(pool)
 
         # Check scrub status
-        scrub_issue = self._check_scrub(pool)
+        scrub_issue = self._check_scrub(pool, now, scrub_cutoff)
         if scrub_issue:
-            issues.append(scrub_issue)
+            yield scrub_issue
 
-        logger.debug(
-            "Pool check complete: %s",
-            pool.name,
-            extra={"pool_name": pool.name, "issues_found": len(issues)},
-        )
-
-        return issues
-
-    def check_all_pools(self, pools: dict[str, PoolStatus]) -> CheckResult:
+    def check_all_pools(self, pools: Mapping[str, PoolStatus] | Iterable[PoolStatus]) -> CheckResult:
         """Check all pools and return aggregated result.
 
         Why
@@ -213,7 +296,8 @@ class PoolMonitor:
         Parameters
         ----------
         pools:
-            Dictionary of pool statuses from parser
+            Pool statuses keyed by name, as returned by the parser, or any
+            iterable of pool statuses. Pools are checked in iteration order.
 
         Returns
         -------
@@ -231,17 +315,20 @@ class PoolMonitor:
         """
         timestamp = datetime.now(timezone.utc)
         all_issues: list[PoolIssue] = []
-        pool_list: list[PoolStatus] = []
-
-        logger.info("Checking %s pools", len(pools))
+        pool_list = list(pools.values()) if isinstance(pools, Mapping) else list(pools)
 
-        for pool_status in pools.values():
-            pool_list.append(pool_status)
-            pool_issues = self.check_pool(pool_status)
-            all_issues.extend(pool_issues)
+        logger.info("Checking %s pools", len(pool_list))
 
-        # Determine overall severity
-        overall_severity = Severity.OK if not all_issues else max(issue.severity for issue in all_issues)
+        # Overall severity is tracked while collecting, in the same pass
+        overall_severity = Severity.OK
+        scrub_cutoff = self._scrub_cutoff(timestamp)
+        for pool_status in pool_list:
+            logger.debug("Checking pool: %s", pool_status.name)
+            issues_before = len(all_issues)
+            for issue in self._iter_pool_issues(pool_status, timestamp, scrub_cutoff):
+                overall_severity = max(overall_severity, issue.severity)
+                all_issues.append(issue)
+            _log_pool_checked(pool_status, len(all_issues) - issues_before)
 
         result = CheckResult(
             timestamp=timestamp,
@@ -253,7 +340,7 @@ class PoolMonitor:
         logger.info(
             "Pool check completed",
             extra={
-                "pools_checked": len(pools),
+                "pools_checked": len(pool_list),
                 "issues_found": len(all_issues),
                 "overall_severity": overall_severity.value,
             },
@@ -261,6 +348,44 @@ class PoolMonitor:
 
         return result
 
+    def _is_clean(self, pool: PoolStatus, scrub_cutoff: datetime | None) -> bool:
+        """Return True if no check can raise an issue for this pool.
+
+        Why
+            The common case is a healthy, lightly filled, error-free pool
+            with a recent scrub. One combined predicate settles it without
+            running every check. A False result only means the full checks
+            must decide.
+
+        Parameters
+        ----------
+        pool:
+            Pool to check
+        scrub_cutoff:
+            Result of :meth:`_scrub_cutoff` for the reference time
+
+        Returns
+        -------
+        bool:
+            True when every individual check would return no issue.
+        """
+        config = self.config
+        if not (
+            pool.health in _HEALTHY_STATES
+            and not pool.faulted_devices
+            and pool.capacity_percent < config.capacity_warning_percent
+            and pool.read_errors < config.read_errors_warning
+            and pool.write_errors < config.write_errors_warning
+            and pool.checksum_errors < config.checksum_errors_warning
+            and pool.scrub_errors <= 0
+        ):
+            return False
+
+        if scrub_cutoff is None:
+            return True
+        last_scrub = pool.last_scrub
+        return last_scrub is not None and last_scrub > scrub_cutoff
+
     def _check_health(self, pool: PoolStatus) -> PoolIssue | None:
         """Check pool health status.
 
@@ -274,24 +399,25 @@ class PoolMonitor:
         PoolIssue | None:
             Issue if pool health is not ONLINE, None otherwise
         """
-        if pool.health.is_healthy():
+        health = pool.health
+        if health in _HEALTHY_STATES:
             return None
 
         # Determine severity based on health state
-        severity = Severity.CRITICAL if pool.health.is_critical() else Severity.WARNING
+        severity = Severity.CRITICAL if health in _CRITICAL_STATES else Severity.WARNING
 
         return PoolIssue(
             pool_name=pool.name,
             severity=severity,
             category=IssueCategory.HEALTH,
-            message=f"Pool is {pool.health.value} (expected: ONLINE)",
+            message=f"Pool is {health.value} (expected: ONLINE)",
             details=IssueDetails(
-                current_state=pool.health.value,
+                current_state=health.value,
                 expected_state="ONLINE",
             ),
         )
 
-    def _check_faulted_devices(self, pool: PoolStatus) -> list[PoolIssue]:
+    def _check_faulted_devices(self, pool: PoolStatus) -> Iterator[PoolIssue]:
         """Check for faulted or degraded devices within the pool.
 
         Why
@@ -305,36 +431,30 @@ class PoolMonitor:
         pool:
             Pool to check
 
-        Returns
-        -------
-        list[PoolIssue]:
-            List of issues for each faulted/degraded device
+        Yields
+        ------
+        PoolIssue:
+            One issue for each faulted/degraded device
         """
-        issues: list[PoolIssue] = []
-
         for device in pool.faulted_devices:
             severity = self._determine_device_severity(device)
             message = self._format_device_message(device)
 
-            issues.append(
-                PoolIssue(
-                    pool_name=pool.name,
-                    severity=severity,
-                    category=IssueCategory.DEVICE,
-                    message=message,
-                    details=IssueDetails(
-                        device_name=device.name,
-                        device_state=device.state.value,
-                        device_type=device.vdev_type,
-                        read_errors=device.read_errors,
-                        write_errors=device.write_errors,
-                        checksum_errors=device.checksum_errors,
-                    ),
-                )
+            yield PoolIssue(
+                pool_name=pool.name,
+                severity=severity,
+                category=IssueCategory.DEVICE,
+                message=message,
+                details=IssueDetails(
+                    device_name=device.name,
+                    device_state=device.state.value,
+                    device_type=device.vdev_type,
+                    read_errors=device.read_errors,
+                    write_errors=device.write_errors,
+                    checksum_errors=device.checksum_errors,
+                ),
             )
 
-        return issues
-
     def _determine_device_severity(self, device: DeviceStatus) -> Severity:
         """Determine severity level for a device issue.
 
@@ -392,37 +512,29 @@ class PoolMonitor:
         PoolIssue | None:
             Issue if capacity exceeds thresholds, None otherwise
         """
-        if pool.capacity_percent >= self.config.capacity_critical_percent:
-            return PoolIssue(
-                pool_name=pool.name,
-                severity=Severity.CRITICAL,
-                category=IssueCategory.CAPACITY,
-                message=f"Pool at {pool.capacity_percent:.1f}% capacity (critical threshold: {self.config.capacity_critical_percent}%)",
-                details=IssueDetails(
-                    capacity_percent=pool.capacity_percent,
-                    threshold=self.config.capacity_critical_percent,
-                    size_bytes=pool.size_bytes,
-                    allocated_bytes=pool.allocated_bytes,
-                    free_bytes=pool.free_bytes,
-                ),
-            )
+        capacity = pool.capacity_percent
+        critical = self.config.capacity_critical_percent
+        if capacity >= critical:
+            severity, threshold, message = Severity.CRITICAL, critical, _CAPACITY_CRITICAL_MESSAGE(capacity, critical)
+        else:
+            warning = self.config.capacity_warning_percent
+            if capacity < warning:
+                return None
+            severity, threshold, message = Severity.WARNING, warning, _CAPACITY_WARNING_MESSAGE(capacity, warning)
 
-        if pool.capacity_percent >= self.config.capacity_warning_percent:
-            return PoolIssue(
-                pool_name=pool.name,
-                severity=Severity.WARNING,
-                category=IssueCategory.CAPACITY,
-                message=f"Pool at {pool.capacity_percent:.1f}% capacity (warning threshold: {self.config.capacity_warning_percent}%)",
-                details=IssueDetails(
-                    capacity_percent=pool.capacity_percent,
-                    threshold=self.config.capacity_warning_percent,
-                    size_bytes=pool.size_bytes,
-                    allocated_bytes=pool.allocated_bytes,
-                    free_bytes=pool.free_bytes,
-                ),
-            )
-
-        return None
+        return PoolIssue(
+            pool_name=pool.name,
+            severity=severity,
+            category=IssueCategory.CAPACITY,
+            message=message,
+            details=IssueDetails(
+                capacity_percent=capacity,
+                threshold=threshold,
+                size_bytes=pool.size_bytes,
+                allocated_bytes=pool.allocated_bytes,
+                free_bytes=pool.free_bytes,
+            ),
+        )
 
     def _create_error_issue(self, pool_name: str, error_type: str, count: int, threshold: int, extra_note: str = "") -> PoolIssue:
         """Create a pool issue for an error condition.
@@ -449,14 +561,15 @@ class PoolMonitor:
         if extra_note:
             message += f" {extra_note}"
 
-        # Build details with the appropriate error field based on error_type
-        details = IssueDetails(threshold=threshold)
+        # Build details once, with the error field matching error_type
         if error_type == "read":
             details = IssueDetails(read_errors=count, threshold=threshold)
         elif error_type == "write":
             details = IssueDetails(write_errors=count, threshold=threshold)
         elif error_type == "checksum":
             details = IssueDetails(checksum_errors=count, threshold=threshold)
+        else:
+            details = IssueDetails(threshold=threshold)
 
         return PoolIssue(
             pool_name=pool_name,
@@ -483,7 +596,7 @@ class PoolMonitor:
         """
         return count > 0 and count >= threshold
 
-    def _check_errors(self, pool: PoolStatus) -> list[PoolIssue]:
+    def _check_errors(self, pool: PoolStatus) -> Iterator[PoolIssue]:
         """Check pool for I/O and checksum errors.
 
         Parameters
@@ -491,42 +604,48 @@ class PoolMonitor:
         pool:
             Pool to check
 
-        Returns
-        -------
-        list[PoolIssue]:
-            List of error-related issues
+        Yields
+        ------
+        PoolIssue:
+            Error-related issues (read, write, checksum)
         """
-        issues: list[PoolIssue] = []
+        config = self.config
 
         # Check read errors
-        if self._check_error_threshold(pool.read_errors, self.config.read_errors_warning):
-            issues.append(self._create_error_issue(pool.name, "read", pool.read_errors, self.config.read_errors_warning))
+        threshold = config.read_errors_warning
+        if self._check_error_threshold(pool.read_errors, threshold):
+            yield self._create_error_issue(pool.name, "read", pool.read_errors, threshold)
 
         # Check write errors
-        if self._check_error_threshold(pool.write_errors, self.config.write_errors_warning):
-            issues.append(self._create_error_issue(pool.name, "write", pool.write_errors, self.config.write_errors_warning))
+        threshold = config.write_errors_warning
+        if self._check_error_threshold(pool.write_errors, threshold):
+            yield self._create_error_issue(pool.name, "write", pool.write_errors, threshold)
 
         # Check checksum errors (more serious)
-        if self._check_error_threshold(pool.checksum_errors, self.config.checksum_errors_warning):
-            issues.append(
-                self._create_error_issue(pool.name, "checksum", pool.checksum_errors, self.config.checksum_errors_warning, "(possible data corruption)")
-            )
-
-        return issues
+        threshold = config.checksum_errors_warning
+        if self._check_error_threshold(pool.checksum_errors, threshold):
+            yield self._create_error_issue(pool.name, "checksum", pool.checksum_errors, threshold, "(possible data corruption)")
 
-    def _check_scrub(self, pool: PoolStatus) -> PoolIssue | None:
+    def _check_scrub(self, pool: PoolStatus, now: datetime, scrub_cutoff: datetime | None) -> PoolIssue | None:
         """Check scrub status and age.
 
         Parameters
         ----------
         pool:
             Pool to check
+        now:
+            Reference time for the reported scrub age
+        scrub_cutoff:
+            Result of :meth:`_scrub_cutoff` for ``now``
 
         Returns
         -------
         PoolIssue | None:
             Issue if scrub is old or has errors, None otherwise
         """
+        # isoformat() runs only in the branch that returns an issue
+        last_scrub = pool.last_scrub
+
         # Check for scrub errors
         if pool.scrub_errors > 0:
             return PoolIssue(
@@ -536,13 +655,13 @@ class PoolMonitor:
                 message=f"Last scrub found {pool.scrub_errors} errors",
                 details=IssueDetails(
                     scrub_errors=pool.scrub_errors,
-                    last_scrub=pool.last_scrub.isoformat() if pool.last_scrub else None,
+                    last_scrub=last_scrub.isoformat() if last_scrub else None,
                 ),
             )
 
-        # Check scrub age (only if scrub_max_age_days > 0)
-        if self.config.scrub_max_age_days > 0:
-            if pool.last_scrub is None:
+        # Check scrub age (disabled when there is no cutoff)
+        if scrub_cutoff is not None:
+            if last_scrub is None:
                 return PoolIssue(
                     pool_name=pool.name,
                     severity=Severity.INFO,
@@ -551,21 +670,19 @@ class PoolMonitor:
                     details=IssueDetails(last_scrub=None),
                 )
 
-            # Calculate age
-            now = datetime.now(timezone.utc)
-            scrub_age = now - pool.last_scrub
-            age_days = scrub_age.days
-
-            if age_days > self.config.scrub_max_age_days:
+            if last_scrub <= scrub_cutoff:
+                # The age is only computed for the message of a stale scrub
+                age_days = (now - last_scrub).days
+                max_age_days = self.config.scrub_max_age_days
                 return PoolIssue(
                     pool_name=pool.name,
                     severity=Severity.INFO,
                     category=IssueCategory.SCRUB,
-                    message=f"Pool scrub is {age_days} days old (max age: {self.config.scrub_max_age_days} days)",
+                    message=f"Pool scrub is {age_days} days old (max age: {max_age_days} days)",
                     details=IssueDetails(
-                        last_scrub=pool.last_scrub.isoformat(),
+                        last_scrub=last_scrub.isoformat(),
                         age_days=age_days,
-                        max_age_days=self.config.scrub_max_age_days,
+                        max_age_days=max_age_days,
                     ),
                 )
 
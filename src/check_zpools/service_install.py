@@ -29,14 +29,14 @@ from __future__ import annotations
 import json
 import logging
 import os
-import platform
 import re
 import shutil
 import subprocess  # nosec B404 - subprocess used safely with list arguments, not shell=True
 import sys
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Final
 
 import rich_click as click
 
@@ -49,6 +49,12 @@ logger = logging.getLogger(__name__)
 SERVICE_NAME = "check_zpools.service"
 SYSTEMD_SYSTEM_DIR = Path("/etc/systemd/system")
 SERVICE_FILE_PATH = SYSTEMD_SYSTEM_DIR / SERVICE_NAME
+#: Symlinks ``systemctl enable`` (persistent, then ``--runtime``) creates for the
+#: unit's ``WantedBy=multi-user.target``.
+SERVICE_WANTS_LINKS = (
+    SYSTEMD_SYSTEM_DIR / "multi-user.target.wants" / SERVICE_NAME,
+    Path("/run/systemd/system/multi-user.target.wants") / SERVICE_NAME,
+)
 
 # Directories that service needs
 CACHE_DIR = Path("/var/cache/check_zpools")
@@ -63,6 +69,59 @@ TIMESTAMP_PARTS_WITH_TIMEZONE = 2
 #: Maximum number of issues listed individually before summarizing the rest.
 MAX_ISSUES_DISPLAYED = 5
 
+#: Systemd unit file, filled by keyword with method, exec_start, cache_dir,
+#: lib_dir and extra_writable_paths. Literal braces are doubled.
+_SERVICE_FILE_TEMPLATE: Final = """[Unit]
+Description=ZFS Pool Monitoring Daemon
+Documentation=https://github.com/bitranox/check_zpools
+After=network-online.target zfs-mount.service zfs-import.target
+Wants=network-online.target zfs-mount.service
+
+[Service]
+Type=simple
+User=root
+Group=root
+
+# Installation method: {method}
+ExecStart={exec_start}
+
+# Restart policy
+Restart=on-failure
+RestartSec=10s
+
+# Resource limits
+MemoryMax=256M
+CPUQuota=10%
+
+# Security hardening
+NoNewPrivileges=true
+PrivateTmp=true
+ProtectSystem=strict
+ReadWritePaths={cache_dir} {lib_dir}{extra_writable_paths}
+ReadOnlyPaths=/etc/check_zpools /etc/xdg/check_zpools
+
+# Logging
+StandardOutput=journal
+StandardError=journal
+SyslogIdentifier=check_zpools
+
+# Environment
+Environment="LOG_CONSOLE_LEVEL=INFO"
+Environment="LOG_ENABLE_JOURNALD=true"
+# This removes the emoji {{level_icon}} from the log format template, so journald logs will show clean text without the Unicode characters.
+Environment="CHECK_ZPOOLS___LIB_LOG_RICH__CONSOLE_FORMAT_TEMPLATE={{timestamp}} {{LEVEL:>8}} {{logger_name}} - {{message}} {{context_fields}}"
+# This forces console output without colors
+Environment="CHECK_ZPOOLS___LIB_LOG_RICH__NO_COLOR=true"
+
+# Graceful shutdown
+TimeoutStopSec=30s
+KillMode=mixed
+KillSignal=SIGTERM
+
+[Install]
+WantedBy=multi-user.target
+""".format
+
 
 def _check_root_privileges() -> None:
     """Verify script is running with root privileges.
@@ -75,7 +134,7 @@ def _check_root_privileges() -> None:
         PermissionError: When not running as root.
         NotImplementedError: On Windows (systemd not supported).
     """
-    if platform.system() == "Windows":
+    if sys.platform == "win32":
         raise NotImplementedError("Systemd service installation is not supported on Windows")
 
     # Use hasattr check for type checker compatibility across platforms
@@ -84,6 +143,28 @@ def _check_root_privileges() -> None:
         raise PermissionError("This command must be run as root (use sudo).\nExample: sudo check_zpools install-service")
 
 
+@lru_cache(maxsize=8)
+def _which(name: str) -> str | None:
+    """Resolve an executable on PATH once per process.
+
+    Why
+        ``shutil.which`` stats a candidate in every PATH directory (times
+        PATHEXT on Windows). PATH does not change during a CLI run, so each
+        name only needs resolving once.
+
+    Parameters
+    ----------
+    name:
+        Executable name to look up.
+
+    Returns
+    -------
+    str | None:
+        Full path as returned by ``shutil.which``, or None if not found.
+    """
+    return shutil.which(name)
+
+
 def _is_uvx_process(cmdline: list[str]) -> bool:
     """Check if command line matches uvx process pattern.
 
@@ -282,14 +363,15 @@ def _find_executable() -> tuple[str, Path, str | None]:
         return ("uvx", uvx_path, uvx_version)
 
     # Not uvx - use the current executable path
-    # Try sys.argv[0] first (the command that was run)
-    if sys.argv[0] and Path(sys.argv[0]).exists():
-        exec_path = Path(sys.argv[0]).resolve()
+    # Try sys.argv[0] first (the command that was run), built as a Path once
+    argv0 = Path(sys.argv[0]) if sys.argv[0] else None
+    if argv0 is not None and argv0.exists():
+        exec_path = argv0.resolve()
         logger.info("Installation method: direct (from sys.argv[0]: %s)", exec_path)
         return ("direct", exec_path, None)
 
     # Fallback: try to find in PATH
-    exec_path_str = shutil.which("check_zpools")
+    exec_path_str = _which("check_zpools")
     if exec_path_str:
         exec_path = Path(exec_path_str).resolve()
         logger.info("Installation method: direct (from PATH: %s)", exec_path)
@@ -311,13 +393,15 @@ def _create_service_directories() -> None:
         Creates /var/cache/check_zpools and /var/lib/check_zpools with
         appropriate permissions (755, owned by root).
     """
-    for directory in [CACHE_DIR, LIB_DIR]:
-        if directory.exists():
+    for directory in (CACHE_DIR, LIB_DIR):
+        # mkdir itself reports an existing directory; no separate stat probe
+        try:
+            directory.mkdir(parents=True, mode=0o755)
+        except FileExistsError:
             logger.debug("Directory already exists: %s", directory)
             continue
 
-        logger.info("Creating directory: %s", directory)
-        directory.mkdir(parents=True, mode=0o755, exist_ok=True)
+        logger.info("Created directory: %s", directory)
 
 
 def _generate_service_file_content(
@@ -355,57 +439,13 @@ def _generate_service_file_content(
         exec_start = f"{executable_path} daemon --foreground"
         extra_writable_paths = ""
 
-    service_content = f"""[Unit]
-Description=ZFS Pool Monitoring Daemon
-Documentation=https://github.com/bitranox/check_zpools
-After=network-online.target zfs-mount.service zfs-import.target
-Wants=network-online.target zfs-mount.service
-
-[Service]
-Type=simple
-User=root
-Group=root
-
-# Installation method: {method}
-ExecStart={exec_start}
-
-# Restart policy
-Restart=on-failure
-RestartSec=10s
-
-# Resource limits
-MemoryMax=256M
-CPUQuota=10%
-
-# Security hardening
-NoNewPrivileges=true
-PrivateTmp=true
-ProtectSystem=strict
-ReadWritePaths={CACHE_DIR} {LIB_DIR}{extra_writable_paths}
-ReadOnlyPaths=/etc/check_zpools /etc/xdg/check_zpools
-
-# Logging
-StandardOutput=journal
-StandardError=journal
-SyslogIdentifier=check_zpools
-
-# Environment
-Environment="LOG_CONSOLE_LEVEL=INFO"
-Environment="LOG_ENABLE_JOURNALD=true"
-# This removes the emoji {{level_icon}} from the log format template, so journald logs will show clean text without the Unicode characters.
-Environment="CHECK_ZPOOLS___LIB_LOG_RICH__CONSOLE_FORMAT_TEMPLATE={{timestamp}} {{LEVEL:>8}} {{logger_name}} - {{message}} {{context_fields}}"
-# This forces console output without colors
-Environment="CHECK_ZPOOLS___LIB_LOG_RICH__NO_COLOR=true"
-
-# Graceful shutdown
-TimeoutStopSec=30s
-KillMode=mixed
-KillSignal=SIGTERM
-
-[Install]
-WantedBy=multi-user.target
-"""
-    return service_content
+    return _SERVICE_FILE_TEMPLATE(
+        method=method,
+        exec_start=exec_start,
+        cache_dir=CACHE_DIR,
+        lib_dir=LIB_DIR,
+        extra_writable_paths=extra_writable_paths,
+    )
 
 
 def _install_service_file(
@@ -425,12 +465,47 @@ def _install_service_file(
         Version specifier for uvx installations (e.g., '@latest', '@1.0.0').
 
     Side Effects
-        Creates {SERVICE_FILE_PATH} with mode 644.
+        Creates {SERVICE_FILE_PATH} with mode 644, atomically replacing any
+        previous unit so a concurrent daemon-reload never reads a partial file.
     """
     content = _generate_service_file_content(executable_path, method, uvx_version)
     logger.info("Installing service file: %s", SERVICE_FILE_PATH)
-    SERVICE_FILE_PATH.write_text(content, encoding="utf-8")
-    SERVICE_FILE_PATH.chmod(0o644)
+    # Write atomically via temp file; without the .service suffix systemd
+    # ignores it while it is being written
+    temp_file = SERVICE_FILE_PATH.with_suffix(".tmp")
+    try:
+        # Open with the final mode so the file is never visible with other bits;
+        # fchmod on the open fd undoes a restrictive umask without a path lookup
+        fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        with os.fdopen(fd, "w", encoding="utf-8") as service_file:
+            os.fchmod(fd, 0o644)
+            service_file.write(content)
+
+        # Atomic rename
+        temp_file.replace(SERVICE_FILE_PATH)
+    except OSError:
+        temp_file.unlink(missing_ok=True)
+        raise
+
+
+def _systemctl_argv(command: list[str]) -> list[str]:
+    """Build the argv for a systemctl command.
+
+    Why
+        Every install, uninstall and status run spawns systemctl several
+        times. Passing the absolute path, resolved once via :func:`_which`,
+        spares each spawn its own PATH search. If systemctl is not on PATH,
+        the bare name is kept so the spawn fails as before.
+
+    Parameters
+    ----------
+    command:
+        Systemctl command arguments (e.g., ["daemon-reload"]).
+
+    Returns
+        Full argument list starting with the systemctl executable.
+    """
+    return [_which("systemctl") or "systemctl", *command]
 
 
 def _run_systemctl(command: list[str], *, check: bool = True) -> subprocess.CompletedProcess[str]:
@@ -449,7 +524,7 @@ def _run_systemctl(command: list[str], *, check: bool = True) -> subprocess.Comp
     Raises
         subprocess.CalledProcessError: When check=True and command fails.
     """
-    full_command = ["systemctl", *command]
+    full_command = _systemctl_argv(command)
     logger.debug("Running: %s", " ".join(full_command))
     return subprocess.run(  # noqa: S603  # nosec B603 - command is hardcoded systemctl with validated args
         full_command,
@@ -499,12 +574,19 @@ def _enable_and_start_service(*, enable: bool, start: bool) -> None:
         Whether to enable service on boot.
     start:
         Whether to start service immediately.
+
+    Notes
+    -----
+    When both are requested, ``systemctl enable --now`` does it in one
+    systemctl call.
     """
-    if enable:
+    if enable and start:
+        logger.info("Enabling service (start on boot) and starting it")
+        _run_systemctl(["enable", "--now", SERVICE_NAME])
+    elif enable:
         logger.info("Enabling service (start on boot)")
         _run_systemctl(["enable", SERVICE_NAME])
-
-    if start:
+    elif start:
         logger.info("Starting service")
         _run_systemctl(["start", SERVICE_NAME])
 
@@ -624,50 +706,58 @@ def _check_service_file_exists() -> bool:
     return False
 
 
-def _run_systemctl_with_logging(action: str) -> None:
+def _run_systemctl_with_logging(action: str, *options: str, description: str | None = None) -> bool:
     """Run systemctl command with automatic error logging.
 
     Parameters
     ----------
     action:
         Systemctl action to perform (e.g., 'stop', 'disable').
+    options:
+        Extra systemctl options placed before the unit name (e.g., '--now').
+    description:
+        What the call does, as a verb phrase for the log messages (e.g.,
+        'stop and disable'). Defaults to ``action``.
+
+    Returns
+    -------
+    bool
+        True if systemctl exited successfully.
 
     Side Effects
         Runs systemctl command and logs warnings on failure.
     """
-    logger.info("%sing service", action.capitalize())
-    result = _run_systemctl([action, SERVICE_NAME], check=False)
+    description = description or action
+    logger.info("Requesting systemctl to %s service", description)
+    result = _run_systemctl([action, *options, SERVICE_NAME], check=False)
     if result.returncode != 0:
-        logger.warning("Failed to %s service: %s", action, result.stderr)
+        logger.warning("Failed to %s service: %s", description, result.stderr)
+        return False
+    return True
 
 
-def _stop_service_if_requested(*, stop: bool) -> None:
-    """Stop service if requested.
+def _stop_and_disable_service(*, stop: bool, disable: bool) -> None:
+    """Stop and/or disable the service as requested.
 
     Parameters
     ----------
     stop:
         Whether to stop the service.
-
-    Side Effects
-        Runs systemctl stop command if stop=True. Logs warnings on failure.
-    """
-    if stop:
-        _run_systemctl_with_logging("stop")
-
-
-def _disable_service_if_requested(*, disable: bool) -> None:
-    """Disable service if requested.
-
-    Parameters
-    ----------
     disable:
         Whether to disable the service.
 
     Side Effects
-        Runs systemctl disable command if disable=True. Logs warnings on failure.
+        Runs ``systemctl disable --now`` when both are requested, otherwise
+        the single requested action. ``disable --now`` only stops the unit
+        after the disable succeeds, so a failed combined call is followed by
+        a separate ``stop``. Logs warnings on failure.
     """
-    if disable:
+    if stop and disable:
+        if not _run_systemctl_with_logging("disable", "--now", description="stop and disable"):
+            _run_systemctl_with_logging("stop")
+    elif stop:
+        _run_systemctl_with_logging("stop")
+    elif disable:
         _run_systemctl_with_logging("disable")
 
 
@@ -739,27 +829,54 @@ def uninstall_service(*, stop: bool = True, disable: bool = True) -> None:
     if not _check_service_file_exists():
         return
 
-    _stop_service_if_requested(stop=stop)
-    _disable_service_if_requested(disable=disable)
+    _stop_and_disable_service(stop=stop, disable=disable)
     _remove_service_file()
 
     logger.info("Service uninstallation complete")
     _print_uninstall_summary()
 
 
-def get_service_status() -> dict[str, bool | str]:
+def _is_service_enabled() -> bool:
+    """Return True if the service is enabled.
+
+    Why
+        Enabling our unit normally just links it into a
+        ``multi-user.target.wants`` directory (its only ``WantedBy``), so an
+        lstat settles the common case without spawning systemctl.
+
+    Returns
+    -------
+    bool:
+        True when a wants link exists under /etc or /run. Otherwise the
+        answer comes from ``systemctl is-enabled``, which also covers
+        aliases, links from other targets and admin overrides.
+    """
+    if any(link.is_symlink() for link in SERVICE_WANTS_LINKS):
+        return True
+    result = _run_systemctl(["is-enabled", SERVICE_NAME], check=False)
+    return result.returncode == 0
+
+
+def get_service_status(*, include_text: bool = False) -> dict[str, bool | str]:
     """Get current status of check_zpools service.
 
     Why
         Provides programmatic access to service state for diagnostics and
         monitoring.
 
+    Parameters
+    ----------
+    include_text:
+        Also fetch the ``systemctl status`` output (default: False). It is
+        the most expensive query, as it reads the journal, so it only runs
+        when asked for.
+
     Returns
         Dictionary with status information:
         - installed: Whether service file exists
         - running: Whether service is currently running
         - enabled: Whether service starts on boot
-        - status_text: Output from systemctl status
+        - status_text: Output from systemctl status, or "" unless include_text
 
     Examples
     --------
@@ -777,17 +894,17 @@ def get_service_status() -> dict[str, bool | str]:
     if not status["installed"]:
         return status
 
+    # Check if service is enabled
+    status["enabled"] = _is_service_enabled()
+
     # Check if service is running
     result = _run_systemctl(["is-active", SERVICE_NAME], check=False)
     status["running"] = result.returncode == 0
 
-    # Check if service is enabled
-    result = _run_systemctl(["is-enabled", SERVICE_NAME], check=False)
-    status["enabled"] = result.returncode == 0
-
-    # Get full status text
-    result = _run_systemctl(["status", SERVICE_NAME], check=False)
-    status["status_text"] = result.stdout
+    # Get full status text (reads the journal, so only on request)
+    if include_text:
+        result = _run_systemctl(["status", SERVICE_NAME], check=False)
+        status["status_text"] = result.stdout
 
     return status
 
@@ -254,6 +254,13 @@ def preserve_traceback_state() -> Iterator[None]:
         _restore_cli_config(snapshot)
 
 
+@pytest.fixture(autouse=True)
+def fresh_email_config_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start every test without email settings parsed by an earlier test."""
+
+    monkeypatch.setattr("check_zpools.cli_email_handlers._email_config_cache", None)
+
+
 @pytest.fixture
 def isolated_traceback_config(monkeypatch: pytest.MonkeyPatch) -> None:
     """Reset traceback flags to a known baseline before each test."""
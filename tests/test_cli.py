@@ -176,6 +176,64 @@ def test_when_main_is_called_it_delegates_to_run_cli(monkeypatch: pytest.MonkeyP
     ]
 
 
+@pytest.mark.os_agnostic
+def test_when_main_receives_a_list_it_is_passed_through_uncopied(monkeypatch: pytest.MonkeyPatch) -> None:
+    ledger: list[CapturedRun] = []
+    monkeypatch.setattr(lib_cli_exit_tools, "run_cli", _capture_run_cli(ledger))
+    argv = ["info"]
+
+    cli_mod.main(argv)
+
+    assert ledger[0].argv is argv
+
+
+@pytest.mark.os_agnostic
+def test_when_main_receives_a_tuple_it_is_copied_into_a_list(monkeypatch: pytest.MonkeyPatch) -> None:
+    ledger: list[CapturedRun] = []
+    monkeypatch.setattr(lib_cli_exit_tools, "run_cli", _capture_run_cli(ledger))
+
+    cli_mod.main(("info",))
+
+    assert ledger[0].argv == ["info"]
+
+
+@pytest.mark.os_agnostic
+def test_when_hello_is_dispatched_directly_it_greets_without_click(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    ledger: list[CapturedRun] = []
+    monkeypatch.setattr(lib_cli_exit_tools, "run_cli", _capture_run_cli(ledger))
+
+    exit_code = cli_mod.dispatch_internal("hello")
+
+    assert exit_code == 0
+    assert "Hello World" in capsys.readouterr().out
+    assert ledger == []
+
+
+@pytest.mark.os_agnostic
+def test_when_dispatched_command_exits_its_code_is_returned(monkeypatch: pytest.MonkeyPatch) -> None:
+    def exit_three() -> None:
+        raise SystemExit(3)
+
+    monkeypatch.setattr(cli_mod, "emit_greeting", exit_three)
+
+    assert cli_mod.dispatch_internal("hello") == 3
+
+
+@pytest.mark.os_agnostic
+def test_when_fail_is_dispatched_directly_the_error_propagates() -> None:
+    with pytest.raises(RuntimeError, match="I should fail"):
+        cli_mod.dispatch_internal("fail")
+
+
+@pytest.mark.os_agnostic
+def test_when_unknown_command_is_dispatched_directly_it_is_rejected() -> None:
+    with pytest.raises(KeyError):
+        cli_mod.dispatch_internal("check")
+
+
 @pytest.mark.os_agnostic
 def test_when_cli_runs_without_arguments_help_is_printed(
     monkeypatch: pytest.MonkeyPatch,
@@ -252,6 +310,94 @@ def test_when_traceback_is_requested_without_command_the_domain_runs(
     assert "Usage:" not in result.output
 
 
+def _record_context_obj(target: list[Any]) -> Callable[[], None]:
+    """Return a greeting stub that records the active Click ``ctx.obj``."""
+    import click
+
+    def _record() -> None:
+        target.append(click.get_current_context().obj)
+
+    return _record
+
+
+@pytest.mark.os_agnostic
+def test_when_traceback_is_passed_explicitly_the_context_remembers_it(
+    monkeypatch: pytest.MonkeyPatch,
+    cli_runner: CliRunner,
+) -> None:
+    seen: list[Any] = []
+    monkeypatch.setattr(cli_mod, "emit_greeting", _record_context_obj(seen))
+
+    result = cli_runner.invoke(cli_mod.cli, ["--no-traceback", "hello"])
+
+    assert result.exit_code == 0
+    assert seen == [{"traceback": False, "traceback_explicit": True}]
+
+
+@pytest.mark.os_agnostic
+def test_when_traceback_is_left_default_the_context_marks_it_implicit(
+    monkeypatch: pytest.MonkeyPatch,
+    cli_runner: CliRunner,
+) -> None:
+    seen: list[Any] = []
+    monkeypatch.setattr(cli_mod, "emit_greeting", _record_context_obj(seen))
+
+    result = cli_runner.invoke(cli_mod.cli, ["hello"], obj={"stale": True})
+
+    assert result.exit_code == 0
+    assert seen == [{"traceback": False, "traceback_explicit": False}]
+
+
+@pytest.mark.os_agnostic
+@pytest.mark.parametrize("argv", [["--help"], ["--version"], []])
+def test_when_nothing_runs_logging_stays_uninitialized(
+    argv: list[str],
+    monkeypatch: pytest.MonkeyPatch,
+    cli_runner: CliRunner,
+) -> None:
+    calls: list[str] = []
+    monkeypatch.setattr(cli_mod, "init_logging", lambda: calls.append("init"))
+
+    result = cli_runner.invoke(cli_mod.cli, argv)
+
+    assert result.exit_code == 0
+    assert calls == []
+
+
+@pytest.mark.os_agnostic
+def test_when_main_only_prints_help_the_runtime_is_not_shut_down(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    import lib_log_rich.runtime
+
+    from check_zpools import logging_setup
+
+    shutdowns: list[str] = []
+    monkeypatch.setattr(logging_setup, "_runtime_config", None)
+    monkeypatch.setattr(lib_log_rich.runtime, "shutdown", lambda: shutdowns.append("shutdown"))
+
+    exit_code = cli_mod.main(["--help"])
+
+    assert exit_code == 0
+    assert "Usage:" in capsys.readouterr().out
+    assert shutdowns == []
+
+
+@pytest.mark.os_agnostic
+def test_when_a_subcommand_runs_logging_is_initialized(
+    monkeypatch: pytest.MonkeyPatch,
+    cli_runner: CliRunner,
+) -> None:
+    calls: list[str] = []
+    monkeypatch.setattr(cli_mod, "init_logging", lambda: calls.append("init"))
+
+    result = cli_runner.invoke(cli_mod.cli, ["hello"])
+
+    assert result.exit_code == 0
+    assert calls == ["init"]
+
+
 @pytest.mark.os_agnostic
 def test_when_traceback_flag_is_passed_the_full_story_is_printed(
     isolated_traceback_config: None,
@@ -270,6 +416,14 @@ def test_when_traceback_flag_is_passed_the_full_story_is_printed(
     assert lib_cli_exit_tools.config.traceback_force_color is False
 
 
+@pytest.mark.os_agnostic
+def test_when_short_help_flag_is_given_to_a_subcommand_help_is_shown(cli_runner: CliRunner) -> None:
+    result: Result = cli_runner.invoke(cli_mod.cli, ["check", "-h"])
+
+    assert result.exit_code == 0
+    assert "Usage:" in result.output
+
+
 @pytest.mark.os_agnostic
 def test_when_hello_is_invoked_the_cli_smiles(cli_runner: CliRunner) -> None:
     result: Result = cli_runner.invoke(cli_mod.cli, ["hello"])
@@ -312,6 +466,14 @@ def test_when_config_is_invoked_with_json_format_it_outputs_json(cli_runner: Cli
     assert "{" in result.output
 
 
+@pytest.mark.os_agnostic
+def test_when_config_format_is_given_in_upper_case_json_is_still_chosen(cli_runner: CliRunner) -> None:
+    result: Result = cli_runner.invoke(cli_mod.cli, ["config", "--format", "JSON"])
+
+    assert result.exit_code == 0
+    assert result.output.lstrip().startswith("{")
+
+
 @pytest.mark.os_agnostic
 def test_when_config_is_invoked_with_nonexistent_section_it_fails(cli_runner: CliRunner) -> None:
     result: Result = cli_runner.invoke(cli_mod.cli, ["config", "--section", "nonexistent_section_that_does_not_exist"])
@@ -866,6 +1028,46 @@ def test_when_send_email_has_attachments_it_sends(
         assert result.exit_code == 0
 
 
+@pytest.mark.os_agnostic
+def test_when_send_email_attachment_is_missing_config_is_not_loaded(
+    cli_runner: CliRunner,
+    tmp_path: Any,
+) -> None:
+    """A missing attachment is rejected by argument parsing, before any config load."""
+    from unittest.mock import patch
+
+    with patch("check_zpools.cli_commands.commands.send_email.get_config") as mock_get_config:
+        result: Result = cli_runner.invoke(
+            cli_mod.cli,
+            [
+                "send-email",
+                "--to",
+                "recipient@test.com",
+                "--subject",
+                "Test",
+                "--body",
+                "See attachment",
+                "--attachment",
+                str(tmp_path / "missing.txt"),
+            ],
+        )
+
+    assert result.exit_code == 2
+    mock_get_config.assert_not_called()
+
+
+@pytest.mark.os_agnostic
+def test_when_send_notification_has_no_recipient_config_is_not_loaded(cli_runner: CliRunner) -> None:
+    """A missing --to is rejected by argument parsing, before any config load."""
+    from unittest.mock import patch
+
+    with patch("check_zpools.cli_commands.commands.send_notification.get_config") as mock_get_config:
+        result: Result = cli_runner.invoke(cli_mod.cli, ["send-notification", "--subject", "Alert", "--message", "Body"])
+
+    assert result.exit_code == 2
+    mock_get_config.assert_not_called()
+
+
 @pytest.mark.os_agnostic
 def test_when_send_email_smtp_fails_it_reports_error(
     cli_runner: CliRunner,
@@ -1005,3 +1207,31 @@ def test_when_send_notification_smtp_fails_it_reports_error(
 
         assert result.exit_code == 1
         assert "Error" in result.output
+
+
+@pytest.mark.os_agnostic
+def test_when_the_cli_is_imported_command_modules_stay_unloaded() -> None:
+    """Command modules are imported on first use, not with the CLI module."""
+    import subprocess
+    import sys
+
+    probe = "import sys, check_zpools.cli; print('check_zpools.service_install' in sys.modules)"
+    completed = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)  # noqa: S603
+
+    assert completed.stdout.strip() == "False"
+
+
+@pytest.mark.os_agnostic
+def test_when_a_command_is_looked_up_it_resolves_to_its_module_function() -> None:
+    from check_zpools.cli_commands import commands
+    from check_zpools.cli_commands.commands.check import check_command
+
+    assert commands.check_command is check_command
+
+
+@pytest.mark.os_agnostic
+def test_when_an_unknown_command_is_looked_up_it_raises_attribute_error() -> None:
+    from check_zpools.cli_commands import commands
+
+    with pytest.raises(AttributeError, match="no_such_command"):
+        getattr(commands, "no_such_command")  # noqa: B009
@@ -146,6 +146,26 @@ class TestCheckCommandSucceedsWithHealthyPools:
             assert len(output_data["pools"]) == 1, "JSON should contain one pool"
             assert output_data["pools"][0]["name"] == "rpool", "JSON should show pool name"
 
+    def test_pretty_flag_indents_json_output(
+        self,
+        cli_runner: CliRunner,
+        ok_check_result: CheckResult,
+    ) -> None:
+        """When checking pools with --pretty, the JSON output is indented.
+
+        Given: A healthy pool
+        When: Running 'check_zpools check --format json --pretty'
+        Then: Output spans several lines and still parses as JSON
+        """
+        with patch("check_zpools.cli_commands.commands.check.check_pools_once") as mock_check:
+            mock_check.return_value = ok_check_result
+
+            result = cli_runner.invoke(cli, ["check", "--format", "json", "--pretty"])
+
+            assert result.exit_code == 0
+            assert result.output.count("\n") > 1, "Pretty JSON should span several lines"
+            assert json.loads(result.output)["overall_severity"] == "OK"
+
     def test_invokes_pool_monitoring_exactly_once(
         self,
         cli_runner: CliRunner,
@@ -298,7 +318,7 @@ class TestSendEmailCommandDeliversAlerts:
         """
         with (
             patch("check_zpools.cli_commands.commands.send_email.send_email") as mock_send,
-            patch("check_zpools.cli_commands.commands.send_email.load_email_config_from_dict") as mock_load,
+            patch("check_zpools.cli_email_handlers.load_email_config_from_dict") as mock_load,
         ):
             mock_config = MagicMock()
             mock_config.smtp_hosts = ["localhost:25"]
@@ -332,7 +352,7 @@ class TestSendEmailCommandDeliversAlerts:
         When: Running 'check_zpools send-email'
         Then: Error message mentions SMTP and exits with code 1
         """
-        with patch("check_zpools.cli_commands.commands.send_email.load_email_config_from_dict") as mock_load:
+        with patch("check_zpools.cli_email_handlers.load_email_config_from_dict") as mock_load:
             mock_config = MagicMock()
             mock_config.smtp_hosts = []
             mock_load.return_value = mock_config
@@ -369,7 +389,7 @@ class TestSendNotificationCommandDeliversSimpleAlerts:
         """
         with (
             patch("check_zpools.cli_commands.commands.send_notification.send_notification") as mock_send,
-            patch("check_zpools.cli_commands.commands.send_notification.load_email_config_from_dict") as mock_load,
+            patch("check_zpools.cli_email_handlers.load_email_config_from_dict") as mock_load,
         ):
             mock_config = MagicMock()
             mock_config.smtp_hosts = ["localhost:25"]
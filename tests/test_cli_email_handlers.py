@@ -19,10 +19,11 @@ Coverage Strategy
 from __future__ import annotations
 
 import logging
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from check_zpools.cli_email_handlers import handle_send_email_error, validate_smtp_configuration
+from check_zpools.cli_email_handlers import echo_error, handle_send_email_error, load_and_validate_email_config, validate_smtp_configuration
 from check_zpools.mail import EmailConfig
 
 # ============================================================================
@@ -53,6 +54,81 @@ class TestSmtpValidationExitsBehavior:
         validate_smtp_configuration(config)
 
 
+# ============================================================================
+# Tests: Plain Error Output
+# ============================================================================
+
+
+class TestEchoError:
+    """echo_error writes one newline-terminated message to stderr."""
+
+    @pytest.mark.os_agnostic
+    def test_writes_message_with_newline_to_stderr(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """The message lands on stderr, followed by a newline, and nothing on stdout."""
+        echo_error("\nError: boom")
+
+        captured = capsys.readouterr()
+        assert captured.err == "\nError: boom\n"
+        assert captured.out == ""
+
+
+# ============================================================================
+# Tests: Loading Email Configuration
+# ============================================================================
+
+
+def _config_with_email(**email: object) -> MagicMock:
+    config = MagicMock()
+    config.as_dict.return_value = {"email": email}
+    return config
+
+
+class TestLoadAndValidateEmailConfig:
+    """Email settings are parsed once per Config instance and always validated."""
+
+    @pytest.mark.os_agnostic
+    def test_returns_parsed_settings(self) -> None:
+        """When the config names an SMTP host, the parsed settings are returned."""
+        config = _config_with_email(smtp_hosts=["smtp.example.com:587"], from_address="alerts@example.com")
+
+        email_config = load_and_validate_email_config(config)
+
+        assert email_config.smtp_hosts == ["smtp.example.com:587"]
+        assert email_config.from_address == "alerts@example.com"
+
+    @pytest.mark.os_agnostic
+    def test_same_config_is_parsed_only_once(self) -> None:
+        """When called twice with the same Config, the second call reuses the result."""
+        config = _config_with_email(smtp_hosts=["smtp.example.com:587"])
+
+        first = load_and_validate_email_config(config)
+        second = load_and_validate_email_config(config)
+
+        assert first is second
+        config.as_dict.assert_called_once_with()
+
+    @pytest.mark.os_agnostic
+    def test_new_config_is_parsed_again(self) -> None:
+        """When a different Config arrives, its own settings are used."""
+        load_and_validate_email_config(_config_with_email(smtp_hosts=["old.example.com"]))
+
+        email_config = load_and_validate_email_config(_config_with_email(smtp_hosts=["new.example.com"]))
+
+        assert email_config.smtp_hosts == ["new.example.com"]
+
+    @pytest.mark.os_agnostic
+    def test_cached_settings_are_still_validated(self) -> None:
+        """When the cached settings lack SMTP hosts, every call exits with code 1."""
+        config = _config_with_email(smtp_hosts=[])
+
+        with patch("check_zpools.cli_email_handlers.echo_error"):
+            for _ in range(2):
+                with pytest.raises(SystemExit):
+                    load_and_validate_email_config(config)
+
+        config.as_dict.assert_called_once_with()
+
+
 # ============================================================================
 # Tests: SMTP Configuration Validation — Stderr Output
 # ============================================================================
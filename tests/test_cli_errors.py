@@ -3,6 +3,7 @@
 Tests cover:
 - ZFS not available error handling
 - Generic error handling
+- Rule-table driven command error handling
 - Exit codes
 - Error message formatting
 - Logging behavior
@@ -16,7 +17,7 @@ import logging
 
 import pytest
 
-from check_zpools.cli_errors import handle_generic_error, handle_zfs_not_available
+from check_zpools.cli_errors import ErrorRule, handle_command_error, handle_generic_error, handle_zfs_not_available
 from check_zpools.zfs_client import ZFSNotAvailableError
 
 # ============================================================================
@@ -229,3 +230,98 @@ class TestGenericErrorHandlesVariousExceptionTypes:
         captured = capsys.readouterr()
         assert "Error:" in captured.err
         assert "Runtime error" in captured.err
+
+
+# ============================================================================
+# Tests: Rule-Table Command Error Handling
+# ============================================================================
+
+_RULES = (
+    ErrorRule(PermissionError, "Permission denied", "Error: denied - {exc}", hint="Hint: try sudo"),
+    ErrorRule(ValueError, "Bad value", "Error: bad - {exc}", with_traceback=True),
+)
+
+
+class TestCommandErrorPicksFirstMatchingRule:
+    """handle_command_error reports the exception with the first matching rule."""
+
+    @pytest.mark.os_agnostic
+    def test_matching_rule_message_and_hint_reach_stderr(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """When a rule matches, its formatted message and hint are shown."""
+        with pytest.raises(SystemExit) as excinfo:
+            handle_command_error(PermissionError("no access"), _RULES)
+
+        assert excinfo.value.code == 1
+        err = capsys.readouterr().err
+        assert "Error: denied - no access" in err
+        assert "Hint: try sudo" in err
+
+    @pytest.mark.os_agnostic
+    def test_subclass_matches_parent_rule(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Rules match with isinstance, so subclasses use the parent's rule."""
+        with pytest.raises(SystemExit):
+            handle_command_error(UnicodeError("odd bytes"), _RULES)
+
+        assert "Error: bad - odd bytes" in capsys.readouterr().err
+
+    @pytest.mark.os_agnostic
+    def test_unmatched_exception_is_reported_as_unexpected(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """When no rule matches, a generic unexpected-error message is shown."""
+        with pytest.raises(SystemExit):
+            handle_command_error(KeyError("missing"), _RULES)
+
+        assert "Error: Unexpected error - 'missing'" in capsys.readouterr().err
+
+
+class TestCommandErrorLogging:
+    """handle_command_error logs the rule's message with error details."""
+
+    @pytest.mark.os_agnostic
+    def test_log_record_carries_error_details(self, caplog: pytest.LogCaptureFixture) -> None:
+        """The log record holds the error text and exception type name."""
+        with caplog.at_level(logging.ERROR), pytest.raises(SystemExit):
+            handle_command_error(PermissionError("no access"), _RULES)
+
+        record = next(r for r in caplog.records if r.message == "Permission denied")
+        assert record.__dict__["error"] == "no access"
+        assert record.__dict__["error_type"] == "PermissionError"
+        assert not record.exc_info
+
+    @pytest.mark.os_agnostic
+    def test_traceback_rule_attaches_exception_info(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Rules with with_traceback=True attach the active traceback."""
+        with caplog.at_level(logging.ERROR), pytest.raises(SystemExit):
+            try:
+                raise ValueError("broken")
+            except ValueError as exc:
+                handle_command_error(exc, _RULES)
+
+        record = next(r for r in caplog.records if r.message == "Bad value")
+        assert record.exc_info is not None
+
+
+class _CountingError(PermissionError):
+    """Permission error that counts how often it is stringified."""
+
+    def __init__(self) -> None:
+        super().__init__("counted")
+        self.str_calls = 0
+
+    def __str__(self) -> str:
+        self.str_calls += 1
+        return "counted"
+
+
+class TestCommandErrorStringifiesOnce:
+    """handle_command_error renders the exception text once and reuses it."""
+
+    @pytest.mark.os_agnostic
+    def test_log_and_stderr_share_one_rendering(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """The log record and the stderr message use a single str(exc)."""
+        exc = _CountingError()
+
+        with pytest.raises(SystemExit):
+            handle_command_error(exc, _RULES)
+
+        assert exc.str_calls == 1
+        assert "Error: denied - counted" in capsys.readouterr().err
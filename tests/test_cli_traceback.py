@@ -51,6 +51,34 @@ class TestApplyTracebackPreferencesEnablesBothFlags:
         assert bool(lib_cli_exit_tools.config.traceback) is False
         assert bool(lib_cli_exit_tools.config.traceback_force_color) is False
 
+    @pytest.mark.os_agnostic
+    @pytest.mark.usefixtures("isolated_traceback_config")
+    def test_unchanged_preference_leaves_config_untouched(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """When both flags already match, no attribute is written."""
+        writes: list[str] = []
+        config_type = type(lib_cli_exit_tools.config)
+
+        def record_write(instance: object, name: str, value: object) -> None:
+            writes.append(name)
+            object.__setattr__(instance, name, value)
+
+        monkeypatch.setattr(config_type, "__setattr__", record_write)
+
+        apply_traceback_preferences(enabled=False)
+
+        assert writes == []
+
+    @pytest.mark.os_agnostic
+    @pytest.mark.usefixtures("isolated_traceback_config")
+    def test_mixed_flags_are_synchronized(self) -> None:
+        """A traceback/force_color mismatch is resolved to the requested value."""
+        lib_cli_exit_tools.config.traceback = True
+        lib_cli_exit_tools.config.traceback_force_color = False
+
+        apply_traceback_preferences(enabled=True)
+
+        assert lib_cli_exit_tools.config.traceback_force_color is True
+
 
 # ============================================================================
 # Tests: snapshot_traceback_state
@@ -69,6 +97,32 @@ class TestSnapshotTracebackStateCapturesCurrentFlags:
         assert isinstance(state, tuple)
         assert len(state) == 2
 
+    @pytest.mark.os_agnostic
+    @pytest.mark.usefixtures("isolated_traceback_config")
+    def test_fields_are_readable_by_name(self) -> None:
+        """The snapshot exposes traceback and force_color as named fields."""
+        apply_traceback_preferences(enabled=True)
+
+        state = snapshot_traceback_state()
+
+        assert state.traceback is True
+        assert state.force_color is True
+
+    @pytest.mark.os_agnostic
+    @pytest.mark.usefixtures("isolated_traceback_config")
+    def test_repeated_snapshots_share_one_instance(self) -> None:
+        """Snapshots of the same state reuse a preallocated tuple."""
+        assert snapshot_traceback_state() is snapshot_traceback_state()
+
+    @pytest.mark.os_agnostic
+    @pytest.mark.usefixtures("isolated_traceback_config")
+    def test_mixed_flags_are_captured_exactly(self) -> None:
+        """A traceback/force_color mismatch is preserved in the snapshot."""
+        lib_cli_exit_tools.config.traceback = True
+        lib_cli_exit_tools.config.traceback_force_color = False
+
+        assert snapshot_traceback_state() == (True, False)
+
     @pytest.mark.os_agnostic
     @pytest.mark.usefixtures("isolated_traceback_config")
     def test_captures_disabled_state(self) -> None:
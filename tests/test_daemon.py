@@ -33,6 +33,7 @@ from datetime import datetime, timezone
 from unittest.mock import Mock
 
 import pytest
+from pydantic import ValidationError
 
 from check_zpools.daemon import ZPoolDaemon
 from check_zpools.models import CheckResult, DaemonConfig, IssueCategory, IssueDetails, PoolIssue, PoolStatus, Severity
@@ -388,6 +389,15 @@ class TestDaemonInitializationStoresComponents:
 
         assert daemon.state_manager == mock_state_manager
 
+    def test_stores_state_in_slots(self, daemon: ZPoolDaemon) -> None:
+        """Daemon instances keep their state in slots, not a per-instance dict.
+
+        Given: A constructed daemon
+        When: Inspecting the instance
+        Then: It has no __dict__
+        """
+        assert not hasattr(daemon, "__dict__")
+
 
 @pytest.mark.os_agnostic
 class TestDaemonInitializationAppliesConfiguration:
@@ -439,6 +449,42 @@ class TestDaemonInitializationAppliesConfiguration:
 
         assert daemon.check_interval == 300
 
+    @pytest.mark.parametrize("interval", [0, -5])
+    def test_rejects_check_interval_below_one_second(self, interval: int) -> None:
+        """When config specifies a non-positive check interval, validation fails.
+
+        Given: Config with check_interval_seconds of 0 or below
+        When: Building the DaemonConfig
+        Then: ValidationError is raised before any daemon loop can start
+        """
+        with pytest.raises(ValidationError, match="check_interval_seconds"):
+            DaemonConfig(check_interval_seconds=interval)
+
+    def test_filters_check_cycle_to_configured_pools(
+        self,
+        mock_zfs_client: Mock,
+        mock_monitor: Mock,
+        mock_alerter: Mock,
+        mock_state_manager: Mock,
+    ) -> None:
+        """When config names pools to monitor, only those reach the monitor.
+
+        Given: Config monitoring only 'tank' while ZFS reports 'rpool'
+        When: Running _run_check_cycle
+        Then: Monitor is not called because no monitored pool exists
+        """
+        daemon = ZPoolDaemon(
+            zfs_client=mock_zfs_client,
+            monitor=mock_monitor,
+            alerter=mock_alerter,
+            state_manager=mock_state_manager,
+            config=DaemonConfig(pools_to_monitor=["tank"]),
+        )
+
+        daemon._run_check_cycle()
+
+        mock_monitor.check_all_pools.assert_not_called()
+
 
 # =============================================================================
 # Check Cycle Tests - Data Orchestration
@@ -635,6 +681,41 @@ class TestAlertHandlingSendsAlertsForNewIssues:
         call_args = mock_alerter.send_alert.call_args[0]
         assert call_args[1].name == "rpool"
 
+    def test_skips_alert_when_pool_status_is_missing(
+        self,
+        *,
+        daemon: ZPoolDaemon,
+        mock_alerter: Mock,
+        mock_state_manager: Mock,
+        mock_monitor: Mock,
+        healthy_pool_status: PoolStatus,
+    ) -> None:
+        """When an issue names a pool ZFS did not report, no alert is sent.
+
+        Given: Issue for 'tank' while ZFS only reports 'rpool'
+        When: Running _run_check_cycle
+        Then: send_alert is not called
+        """
+        mock_monitor.check_all_pools.return_value = CheckResult(
+            timestamp=datetime.now(timezone.utc),
+            pools=[healthy_pool_status],
+            issues=[
+                PoolIssue(
+                    pool_name="tank",
+                    severity=Severity.WARNING,
+                    category=IssueCategory.CAPACITY,
+                    message="Pool at 85.0% capacity",
+                    details=IssueDetails(),
+                )
+            ],
+            overall_severity=Severity.WARNING,
+        )
+        mock_state_manager.should_alert.return_value = True
+
+        daemon._run_check_cycle()
+
+        mock_alerter.send_alert.assert_not_called()
+
 
 @pytest.mark.os_agnostic
 class TestAlertHandlingRecordsNewIssues:
@@ -780,6 +861,32 @@ class TestRecoveryDetectionSendsNotifications:
 
         mock_alerter.send_recovery.assert_called_once()
 
+    def test_sends_no_recovery_when_nothing_was_open(
+        self,
+        *,
+        daemon: ZPoolDaemon,
+        mock_alerter: Mock,
+        mock_monitor: Mock,
+        healthy_pool_status: PoolStatus,
+    ) -> None:
+        """When consecutive cycles are healthy, no recovery is sent.
+
+        Given: Two cycles without issues
+        When: Running check cycles
+        Then: send_recovery is never called
+        """
+        mock_monitor.check_all_pools.return_value = CheckResult(
+            timestamp=datetime.now(timezone.utc),
+            pools=[healthy_pool_status],
+            issues=[],
+            overall_severity=Severity.OK,
+        )
+
+        daemon._run_check_cycle()
+        daemon._run_check_cycle()
+
+        mock_alerter.send_recovery.assert_not_called()
+
     def test_recovery_includes_pool_name(
         self,
         *,
@@ -1047,6 +1154,53 @@ class TestMonitoringLoopExecutesCycles:
 
         assert mock_monitor.check_all_pools.call_count >= 1
 
+    def test_waits_only_for_the_rest_of_the_interval(self, daemon: ZPoolDaemon, monkeypatch: pytest.MonkeyPatch) -> None:
+        """When a cycle takes time, the following wait is shortened by it.
+
+        Given: Daemon with 1-second interval whose first cycle takes 0.4s
+        When: Loop runs one cycle
+        Then: The wait is 0.6s
+        """
+        monkeypatch.setattr("check_zpools.daemon.time.monotonic", Mock(side_effect=[100.0, 100.4]))
+        monkeypatch.setattr(ZPoolDaemon, "_run_check_cycle", Mock())
+        daemon.shutdown_event = Mock(is_set=Mock(side_effect=[False, True]))
+
+        daemon._run_monitoring_loop()
+
+        timeouts = [call.kwargs["timeout"] for call in daemon.shutdown_event.wait.call_args_list]
+        assert timeouts == pytest.approx([0.6])
+
+    @pytest.mark.parametrize(
+        ("cycle_ends", "expected_timeouts"),
+        [
+            ([100.4, 102.5], [0.6, 0.5]),  # second cycle overruns its slot by 0.5s
+            ([100.4, 105.0], [0.6, 1.0]),  # overrun ending exactly on a slot waits a full slot
+            ([103.7], [0.3]),  # first cycle hangs across several slots
+        ],
+    )
+    def test_overrunning_cycle_waits_for_the_next_future_slot(
+        self,
+        daemon: ZPoolDaemon,
+        monkeypatch: pytest.MonkeyPatch,
+        cycle_ends: list[float],
+        expected_timeouts: list[float],
+    ) -> None:
+        """When a cycle runs past its interval, the next one is not started at once.
+
+        Given: Daemon with 1-second interval on a schedule starting at t=100
+        When: A cycle ends after its slot has passed
+        Then: The wait runs to the next future slot and is never zero
+        """
+        monkeypatch.setattr("check_zpools.daemon.time.monotonic", Mock(side_effect=[100.0, *cycle_ends]))
+        monkeypatch.setattr(ZPoolDaemon, "_run_check_cycle", Mock())
+        daemon.shutdown_event = Mock(is_set=Mock(side_effect=[*([False] * len(cycle_ends)), True]))
+
+        daemon._run_monitoring_loop()
+
+        timeouts = [call.kwargs["timeout"] for call in daemon.shutdown_event.wait.call_args_list]
+        assert timeouts == pytest.approx(expected_timeouts)
+        assert all(timeout > 0 for timeout in timeouts)
+
     def test_continues_after_transient_errors(self, daemon: ZPoolDaemon, mock_zfs_client: Mock, healthy_pool_json: dict) -> None:
         """When check cycle encounters error, loop continues.
 
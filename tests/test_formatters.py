@@ -14,6 +14,7 @@ from __future__ import annotations
 import json
 from datetime import datetime, timezone
 from io import StringIO
+from unittest.mock import patch
 
 import pytest
 
@@ -22,8 +23,11 @@ from conftest import a_healthy_pool_named, a_pool_with
 from rich.console import Console
 
 from check_zpools.formatters import (
+    _check_result_to_dict,
     _format_last_scrub,
+    _json_default,
     display_check_result_text,
+    dump_check_result_json,
     format_check_result_json,
     format_check_result_text,
     get_exit_code_for_severity,
@@ -291,28 +295,113 @@ class TestJsonFormattingWithMultipleEntities:
 
 
 class TestJsonFormattingStyle:
-    """JSON formatter produces human-readable pretty-printed output."""
+    """JSON formatter is compact by default and pretty-prints on request."""
+
+    @pytest.mark.os_agnostic
+    def test_json_output_is_compact_by_default(self) -> None:
+        """When formatting without pretty,
+        the JSON has no newlines and no separator whitespace."""
+        result = a_check_result_with_warning()
+
+        json_output = format_check_result_json(result)
+
+        assert "\n" not in json_output
+        assert json_output == json.dumps(json.loads(json_output), separators=(",", ":"))
 
     @pytest.mark.os_agnostic
     def test_json_output_is_pretty_printed_with_newlines(self) -> None:
-        """When formatting any result,
+        """When formatting with pretty,
         the JSON is pretty-printed with newlines."""
         result = a_check_result_with_no_issues()
 
-        json_output = format_check_result_json(result)
+        json_output = format_check_result_json(result, pretty=True)
 
         assert "\n" in json_output
 
     @pytest.mark.os_agnostic
     def test_json_output_uses_two_space_indentation(self) -> None:
-        """When formatting any result,
+        """When formatting with pretty,
         the JSON uses 2-space indentation."""
         result = a_check_result_with_no_issues()
 
-        json_output = format_check_result_json(result)
+        json_output = format_check_result_json(result, pretty=True)
 
         assert "  " in json_output
 
+    @pytest.mark.os_agnostic
+    def test_json_layout_matches_stdlib_indent(self) -> None:
+        """When formatting with pretty,
+        the layout is byte-for-byte what json.dumps(indent=2) produces."""
+        result = a_check_result_with_warning()
+
+        json_output = format_check_result_json(result, pretty=True)
+
+        assert json_output == json.dumps(json.loads(json_output), indent=2)
+
+    @pytest.mark.os_agnostic
+    def test_non_ascii_is_written_as_utf8(self) -> None:
+        """When a pool name contains non-ASCII characters,
+        the JSON carries them unescaped and still parses to the same name."""
+        result = CheckResult(
+            timestamp=datetime(2025, 1, 15, 10, 30, 0, tzinfo=timezone.utc),
+            pools=[a_healthy_pool_named("tänk")],
+            issues=[],
+            overall_severity=Severity.OK,
+        )
+
+        json_output = format_check_result_json(result)
+
+        assert '"tänk"' in json_output
+        assert "\\u00e4" not in json_output
+        assert json.loads(json_output)["pools"][0]["name"] == "tänk"
+
+
+class TestDumpCheckResultJson:
+    """dump_check_result_json() writes the JSON document straight to a stream."""
+
+    @pytest.mark.os_agnostic
+    def test_writes_formatted_json_and_newline(self) -> None:
+        """When dumping to a stream,
+        the stream receives the formatted JSON followed by one newline."""
+        result = a_check_result_with_warning()
+        buffer = StringIO()
+
+        dump_check_result_json(result, buffer)
+
+        assert buffer.getvalue() == format_check_result_json(result) + "\n"
+
+    @pytest.mark.os_agnostic
+    def test_pretty_output_matches_pretty_format(self) -> None:
+        """When dumping with pretty,
+        the stream receives the indented document."""
+        result = a_check_result_with_warning()
+        buffer = StringIO()
+
+        dump_check_result_json(result, buffer, pretty=True)
+
+        assert buffer.getvalue() == format_check_result_json(result, pretty=True) + "\n"
+
+
+class TestJsonDefaultHook:
+    """_json_default() converts pools and issues for the encoder."""
+
+    @pytest.mark.os_agnostic
+    def test_stdlib_encoder_with_hook_matches_formatter(self) -> None:
+        """When the stdlib encoder uses the hook,
+        the document equals format_check_result_json's pretty output."""
+        result = a_check_result_with_warning()
+
+        encoded = json.dumps(_check_result_to_dict(result), indent=2, default=_json_default)
+
+        assert encoded == format_check_result_json(result, pretty=True)
+
+    @pytest.mark.os_agnostic
+    def test_unknown_type_raises_type_error(self) -> None:
+        """When the payload holds an unsupported object,
+        the hook raises TypeError like the encoders do."""
+        with pytest.raises(TypeError, match="object"):
+            _json_default(object())
+
 
 # ============================================================================
 # Tests: Text Formatting
@@ -386,6 +475,17 @@ class TestTextFormattingWithWarningIssues:
 
         assert "Overall Status: WARNING" in text
 
+    @pytest.mark.os_agnostic
+    def test_empty_result_omits_table_placeholder(self) -> None:
+        """When no pools were checked,
+        the text has no table placeholder and reports zero pools."""
+        result = CheckResult(timestamp=datetime.now(timezone.utc), pools=[], issues=[], overall_severity=Severity.OK)
+
+        text = format_check_result_text(result)
+
+        assert "__TABLE_PLACEHOLDER__" not in text
+        assert text.endswith("Pools Checked: 0")
+
     @pytest.mark.os_agnostic
     def test_warning_result_shows_issues_found_section(self) -> None:
         """When formatting a warning result as text,
@@ -871,6 +971,129 @@ class TestDisplayCheckResultTextWithMultiplePools:
         assert "Pools Checked: 2" in output
 
 
+class TestDisplayCheckResultTextTerminalDetection:
+    """display_check_result_text() picks the table renderer from the console type."""
+
+    @pytest.mark.os_agnostic
+    def test_non_terminal_output_uses_plain_table(self) -> None:
+        """When the console is not a terminal,
+        the pool table is written without box-drawing characters."""
+        result = a_check_result_with_no_issues()
+        buffer = StringIO()
+        console = Console(file=buffer, legacy_windows=False)
+
+        display_check_result_text(result, console)
+        output = buffer.getvalue()
+
+        assert "Pool   Health  Devices  Capacity" in output
+        assert "\u2502" not in output
+        assert "\x1b[" not in output
+
+    @pytest.mark.os_agnostic
+    def test_report_is_printed_in_one_call(self) -> None:
+        """When displaying a result with issues,
+        the whole report goes through a single console.print call."""
+        result = a_check_result_with_warning()
+        console = Console(file=StringIO(), force_terminal=True, legacy_windows=False)
+
+        with patch.object(console, "print", wraps=console.print) as spy:
+            display_check_result_text(result, console)
+
+        assert spy.call_count == 1
+
+    @pytest.mark.os_agnostic
+    def test_plain_table_lines_wider_than_console_are_kept_whole(self) -> None:
+        """When a plain table row exceeds the console width,
+        it is neither wrapped nor cropped."""
+        long_name = "p" * 90
+        result = CheckResult(timestamp=datetime.now(timezone.utc), pools=[a_pool_with(name=long_name)], issues=[], overall_severity=Severity.OK)
+        buffer = StringIO()
+        console = Console(file=buffer, width=80, legacy_windows=False)
+
+        display_check_result_text(result, console)
+
+        assert any(line.startswith(long_name) and line.endswith("Never") for line in buffer.getvalue().splitlines())
+
+    @pytest.mark.os_agnostic
+    def test_terminal_output_uses_rich_table(self) -> None:
+        """When the console is a terminal,
+        the pool table is rendered by Rich with box-drawing characters."""
+        result = a_check_result_with_no_issues()
+        buffer = StringIO()
+        console = Console(file=buffer, force_terminal=True, width=120, legacy_windows=False)
+
+        display_check_result_text(result, console)
+        output = buffer.getvalue()
+
+        assert "\u2502" in output
+        assert "rpool" in output
+
+    @pytest.mark.os_agnostic
+    def test_consecutive_tables_do_not_share_rows(self) -> None:
+        """When two results are displayed one after another,
+        the second table shows only its own pools."""
+        first = CheckResult(timestamp=datetime.now(timezone.utc), pools=[a_pool_with(name="alpha")], issues=[], overall_severity=Severity.OK)
+        second = CheckResult(timestamp=datetime.now(timezone.utc), pools=[a_pool_with(name="beta")], issues=[], overall_severity=Severity.OK)
+        display_check_result_text(first, Console(file=StringIO(), force_terminal=True, legacy_windows=False))
+        buffer = StringIO()
+
+        display_check_result_text(second, Console(file=buffer, force_terminal=True, width=120, legacy_windows=False))
+
+        assert "beta" in buffer.getvalue()
+        assert "alpha" not in buffer.getvalue()
+
+    @pytest.mark.os_agnostic
+    def test_terminal_table_does_not_parse_pool_names_as_markup(self) -> None:
+        """When a pool name contains square brackets,
+        the Rich table shows it literally."""
+        pool = a_pool_with(name="[bold]tank")
+        result = CheckResult(timestamp=datetime.now(timezone.utc), pools=[pool], issues=[], overall_severity=Severity.OK)
+        buffer = StringIO()
+        console = Console(file=buffer, force_terminal=True, width=120, legacy_windows=False)
+
+        display_check_result_text(result, console)
+
+        assert "[bold]tank" in buffer.getvalue()
+
+
+class TestDisplayCheckResultTextWithoutPools:
+    """display_check_result_text() reports an empty check without a table."""
+
+    @pytest.mark.os_agnostic
+    def test_empty_check_prints_summary_without_table(self) -> None:
+        """When no pools were checked,
+        the header and a zero count appear but no table is built."""
+        result = CheckResult(timestamp=datetime(2025, 1, 15, 10, 30, tzinfo=timezone.utc), pools=[], issues=[], overall_severity=Severity.OK)
+        buffer = StringIO()
+        console = Console(file=buffer, force_terminal=True, legacy_windows=False)
+
+        with patch("check_zpools.formatters._build_pool_status_table") as mock_table:
+            display_check_result_text(result, console)
+
+        output = buffer.getvalue()
+        mock_table.assert_not_called()
+        assert "ZFS Pool Check - 2025-01-15 10:30:00" in output
+        assert "No pools found" in output
+        assert "Pools Checked: 0" in output
+
+
+class TestDisplayCheckResultTextReadsClockOnce:
+    """display_check_result_text() shares one reference time across all rows."""
+
+    @pytest.mark.os_agnostic
+    def test_clock_is_read_once_for_many_pools(self) -> None:
+        """When several pools are displayed,
+        the current time is taken once for the whole table."""
+        pools = [a_pool_with(name=f"pool{index}", last_scrub=datetime(2025, 1, index + 1, tzinfo=timezone.utc)) for index in range(5)]
+        result = CheckResult(timestamp=datetime.now(timezone.utc), pools=pools, issues=[], overall_severity=Severity.OK)
+        console = Console(file=StringIO(), legacy_windows=False)
+
+        with patch("check_zpools.formatters.datetime", wraps=datetime) as mock_datetime:
+            display_check_result_text(result, console)
+
+        assert mock_datetime.now.call_count == 1
+
+
 class TestDisplayCheckResultTextDefaultConsole:
     """display_check_result_text() creates default console when none provided."""
 
@@ -890,6 +1113,21 @@ class TestDisplayCheckResultTextDefaultConsole:
 
         assert success
 
+    @pytest.mark.os_agnostic
+    def test_output_follows_replaced_stdout(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """When sys.stdout is swapped between calls,
+        each call writes to the stream that is current at call time."""
+        result = a_check_result_with_no_issues()
+        first, second = StringIO(), StringIO()
+
+        monkeypatch.setattr("sys.stdout", first)
+        display_check_result_text(result)
+        monkeypatch.setattr("sys.stdout", second)
+        display_check_result_text(result)
+
+        assert "ZFS Pool Check" in first.getvalue()
+        assert first.getvalue() == second.getvalue()
+
 
 # ============================================================================
 # Test _format_last_scrub Helper Function
@@ -1093,3 +1331,23 @@ class TestFormatLastScrub:
 
         assert text == "2mo ago"
         assert color == "red"
+
+    @pytest.mark.os_agnostic
+    def test_uses_the_given_reference_time(self) -> None:
+        """When a reference time is passed,
+        the age is measured against it rather than the clock."""
+        now = datetime(2025, 3, 1, tzinfo=timezone.utc)
+
+        text, color = _format_last_scrub(datetime(2025, 2, 28, tzinfo=timezone.utc), now)
+
+        assert (text, color) == ("Yesterday", "green")
+
+    @pytest.mark.os_agnostic
+    def test_future_scrub_from_clock_skew_reports_negative_days(self) -> None:
+        """When last_scrub lies after the reference time,
+        the negative age is shown in green."""
+        now = datetime(2025, 3, 1, tzinfo=timezone.utc)
+
+        text, color = _format_last_scrub(datetime(2025, 3, 3, tzinfo=timezone.utc), now)
+
+        assert (text, color) == ("-2d ago", "green")
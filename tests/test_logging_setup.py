@@ -3,6 +3,7 @@
 This module validates:
 - _build_runtime_config constructs RuntimeConfig with correct defaults
 - init_logging is idempotent (only initializes once)
+- shutdown_logging tears down the runtime and re-arms init_logging
 - Configuration values flow from layered config to RuntimeConfig
 
 All tests mock lib_log_rich to avoid side effects on the global logging state.
@@ -122,6 +123,7 @@ class TestInitLoggingIsIdempotent:
         mock_runtime_config = MagicMock()
 
         with (
+            patch("check_zpools.logging_setup._runtime_config", None),
             patch("check_zpools.logging_setup.lib_log_rich.runtime.is_initialised", return_value=False),
             patch("check_zpools.logging_setup.lib_log_rich.config.enable_dotenv"),
             patch("check_zpools.logging_setup._build_runtime_config", return_value=mock_runtime_config),
@@ -134,6 +136,65 @@ class TestInitLoggingIsIdempotent:
 
             mock_init.assert_called_once_with(mock_runtime_config)
 
+    @pytest.mark.os_agnostic
+    def test_reinitializes_after_external_shutdown(self) -> None:
+        """A runtime stopped outside shutdown_logging() is started again."""
+        from check_zpools import logging_setup
+
+        mock_runtime_config = MagicMock()
+
+        with (
+            patch("check_zpools.logging_setup._runtime_config", MagicMock()),
+            patch("check_zpools.logging_setup.lib_log_rich.runtime.is_initialised", return_value=False),
+            patch("check_zpools.logging_setup.lib_log_rich.config.enable_dotenv"),
+            patch("check_zpools.logging_setup._build_runtime_config", return_value=mock_runtime_config),
+            patch("check_zpools.logging_setup.lib_log_rich.runtime.init") as mock_init,
+            patch("check_zpools.logging_setup.lib_log_rich.runtime.attach_std_logging"),
+        ):
+            logging_setup.init_logging()
+
+            mock_init.assert_called_once_with(mock_runtime_config)
+            assert logging_setup._runtime_config is mock_runtime_config
+
+
+# ============================================================================
+# Tests: shutdown_logging
+# ============================================================================
+
+
+class TestShutdownLogging:
+    """shutdown_logging stops a running runtime and re-arms init_logging."""
+
+    @pytest.mark.os_agnostic
+    def test_shuts_down_running_runtime_and_clears_sentinel(self) -> None:
+        """When the runtime is live, it is shut down and the sentinel cleared."""
+        from check_zpools import logging_setup
+
+        with (
+            patch("check_zpools.logging_setup._runtime_config", MagicMock()),
+            patch("check_zpools.logging_setup.lib_log_rich.runtime.is_initialised", return_value=True),
+            patch("check_zpools.logging_setup.lib_log_rich.runtime.shutdown") as mock_shutdown,
+        ):
+            logging_setup.shutdown_logging()
+
+            mock_shutdown.assert_called_once_with()
+            assert logging_setup._runtime_config is None
+
+    @pytest.mark.os_agnostic
+    def test_skips_shutdown_when_init_logging_never_ran(self) -> None:
+        """When init_logging did not start the runtime, it is left alone."""
+        with (
+            patch("check_zpools.logging_setup._runtime_config", None),
+            patch("check_zpools.logging_setup.lib_log_rich.runtime.is_initialised", return_value=True) as mock_is_initialised,
+            patch("check_zpools.logging_setup.lib_log_rich.runtime.shutdown") as mock_shutdown,
+        ):
+            from check_zpools.logging_setup import shutdown_logging
+
+            shutdown_logging()
+
+            mock_is_initialised.assert_not_called()
+            mock_shutdown.assert_not_called()
+
 
 class TestInitLoggingEnablesDotenv:
     """init_logging loads .env files before initializing the runtime."""
@@ -150,6 +211,7 @@ class TestInitLoggingEnablesDotenv:
             call_order.append("init")
 
         with (
+            patch("check_zpools.logging_setup._runtime_config", None),
             patch("check_zpools.logging_setup.lib_log_rich.runtime.is_initialised", return_value=False),
             patch("check_zpools.logging_setup.lib_log_rich.config.enable_dotenv", side_effect=track_dotenv),
             patch("check_zpools.logging_setup._build_runtime_config", return_value=MagicMock()),
@@ -170,6 +232,7 @@ class TestInitLoggingAttachesStandardLogging:
     def test_attaches_std_logging_after_init(self) -> None:
         """attach_std_logging is called so domain code using stdlib logging works."""
         with (
+            patch("check_zpools.logging_setup._runtime_config", None),
             patch("check_zpools.logging_setup.lib_log_rich.runtime.is_initialised", return_value=False),
             patch("check_zpools.logging_setup.lib_log_rich.config.enable_dotenv"),
             patch("check_zpools.logging_setup._build_runtime_config", return_value=MagicMock()),
@@ -311,6 +311,29 @@ class TestSendEmail:
         call_kwargs = mock_btx_send.call_args.kwargs
         assert call_kwargs["attachment_file_paths"] == [attachment]
 
+    @patch("check_zpools.mail.btx_send")
+    def test_send_email_forwards_string_attachment_paths(self, mock_btx_send: MagicMock, tmp_path: Path) -> None:
+        """Should hand plain string attachment paths to btx_send unchanged."""
+        attachment = tmp_path / "test.txt"
+        attachment.write_text("Test attachment content")
+        attachments = (str(attachment),)
+        mock_btx_send.return_value = True
+
+        config = EmailConfig(
+            smtp_hosts=["smtp.test.com:587"],
+            from_address="sender@test.com",
+        )
+
+        send_email(
+            config=config,
+            recipients="recipient@test.com",
+            subject="Test Subject",
+            body="Test body",
+            attachments=attachments,
+        )
+
+        assert mock_btx_send.call_args.kwargs["attachment_file_paths"] is attachments
+
     def test_send_email_with_credentials(self, authenticating_smtp_sink: SmtpSink) -> None:
         """Should authenticate with the configured credentials before delivering."""
         config = _config_for(
@@ -111,6 +111,12 @@ class TestSeverityLevels:
         assert Severity.WARNING < Severity.CRITICAL
         assert Severity.CRITICAL > Severity.OK
 
+    @pytest.mark.os_agnostic
+    def test_ordering_follows_rank_not_string_value(self) -> None:
+        """Sorting uses the severity rank, not the alphabetical label."""
+        assert sorted([Severity.WARNING, Severity.CRITICAL, Severity.OK, Severity.INFO]) == list(Severity)
+        assert not Severity.INFO < Severity.OK  # although "INFO" < "OK" as strings
+
     @pytest.mark.os_agnostic
     def test_max_returns_highest_severity(self) -> None:
         """When finding the maximum of multiple severities,
@@ -194,6 +200,11 @@ class TestPoolStatusImmutability:
         with pytest.raises(AttributeError):
             pool.health = PoolHealth.DEGRADED  # type: ignore[misc]
 
+    @pytest.mark.os_agnostic
+    def test_pool_state_lives_in_slots(self) -> None:
+        """Pool snapshots carry no per-instance __dict__."""
+        assert not hasattr(a_healthy_pool_named("rpool"), "__dict__")
+
 
 class TestPoolStatusErrorDetection:
     """PoolStatus accurately reports whether it has I/O errors."""
@@ -281,6 +292,13 @@ class TestPoolIssueImmutability:
         with pytest.raises(AttributeError):
             issue.severity = Severity.CRITICAL  # type: ignore[misc]
 
+    @pytest.mark.os_agnostic
+    def test_issue_state_lives_in_slots(self) -> None:
+        """Issues carry no per-instance __dict__."""
+        issue = an_issue_for_pool("rpool", Severity.WARNING, IssueCategory.CAPACITY, "High usage")
+
+        assert not hasattr(issue, "__dict__")
+
 
 class TestPoolIssueStringRepresentation:
     """PoolIssue has a useful string representation for logging."""
@@ -349,6 +367,35 @@ class TestCheckResultImmutability:
             result.overall_severity = Severity.CRITICAL  # type: ignore[misc]
 
 
+class TestCheckResultTimestampFormats:
+    """CheckResult formats its timestamp once per result."""
+
+    @pytest.mark.os_agnostic
+    def test_iso_and_display_timestamps_match_the_timestamp(self) -> None:
+        """The ISO and display strings are derived from the timestamp."""
+        timestamp = datetime(2025, 1, 15, 10, 30, tzinfo=timezone.utc)
+        result = CheckResult(timestamp=timestamp, pools=[], issues=[], overall_severity=Severity.OK)
+
+        assert result.iso_timestamp == timestamp.isoformat()
+        assert result.display_timestamp == "2025-01-15 10:30:00"
+
+    @pytest.mark.os_agnostic
+    def test_display_timestamp_matches_strftime_layout(self) -> None:
+        """The display string equals the strftime rendering of the same layout."""
+        timestamp = datetime(2025, 3, 4, 5, 6, 7, 890123, tzinfo=timezone.utc)
+        result = CheckResult(timestamp=timestamp, pools=[], issues=[], overall_severity=Severity.OK)
+
+        assert result.display_timestamp == timestamp.strftime("%Y-%m-%d %H:%M:%S")
+
+    @pytest.mark.os_agnostic
+    def test_repeated_reads_return_the_cached_string(self) -> None:
+        """A second read returns the same string object."""
+        result = CheckResult(timestamp=datetime.now(timezone.utc), pools=[], issues=[], overall_severity=Severity.OK)
+
+        assert result.display_timestamp is result.display_timestamp
+        assert result.iso_timestamp is result.iso_timestamp
+
+
 class TestCheckResultIssueQueries:
     """CheckResult provides convenient queries for issues."""
 
@@ -13,7 +13,9 @@ They validate the monitoring rules work correctly on all platforms.
 
 from __future__ import annotations
 
+import logging
 from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
 import pytest
 
@@ -108,6 +110,15 @@ class TestMonitorConfigCustomization:
 
         assert config.scrub_max_age_days == 14
 
+    @pytest.mark.os_agnostic
+    def test_thresholds_cannot_be_changed_after_creation(self) -> None:
+        """A config is validated once in __post_init__,
+        so its thresholds are locked afterwards."""
+        config = MonitorConfig()
+
+        with pytest.raises(AttributeError):
+            config.capacity_warning_percent = 95  # type: ignore[misc]
+
 
 class TestMonitorConfigValidation:
     """Monitor configuration rejects invalid threshold combinations."""
@@ -202,6 +213,22 @@ class TestHealthStateMonitoring:
         assert len(health_issues) == 1
         assert health_issues[0].severity == Severity.CRITICAL
 
+    @pytest.mark.os_agnostic
+    @pytest.mark.parametrize("health", list(PoolHealth))
+    def test_every_health_state_agrees_with_its_predicates(self, health: PoolHealth) -> None:
+        """Each health state maps to the severity its PoolHealth predicates imply."""
+        pool = a_pool_with(health=health)
+        monitor = a_monitor_with_default_thresholds()
+
+        issues = monitor.check_pool(pool)
+        health_issues = [i for i in issues if i.category == IssueCategory.HEALTH]
+
+        if health.is_healthy():
+            assert health_issues == []
+        else:
+            expected = Severity.CRITICAL if health.is_critical() else Severity.WARNING
+            assert [i.severity for i in health_issues] == [expected]
+
 
 # ============================================================================
 # Tests: Capacity Threshold Monitoring
@@ -327,6 +354,20 @@ class TestCapacityAtCriticalThreshold:
         assert len(capacity_issues) == 1
         assert capacity_issues[0].severity == Severity.CRITICAL
 
+    @pytest.mark.os_agnostic
+    def test_capacity_messages_name_the_crossed_threshold(self) -> None:
+        """When capacity crosses a threshold,
+        the message states the capacity and that threshold."""
+        monitor = a_monitor_with_default_thresholds()
+
+        critical = [i for i in monitor.check_pool(a_pool_with(capacity_percent=92.25)) if i.category == IssueCategory.CAPACITY]
+        warning = [i for i in monitor.check_pool(a_pool_with(capacity_percent=81.0)) if i.category == IssueCategory.CAPACITY]
+
+        assert critical[0].message == "Pool at 92.2% capacity (critical threshold: 90%)"
+        assert critical[0].details.threshold == 90
+        assert warning[0].message == "Pool at 81.0% capacity (warning threshold: 80%)"
+        assert warning[0].details.threshold == 80
+
 
 # ============================================================================
 # Tests: I/O Error Monitoring
@@ -485,6 +526,26 @@ class TestScrubStatusMonitoring:
 
         assert len(scrub_issues) == 0
 
+    @pytest.mark.os_agnostic
+    @pytest.mark.parametrize(("age_days", "expected_calls"), [(1, 0), (45, 1)])
+    def test_scrub_timestamp_is_formatted_only_for_a_scrub_issue(self, age_days: int, expected_calls: int) -> None:
+        """The last scrub is rendered to ISO text only when an issue reports it."""
+        calls: list[str] = []
+
+        class CountingDatetime(datetime):
+            def isoformat(self, sep: str = "T", timespec: str = "auto") -> str:
+                calls.append("isoformat")
+                return super().isoformat(sep, timespec)
+
+        scrubbed = datetime.now(timezone.utc) - timedelta(days=age_days)
+        last_scrub = CountingDatetime.fromtimestamp(scrubbed.timestamp(), tz=timezone.utc)
+        # High capacity keeps the pool off the clean fast path so _check_scrub runs
+        pool = a_pool_with(capacity_percent=85.0, last_scrub=last_scrub)
+
+        a_monitor_with_default_thresholds().check_pool(pool)
+
+        assert len(calls) == expected_calls
+
 
 # ============================================================================
 # Tests: Aggregate Monitoring (Multiple Pools)
@@ -533,6 +594,31 @@ class TestAggregateMonitoring:
 
         assert result.overall_severity == Severity.CRITICAL
 
+    @pytest.mark.os_agnostic
+    def test_clock_is_read_once_per_pass(self) -> None:
+        """When monitoring several pools,
+        the current time is read once and reused as the result timestamp."""
+        recent = datetime.now(timezone.utc) - timedelta(days=1)
+        pools = {f"pool{index}": a_pool_with(name=f"pool{index}", last_scrub=recent) for index in range(4)}
+        monitor = a_monitor_with_default_thresholds()
+
+        with patch("check_zpools.monitor.datetime", wraps=datetime) as mock_datetime:
+            result = monitor.check_all_pools(pools)
+
+        assert mock_datetime.now.call_count == 1
+        assert result.overall_severity == Severity.OK
+
+    @pytest.mark.os_agnostic
+    def test_scrub_age_is_measured_against_the_given_time(self) -> None:
+        """When check_pool receives a reference time,
+        the scrub age is computed from it."""
+        pool = a_pool_with(last_scrub=datetime(2025, 1, 1, tzinfo=timezone.utc))
+        monitor = a_monitor_with_default_thresholds()
+
+        issues = monitor.check_pool(pool, now=datetime(2025, 3, 2, tzinfo=timezone.utc))
+
+        assert [issue.details.age_days for issue in issues] == [60]
+
     @pytest.mark.os_agnostic
     def test_all_healthy_pools_result_in_ok_severity(self) -> None:
         """When all pools are healthy with no issues,
@@ -548,6 +634,104 @@ class TestAggregateMonitoring:
         assert result.overall_severity == Severity.OK
         assert len(result.issues) == 0
 
+    @pytest.mark.os_agnostic
+    def test_a_plain_sequence_of_pools_is_accepted(self) -> None:
+        """When pools are passed as a list rather than a name mapping,
+        they are checked and reported in the given order."""
+        pools = [
+            a_pool_with(name="tank", capacity_percent=85.0),
+            a_healthy_pool_named("rpool"),
+        ]
+        monitor = a_monitor_with_default_thresholds()
+
+        result = monitor.check_all_pools(pools)
+
+        assert [pool.name for pool in result.pools] == ["tank", "rpool"]
+        assert result.overall_severity == Severity.WARNING
+
+    @pytest.mark.os_agnostic
+    def test_a_one_shot_iterator_of_pools_is_consumed_once(self) -> None:
+        """When pools arrive from a generator,
+        every pool is still both checked and listed in the result."""
+        monitor = a_monitor_with_default_thresholds()
+
+        result = monitor.check_all_pools(a_healthy_pool_named(name) for name in ("a", "b"))
+
+        assert [pool.name for pool in result.pools] == ["a", "b"]
+
+
+class TestCleanPoolFastPath:
+    """Clean pools are settled without running the individual checks."""
+
+    @pytest.mark.os_agnostic
+    def test_clean_pool_skips_individual_checks(self) -> None:
+        """When a pool is healthy, below thresholds and recently scrubbed,
+        no individual check runs and no issue is reported."""
+        pool = a_pool_with(capacity_percent=10.0, last_scrub=datetime.now(timezone.utc) - timedelta(days=1))
+        monitor = a_monitor_with_default_thresholds()
+
+        with patch.object(PoolMonitor, "_check_health") as mock_health:
+            issues = monitor.check_pool(pool)
+
+        assert issues == []
+        mock_health.assert_not_called()
+
+    @pytest.mark.os_agnostic
+    def test_stale_scrub_still_reaches_the_scrub_check(self) -> None:
+        """When an otherwise clean pool has an old scrub,
+        the full checks run and report it."""
+        pool = a_pool_with(capacity_percent=10.0, last_scrub=datetime.now(timezone.utc) - timedelta(days=45))
+        monitor = a_monitor_with_default_thresholds()
+
+        issues = monitor.check_pool(pool)
+
+        assert [issue.category for issue in issues] == [IssueCategory.SCRUB]
+
+
+class TestPerPoolDebugLogging:
+    """The per-pool completion record is only built when debug logging is on."""
+
+    @pytest.mark.os_agnostic
+    def test_debug_level_records_issue_count(self, caplog: pytest.LogCaptureFixture) -> None:
+        """When debug logging is enabled,
+        each pool logs its completion with the issue count."""
+        caplog.set_level(logging.DEBUG, logger="check_zpools.monitor")
+        monitor = a_monitor_with_default_thresholds()
+
+        issues = monitor.check_pool(a_pool_with(name="tank", capacity_percent=85.0))
+
+        records = [record for record in caplog.records if record.getMessage() == "Pool check complete: tank"]
+        assert len(records) == 1
+        assert records[0].__dict__["issues_found"] == len(issues)
+
+    @pytest.mark.os_agnostic
+    def test_check_all_pools_records_each_pools_own_issue_count(self, caplog: pytest.LogCaptureFixture) -> None:
+        """When several pools are checked in one pass,
+        each completion record counts only that pool's issues."""
+        caplog.set_level(logging.DEBUG, logger="check_zpools.monitor")
+        recent = datetime.now(timezone.utc) - timedelta(days=1)
+        pools = {
+            "clean": a_pool_with(name="clean", last_scrub=recent),
+            "busy": a_pool_with(name="busy", capacity_percent=95.0, read_errors=2, last_scrub=recent),
+        }
+        monitor = a_monitor_with_default_thresholds()
+
+        monitor.check_all_pools(pools)
+
+        counts = {record.__dict__["pool_name"]: record.__dict__["issues_found"] for record in caplog.records if "pool_name" in record.__dict__}
+        assert counts == {"clean": 0, "busy": 2}
+
+    @pytest.mark.os_agnostic
+    def test_info_level_skips_completion_record(self, caplog: pytest.LogCaptureFixture) -> None:
+        """When debug logging is disabled,
+        no per-pool completion record is emitted."""
+        caplog.set_level(logging.INFO, logger="check_zpools.monitor")
+        monitor = a_monitor_with_default_thresholds()
+
+        monitor.check_pool(a_healthy_pool_named("tank"))
+
+        assert not any(record.getMessage().startswith("Pool check complete") for record in caplog.records)
+
 
 # ============================================================================
 # Edge Case Tests - Maximum Coverage
@@ -614,6 +798,27 @@ class TestScrubEdgeCases:
 
         assert len(scrub_issues) == 0
 
+    @pytest.mark.os_agnostic
+    @pytest.mark.parametrize(
+        ("scrub_age", "expected_age_days"),
+        [
+            (timedelta(days=30, hours=23, minutes=59, seconds=59), []),
+            (timedelta(days=31), [31]),
+        ],
+    )
+    def test_stale_scrub_boundary_matches_whole_day_age(self, scrub_age: timedelta, expected_age_days: list[int]) -> None:
+        """A scrub is stale once its whole-day age exceeds the max age,
+        on both the clean fast path and the full check path."""
+        now = datetime(2025, 3, 2, 12, tzinfo=timezone.utc)
+        monitor = a_monitor_with_default_thresholds()
+
+        for capacity in (50.0, 85.0):
+            pool = a_pool_with(capacity_percent=capacity, last_scrub=now - scrub_age)
+
+            issues = monitor.check_pool(pool, now=now)
+
+            assert [i.details.age_days for i in issues if i.category == IssueCategory.SCRUB] == expected_age_days
+
 
 class TestCustomThresholds:
     """Custom thresholds are respected by monitoring logic."""
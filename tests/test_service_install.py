@@ -0,0 +1,341 @@
+"""Tests for systemd service installation helpers.
+
+Tests cover:
+- Installation method detection from sys.argv
+- PATH lookups for executables
+- systemctl calls made to enable/start and stop/disable the service
+- Root privilege checks
+- Systemd unit file generation and installation
+- Service directory creation
+
+All tests mock external dependencies (psutil, systemctl, file I/O).
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from check_zpools.service_install import (
+    SERVICE_NAME,
+    _check_root_privileges,
+    _create_service_directories,
+    _enable_and_start_service,
+    _find_executable,
+    _generate_service_file_content,
+    _install_service_file,
+    _stop_and_disable_service,
+    _systemctl_argv,
+    _which,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+
+@pytest.fixture(autouse=True)
+def fresh_which_cache() -> Iterator[None]:
+    """Start and finish every test with an empty PATH lookup cache."""
+    _which.cache_clear()
+    yield
+    _which.cache_clear()
+
+
+# ============================================================================
+# Tests for _find_executable
+# ============================================================================
+
+
+class TestFindExecutableForDirectInstalls:
+    """Without uvx, the running command or PATH provides the executable."""
+
+    def test_existing_argv0_is_resolved(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The command that was run is used when it exists on disk."""
+        script = tmp_path / "check_zpools"
+        script.touch()
+        monkeypatch.setattr("check_zpools.service_install.sys.argv", [str(script)])
+
+        with patch("check_zpools.service_install._detect_uvx_from_process_tree", return_value=(None, None)):
+            assert _find_executable() == ("direct", script.resolve(), None)
+
+    def test_missing_argv0_falls_back_to_path(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """When the command is not a file, the PATH lookup is used."""
+        on_path = tmp_path / "bin" / "check_zpools"
+        monkeypatch.setattr("check_zpools.service_install.sys.argv", ["check_zpools"])
+        monkeypatch.chdir(tmp_path)
+
+        with (
+            patch("check_zpools.service_install._detect_uvx_from_process_tree", return_value=(None, None)),
+            patch("check_zpools.service_install._which", return_value=str(on_path)),
+        ):
+            assert _find_executable() == ("direct", on_path.resolve(), None)
+
+
+# ============================================================================
+# Tests for _which
+# ============================================================================
+
+
+class TestWhichResolvesEachNameOnce:
+    """Executables are looked up on PATH once per name."""
+
+    def test_repeated_lookup_scans_path_once(self) -> None:
+        """A second lookup for the same name reuses the first result."""
+        with patch("check_zpools.service_install.shutil.which", return_value="/usr/bin/check_zpools") as mock_which:
+            first = _which("check_zpools")
+            second = _which("check_zpools")
+
+        assert first == second == "/usr/bin/check_zpools"
+        mock_which.assert_called_once_with("check_zpools")
+
+    def test_different_names_are_looked_up_separately(self) -> None:
+        """Each executable name gets its own PATH lookup."""
+        with patch("check_zpools.service_install.shutil.which", return_value=None) as mock_which:
+            _which("uv")
+            _which("uvx")
+
+        assert mock_which.call_count == 2
+
+
+class TestSystemctlArgvUsesTheResolvedBinary:
+    """systemctl is spawned by absolute path once it has been found on PATH."""
+
+    def test_resolved_path_leads_the_argv(self) -> None:
+        """The PATH lookup result replaces the bare command name."""
+        with patch("check_zpools.service_install.shutil.which", return_value="/usr/bin/systemctl") as mock_which:
+            first = _systemctl_argv(["daemon-reload"])
+            second = _systemctl_argv(["is-active", SERVICE_NAME])
+
+        assert first == ["/usr/bin/systemctl", "daemon-reload"]
+        assert second == ["/usr/bin/systemctl", "is-active", SERVICE_NAME]
+        mock_which.assert_called_once_with("systemctl")
+
+    def test_missing_binary_keeps_the_bare_name(self) -> None:
+        """Without systemctl on PATH, the spawn fails exactly as before."""
+        with patch("check_zpools.service_install.shutil.which", return_value=None):
+            assert _systemctl_argv(["daemon-reload"]) == ["systemctl", "daemon-reload"]
+
+
+# ============================================================================
+# Tests for systemctl batching
+# ============================================================================
+
+
+def _systemctl_calls_for(action: Callable[..., None], **flags: bool) -> list[list[str]]:
+    """Run a service action with systemctl mocked and return its argument lists."""
+    succeeded = subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
+    with patch("check_zpools.service_install._run_systemctl", return_value=succeeded) as mock_systemctl:
+        action(**flags)
+    return [call.args[0] for call in mock_systemctl.call_args_list]
+
+
+class TestEnableAndStartServiceUsesOneSystemctlCall:
+    """Enabling and starting share a single systemctl invocation."""
+
+    @pytest.mark.parametrize(
+        ("enable", "start", "expected"),
+        [
+            (True, True, [["enable", "--now", SERVICE_NAME]]),
+            (True, False, [["enable", SERVICE_NAME]]),
+            (False, True, [["start", SERVICE_NAME]]),
+            (False, False, []),
+        ],
+    )
+    def test_requested_actions_map_to_systemctl_calls(self, enable: bool, start: bool, expected: list[list[str]]) -> None:
+        """Each combination of flags issues the minimal systemctl commands."""
+        assert _systemctl_calls_for(_enable_and_start_service, enable=enable, start=start) == expected
+
+
+class TestStopAndDisableServiceUsesOneSystemctlCall:
+    """Stopping and disabling share a single systemctl invocation."""
+
+    @pytest.mark.parametrize(
+        ("stop", "disable", "expected"),
+        [
+            (True, True, [["disable", "--now", SERVICE_NAME]]),
+            (True, False, [["stop", SERVICE_NAME]]),
+            (False, True, [["disable", SERVICE_NAME]]),
+            (False, False, []),
+        ],
+    )
+    def test_requested_actions_map_to_systemctl_calls(self, stop: bool, disable: bool, expected: list[list[str]]) -> None:
+        """Each combination of flags issues the minimal systemctl commands."""
+        assert _systemctl_calls_for(_stop_and_disable_service, stop=stop, disable=disable) == expected
+
+    def test_failed_combined_call_still_stops_the_service(self) -> None:
+        """When disable --now fails, a separate stop keeps the daemon from running on."""
+        failed = subprocess.CompletedProcess(args=[], returncode=1, stdout="", stderr="boom")
+        succeeded = subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
+        with patch("check_zpools.service_install._run_systemctl", side_effect=[failed, succeeded]) as mock_systemctl:
+            _stop_and_disable_service(stop=True, disable=True)
+
+        assert [call.args[0] for call in mock_systemctl.call_args_list] == [
+            ["disable", "--now", SERVICE_NAME],
+            ["stop", SERVICE_NAME],
+        ]
+
+
+# ============================================================================
+# Tests for _check_root_privileges
+# ============================================================================
+
+
+class TestCheckRootPrivileges:
+    """Service management is refused on Windows and for non-root users."""
+
+    def test_windows_is_rejected_before_the_uid_check(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """On Windows the platform is reported, not missing privileges."""
+        monkeypatch.setattr("check_zpools.service_install.sys.platform", "win32")
+
+        with pytest.raises(NotImplementedError, match="not supported on Windows"):
+            _check_root_privileges()
+
+    @pytest.mark.skipif(not hasattr(os, "geteuid"), reason="requires POSIX effective uid")
+    def test_non_root_user_is_rejected(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A non-zero effective uid raises PermissionError."""
+        monkeypatch.setattr("check_zpools.service_install.os.geteuid", lambda: 1000)
+
+        with pytest.raises(PermissionError, match="must be run as root"):
+            _check_root_privileges()
+
+    @pytest.mark.skipif(not hasattr(os, "geteuid"), reason="requires POSIX effective uid")
+    def test_root_user_passes(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Effective uid 0 passes the check."""
+        monkeypatch.setattr("check_zpools.service_install.os.geteuid", lambda: 0)
+
+        _check_root_privileges()
+
+
+# ============================================================================
+# Tests for _generate_service_file_content
+# ============================================================================
+
+
+class TestGenerateServiceFileContent:
+    """The unit file is filled in for each installation method."""
+
+    def test_direct_install_runs_the_executable(self) -> None:
+        """A direct install starts the daemon from the executable path."""
+        content = _generate_service_file_content(Path("/usr/local/bin/check_zpools"), "direct")
+
+        assert "ExecStart=/usr/local/bin/check_zpools daemon --foreground\n" in content
+        assert "ReadWritePaths=/var/cache/check_zpools /var/lib/check_zpools\n" in content
+
+    def test_uvx_install_pins_the_version_and_uv_cache(self) -> None:
+        """A uvx install passes the package spec and may write to the uv cache."""
+        content = _generate_service_file_content(Path("/usr/bin/uvx"), "uvx", "@2.0.4")
+
+        assert "# Installation method: uvx\n" in content
+        assert "ExecStart=/usr/bin/uvx check_zpools@2.0.4 daemon --foreground\n" in content
+        assert "ReadWritePaths=/var/cache/check_zpools /var/lib/check_zpools /root/.cache/uv\n" in content
+
+    def test_log_format_placeholders_stay_literal(self) -> None:
+        """Braces meant for the log format template are not substituted."""
+        content = _generate_service_file_content(Path("/usr/bin/check_zpools"), "direct")
+
+        assert '={timestamp} {LEVEL:>8} {logger_name} - {message} {context_fields}"' in content
+        assert "{level_icon}" in content
+
+
+# ============================================================================
+# Tests for _create_service_directories
+# ============================================================================
+
+
+class TestCreateServiceDirectories:
+    """Cache and state directories are created once and then left alone."""
+
+    def test_missing_directories_are_created(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Both directories, including missing parents, are created."""
+        cache_dir = tmp_path / "var" / "cache" / "check_zpools"
+        lib_dir = tmp_path / "var" / "lib" / "check_zpools"
+        monkeypatch.setattr("check_zpools.service_install.CACHE_DIR", cache_dir)
+        monkeypatch.setattr("check_zpools.service_install.LIB_DIR", lib_dir)
+
+        _create_service_directories()
+
+        assert cache_dir.is_dir()
+        assert lib_dir.is_dir()
+
+    def test_existing_directories_are_kept(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A repeated install leaves existing directories and their contents intact."""
+        cache_dir = tmp_path / "cache"
+        lib_dir = tmp_path / "lib"
+        lib_dir.mkdir()
+        (lib_dir / "alert_state.json").write_text("{}", encoding="utf-8")
+        monkeypatch.setattr("check_zpools.service_install.CACHE_DIR", cache_dir)
+        monkeypatch.setattr("check_zpools.service_install.LIB_DIR", lib_dir)
+
+        _create_service_directories()
+        _create_service_directories()
+
+        assert cache_dir.is_dir()
+        assert (lib_dir / "alert_state.json").read_text(encoding="utf-8") == "{}"
+
+
+# ============================================================================
+# Tests for _install_service_file
+# ============================================================================
+
+
+@pytest.mark.skipif(not hasattr(os, "fchmod"), reason="requires POSIX file modes")
+class TestInstallServiceFile:
+    """The unit file is written with world-readable 0644 permissions."""
+
+    def test_new_file_gets_mode_0644_despite_restrictive_umask(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A umask of 077 does not make the unit file unreadable for systemd tools."""
+        service_file = tmp_path / "check_zpools.service"
+        monkeypatch.setattr("check_zpools.service_install.SERVICE_FILE_PATH", service_file)
+        previous_umask = os.umask(0o077)
+        try:
+            _install_service_file(Path("/usr/bin/check_zpools"), "direct")
+        finally:
+            os.umask(previous_umask)
+
+        assert service_file.stat().st_mode & 0o777 == 0o644
+        assert "ExecStart=/usr/bin/check_zpools daemon --foreground" in service_file.read_text(encoding="utf-8")
+
+    def test_existing_file_is_replaced_entirely(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A longer previous unit file leaves no trailing bytes behind."""
+        service_file = tmp_path / "check_zpools.service"
+        service_file.write_text("stale\n" * 1000, encoding="utf-8")
+        service_file.chmod(0o600)
+        monkeypatch.setattr("check_zpools.service_install.SERVICE_FILE_PATH", service_file)
+
+        _install_service_file(Path("/usr/bin/check_zpools"), "direct")
+
+        content = service_file.read_text(encoding="utf-8")
+        assert content == _generate_service_file_content(Path("/usr/bin/check_zpools"), "direct")
+        assert service_file.stat().st_mode & 0o777 == 0o644
+
+    def test_previous_unit_is_replaced_atomically(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The old unit stays in place until the new one is complete, and no temp file remains."""
+        service_file = tmp_path / "check_zpools.service"
+        service_file.write_text("previous unit\n", encoding="utf-8")
+        old_inode = service_file.stat().st_ino
+        monkeypatch.setattr("check_zpools.service_install.SERVICE_FILE_PATH", service_file)
+
+        _install_service_file(Path("/usr/bin/check_zpools"), "direct")
+
+        assert service_file.stat().st_ino != old_inode
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["check_zpools.service"]
+
+    def test_failed_write_keeps_the_previous_unit(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """If writing the new unit fails, the old unit is untouched and the temp file is removed."""
+        service_file = tmp_path / "check_zpools.service"
+        service_file.write_text("previous unit\n", encoding="utf-8")
+        monkeypatch.setattr("check_zpools.service_install.SERVICE_FILE_PATH", service_file)
+
+        with (
+            patch("check_zpools.service_install.os.fchmod", side_effect=OSError("disk full")),
+            pytest.raises(OSError, match="disk full"),
+        ):
+            _install_service_file(Path("/usr/bin/check_zpools"), "direct")
+
+        assert service_file.read_text(encoding="utf-8") == "previous unit\n"
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["check_zpools.service"]
@@ -5,6 +5,7 @@ Tests cover:
 - Alert state loading from JSON files
 - Pool status summary generation
 - Service start time parsing from systemctl output
+- Service state queries against systemctl
 
 All tests mock external dependencies (systemctl, ZFS commands, file I/O).
 """
@@ -413,6 +414,141 @@ class TestGetPoolStatusSummaryWithErrors:
         assert "Error" in issues[0]
 
 
+# ============================================================================
+# Tests for get_service_status
+# ============================================================================
+
+
+class _FakeSystemctl:
+    """Record the systemctl actions run and answer them with fixed results."""
+
+    def __init__(self, returncodes: dict[str, int], status_text: str = "") -> None:
+        self.returncodes = returncodes
+        self.status_text = status_text
+        self.actions: list[str] = []
+
+    def run(self, command: list[str], *, check: bool = True) -> MagicMock:
+        action = command[0]
+        self.actions.append(action)
+        result = MagicMock()
+        result.returncode = self.returncodes.get(action, 0)
+        result.stdout = self.status_text if action == "status" else ""
+        return result
+
+
+class TestGetServiceStatusFetchesTextOnlyOnRequest:
+    """The journal-reading systemctl status query is opt-in."""
+
+    def test_default_call_runs_only_is_active(self, tmp_path: Path) -> None:
+        """Without include_text, only is-active runs and the text stays empty."""
+        from check_zpools.service_install import get_service_status
+
+        service_file = tmp_path / "check_zpools.service"
+        service_file.touch()
+        fake = _FakeSystemctl({"is-active": 0, "is-enabled": 1}, status_text="● check_zpools.service")
+
+        with (
+            patch("check_zpools.service_install.SERVICE_FILE_PATH", service_file),
+            patch("check_zpools.service_install.SERVICE_WANTS_LINKS", ()),
+            patch("check_zpools.service_install._run_systemctl", side_effect=fake.run),
+        ):
+            status = get_service_status()
+
+        assert fake.actions == ["is-enabled", "is-active"]
+        assert status == {"installed": True, "running": True, "enabled": False, "status_text": ""}
+
+    def test_include_text_adds_the_status_output(self, tmp_path: Path) -> None:
+        """With include_text, the systemctl status output is returned too."""
+        from check_zpools.service_install import get_service_status
+
+        service_file = tmp_path / "check_zpools.service"
+        service_file.touch()
+        fake = _FakeSystemctl({"is-active": 0, "is-enabled": 1}, status_text="● check_zpools.service")
+
+        with (
+            patch("check_zpools.service_install.SERVICE_FILE_PATH", service_file),
+            patch("check_zpools.service_install.SERVICE_WANTS_LINKS", ()),
+            patch("check_zpools.service_install._run_systemctl", side_effect=fake.run),
+        ):
+            status = get_service_status(include_text=True)
+
+        assert fake.actions == ["is-enabled", "is-active", "status"]
+        assert status["status_text"] == "● check_zpools.service"
+
+    def test_missing_service_file_runs_no_queries(self, tmp_path: Path) -> None:
+        """Without a service file, systemctl is not asked at all."""
+        from check_zpools.service_install import get_service_status
+
+        with (
+            patch("check_zpools.service_install.SERVICE_FILE_PATH", tmp_path / "absent.service"),
+            patch("check_zpools.service_install._run_systemctl") as mock_systemctl,
+        ):
+            status = get_service_status()
+
+        assert status["installed"] is False
+        mock_systemctl.assert_not_called()
+
+
+class TestGetServiceStatusReadsEnablementFromTheWantsLinks:
+    """Enablement comes from the wants symlinks, with systemctl as fallback."""
+
+    @staticmethod
+    def _status_with_links(tmp_path: Path, linked: list[str], fake: _FakeSystemctl) -> dict[str, bool | str]:
+        """Run get_service_status with /etc- and /run-style wants links under tmp_path."""
+        from check_zpools.service_install import get_service_status
+
+        service_file = tmp_path / "check_zpools.service"
+        service_file.touch()
+        links = tuple(tmp_path / root / "multi-user.target.wants" / "check_zpools.service" for root in ("etc", "run"))
+        for link in links:
+            if link.parts[-3] in linked:
+                link.parent.mkdir(parents=True)
+                link.symlink_to(service_file)
+
+        with (
+            patch("check_zpools.service_install.SERVICE_FILE_PATH", service_file),
+            patch("check_zpools.service_install.SERVICE_WANTS_LINKS", links),
+            patch("check_zpools.service_install._run_systemctl", side_effect=fake.run),
+        ):
+            return get_service_status()
+
+    def test_persistent_wants_symlink_means_enabled(self, tmp_path: Path) -> None:
+        """A symlink in /etc's multi-user.target.wants marks the service enabled."""
+        fake = _FakeSystemctl({"is-active": 3})
+
+        status = self._status_with_links(tmp_path, ["etc"], fake)
+
+        assert status["enabled"] is True
+        assert status["running"] is False
+        assert "is-enabled" not in fake.actions
+
+    def test_runtime_wants_symlink_means_enabled(self, tmp_path: Path) -> None:
+        """A unit enabled with --runtime (link under /run) is reported enabled."""
+        fake = _FakeSystemctl({"is-active": 0})
+
+        status = self._status_with_links(tmp_path, ["run"], fake)
+
+        assert status["enabled"] is True
+        assert "is-enabled" not in fake.actions
+
+    def test_missing_links_defer_to_systemctl(self, tmp_path: Path) -> None:
+        """Without a wants link, systemctl is-enabled decides (aliases, other targets, overrides)."""
+        fake = _FakeSystemctl({"is-active": 0, "is-enabled": 0})
+
+        status = self._status_with_links(tmp_path, [], fake)
+
+        assert status["enabled"] is True
+        assert fake.actions == ["is-enabled", "is-active"]
+
+    def test_disabled_service_is_reported_disabled(self, tmp_path: Path) -> None:
+        """No wants link and a failing is-enabled mean disabled."""
+        fake = _FakeSystemctl({"is-active": 0, "is-enabled": 1})
+
+        status = self._status_with_links(tmp_path, [], fake)
+
+        assert status["enabled"] is False
+
+
 # ============================================================================
 # Tests for show_service_status output
 # ============================================================================